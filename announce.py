@@ -7,6 +7,16 @@ import os
 from aiogram.enums import ParseMode
 from dotenv import load_dotenv
 
+from api.telegram.outbound import TelegramOutboundQueue, BROADCAST_PRIORITY
+from config.constants import (
+    TELEGRAM_GLOBAL_RATE_LIMIT,
+    TELEGRAM_CHAT_INTERVAL,
+    TELEGRAM_GROUP_CHAT_INTERVAL,
+    TELEGRAM_MAX_CHAT_INTERVAL,
+    ANNOUNCEMENT_MAX_PENDING,
+)
+from utils.common.rate_limit_common_utils import ChatRateLimiter
+
 # Load environment variables
 load_dotenv()
 
@@ -124,6 +134,13 @@ DEFAULT_LANGUAGE = "en"
 async def send_announcements():
     # Create bot instance
     bot = Bot(token=BOT_TOKEN)
+    # Broadcasts share the limits (and RetryAfter handling) of the bot's outbound queue
+    outbound_queue = TelegramOutboundQueue(bot, ChatRateLimiter(
+        global_rate=TELEGRAM_GLOBAL_RATE_LIMIT,
+        chat_interval=TELEGRAM_CHAT_INTERVAL,
+        group_chat_interval=TELEGRAM_GROUP_CHAT_INTERVAL,
+        max_chat_interval=TELEGRAM_MAX_CHAT_INTERVAL,
+    ))
 
     try:
         # Connect to database
@@ -147,26 +164,22 @@ async def send_announcements():
         success_count = 0
         failed_count = 0
 
-        for user in users:
-            telegram_id = user['telegram_id']
-            language = user['language'] if user['language'] in ANNOUNCEMENTS else DEFAULT_LANGUAGE
-
+        async def send_announcement(telegram_id: int, language: str) -> None:
+            nonlocal success_count, failed_count
             try:
                 # Get the appropriate announcement for the user's language
                 announcement = ANNOUNCEMENTS[language]
 
-                # Send the message
-                await bot.send_message(
-                    chat_id=telegram_id,
-                    text=announcement,
+                # The queue paces the messages to the global rate limit
+                await outbound_queue.send_message(
+                    telegram_id,
+                    announcement,
+                    priority=BROADCAST_PRIORITY,
                     parse_mode=ParseMode.MARKDOWN
                 )
 
                 success_count += 1
 
-                # Add delay to avoid hitting rate limits
-                await asyncio.sleep(0.05)
-
                 # Log progress for every 100 users
                 if success_count % 100 == 0:
                     logger.info(f"Progress: {success_count}/{len(users)} messages sent")
@@ -175,6 +188,19 @@ async def send_announcements():
                 logger.error(f"Failed to send message to user {telegram_id}: {e}")
                 failed_count += 1
 
+        # A fixed number of senders take the next user when their message is sent, so the queue
+        # holds at most ANNOUNCEMENT_MAX_PENDING messages however many users there are
+        user_iterator = iter(users)
+
+        async def send_announcements_to_next_users() -> None:
+            for user in user_iterator:
+                await send_announcement(
+                    user['telegram_id'],
+                    user['language'] if user['language'] in ANNOUNCEMENTS else DEFAULT_LANGUAGE
+                )
+
+        await asyncio.gather(*(send_announcements_to_next_users() for _ in range(ANNOUNCEMENT_MAX_PENDING)))
+
         logger.info(f"Announcement sending completed. Successful: {success_count}, Failed: {failed_count}")
 
     except Exception as e:
@@ -185,7 +211,8 @@ async def send_announcements():
             await conn.close()
             logger.info("Database connection closed")
 
-        # Close bot session
+        # Stop the outbound queue and close bot session
+        await outbound_queue.close()
         await bot.session.close()
         logger.info("Bot session closed")
 
@@ -1,18 +1,16 @@
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+
+from api.openai.client import SharedOpenAIClient
 
 
 class OpenAIAPIBase:
-    def __init__(self, api_key: str, base_url: str):
-        self.api_key: str = api_key
-        self.base_url: str = base_url
-        self.client: OpenAI = OpenAI(api_key=self.api_key, base_url=self.base_url)
+    def __init__(self, client: SharedOpenAIClient):
+        self.shared_client: SharedOpenAIClient = client
+        self.client: OpenAI = client.client
+        self.async_client: AsyncOpenAI = client.async_client
 
     def request(self, endpoint: str, **kwargs):
-        if endpoint == "text":
-            return self.client.chat.completions.create(**kwargs)
-        elif endpoint == "audio":
-            return self.client.audio.transcriptions.create(**kwargs)
-        elif endpoint == "image":
-            pass
-        else:
-            raise ValueError("Invalid endpoint.")
+        return self.shared_client.request(endpoint, **kwargs)
+
+    async def async_request(self, endpoint: str, **kwargs):
+        return await self.shared_client.async_request(endpoint, **kwargs)
@@ -0,0 +1,123 @@
+import asyncio
+import importlib.util
+
+import httpx
+from openai import OpenAI, AsyncOpenAI
+
+
+class EndpointLimit:
+    """
+    Concurrency and timeout of the requests to one OpenAI endpoint.
+    """
+
+    def __init__(self, concurrency: int, timeout: float):
+        """
+        :param concurrency: Requests to the endpoint in flight at the same time.
+        :type concurrency: int
+        :param timeout: Seconds a request may wait for data before it fails.
+        :type timeout: float
+        """
+        self.concurrency: int = concurrency
+        self.timeout: float = timeout
+
+
+class SharedOpenAIClient:
+    """
+    One pair of OpenAI clients shared by every processor, on tuned keep-alive connection pools.
+
+    Requests of all processors reuse the same connections (HTTP/2 when the ``h2`` package is
+    installed, so many requests share one connection), instead of every processor opening and
+    handshaking its own. Each endpoint has its own concurrency limit and timeout, so e.g. slow
+    transcriptions cannot take all connections from chat completions.
+
+    The limits apply to async requests. A streamed response releases its slot once the response
+    has started; the connection pool still bounds how many streams are open. The synchronous
+    client is meant for Celery tasks and only shares the pool settings and timeouts.
+    """
+
+    def __init__(self,
+                 api_key: str,
+                 base_url: str | None,
+                 endpoint_limits: dict[str, EndpointLimit],
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 keepalive_expiry: float = 30,
+                 connect_timeout: float = 5,
+                 http2: bool = True,
+                 max_retries: int = 2):
+        """
+        :param api_key: OpenAI API key.
+        :type api_key: str
+        :param base_url: Base URL of the API, the official one if None.
+        :type base_url: str | None
+        :param endpoint_limits: Limits of the ``text`` and ``audio`` endpoints.
+        :type endpoint_limits: dict[str, EndpointLimit]
+        :param max_connections: Open connections at most, per client.
+        :type max_connections: int
+        :param max_keepalive_connections: Idle connections kept open for later requests.
+        :type max_keepalive_connections: int
+        :param keepalive_expiry: Seconds an idle connection is kept open.
+        :type keepalive_expiry: float
+        :param connect_timeout: Seconds to establish a connection.
+        :type connect_timeout: float
+        :param http2: Use HTTP/2 if the ``h2`` package is installed.
+        :type http2: bool
+        :param max_retries: Retries of failed requests by the OpenAI client.
+        :type max_retries: int
+        """
+        self.endpoint_limits: dict[str, EndpointLimit] = endpoint_limits
+        self.http2: bool = http2 and importlib.util.find_spec("h2") is not None
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # Per-endpoint timeouts are passed with every request; this one covers everything else
+        timeout = httpx.Timeout(max(limit.timeout for limit in endpoint_limits.values()), connect=connect_timeout)
+        self.async_client: AsyncOpenAI = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=max_retries,
+            timeout=timeout,
+            http_client=httpx.AsyncClient(limits=limits, timeout=timeout, http2=self.http2),
+        )
+        self.client: OpenAI = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=max_retries,
+            timeout=timeout,
+            http_client=httpx.Client(limits=limits, timeout=timeout, http2=self.http2),
+        )
+        self._semaphores: dict[str, asyncio.Semaphore] = {
+            endpoint: asyncio.Semaphore(limit.concurrency) for endpoint, limit in endpoint_limits.items()
+        }
+
+    def _get_method(self, client: OpenAI | AsyncOpenAI, endpoint: str):
+        if endpoint == "text":
+            return client.chat.completions.create
+        elif endpoint == "audio":
+            return client.audio.transcriptions.create
+        else:
+            raise ValueError("Invalid endpoint.")
+
+    def request(self, endpoint: str, **kwargs):
+        """
+        Send a request with the synchronous client.
+        """
+        method = self._get_method(self.client, endpoint)
+        return method(timeout=self.endpoint_limits[endpoint].timeout, **kwargs)
+
+    async def async_request(self, endpoint: str, **kwargs):
+        """
+        Send a request with the async client once the endpoint has a free slot.
+        """
+        method = self._get_method(self.async_client, endpoint)
+        async with self._semaphores[endpoint]:
+            return await method(timeout=self.endpoint_limits[endpoint].timeout, **kwargs)
+
+    async def close(self) -> None:
+        """
+        Close the connections of both clients.
+        """
+        await self.async_client.close()
+        self.client.close()
@@ -1,10 +1,11 @@
 from api.openai.base import OpenAIAPIBase
+from api.openai.client import SharedOpenAIClient
 from exceptions.api import APIServerError
 
 
 class AudioProcessor(OpenAIAPIBase):
-    def __init__(self, api_key: str, base_url: str):
-        super().__init__(api_key, base_url)
+    def __init__(self, client: SharedOpenAIClient):
+        super().__init__(client)
 
     def transcribe_audio(self, file: any, model: str = "whisper-1", **kwargs):
         try:
@@ -16,3 +17,14 @@ class AudioProcessor(OpenAIAPIBase):
             )
         except APIServerError as e:
             raise APIServerError("Error occurred while transcribing audio.") from e
+
+    async def async_transcribe_audio(self, file: any, model: str = "whisper-1", **kwargs):
+        try:
+            return await self.async_request(
+                endpoint="audio",
+                model=model,
+                file=file,
+                **kwargs
+            )
+        except APIServerError as e:
+            raise APIServerError("Error occurred while transcribing audio.") from e
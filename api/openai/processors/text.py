@@ -1,10 +1,11 @@
 from api.openai.base import OpenAIAPIBase
+from api.openai.client import SharedOpenAIClient
 from exceptions.api import APIServerError
 
 
 class TextProcessor(OpenAIAPIBase):
-    def __init__(self, api_key: str, base_url: str):
-        super().__init__(api_key, base_url)
+    def __init__(self, client: SharedOpenAIClient):
+        super().__init__(client)
 
     def generate_text_response(self,
                                messages: any,
@@ -26,4 +27,26 @@ class TextProcessor(OpenAIAPIBase):
                 **kwargs
             )
         except APIServerError as e:
-            raise APIServerError("Error occurred while generating chat response.") from e
\ No newline at end of file
+            raise APIServerError("Error occurred while generating chat response.") from e
+
+    async def async_generate_text_response(self,
+                                           messages: any,
+                                           model: str = "gpt-4o-mini",
+                                           temperature: float = 0.7,
+                                           max_tokens: int = 500,
+                                           stream: bool = False,
+                                           stop: None | bool = None,
+                                           **kwargs):
+        try:
+            return await self.async_request(
+                endpoint="text",
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=stream,
+                stop=stop,
+                **kwargs
+            )
+        except APIServerError as e:
+            raise APIServerError("Error occurred while generating chat response.") from e
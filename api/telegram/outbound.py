@@ -0,0 +1,258 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Hashable
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.types import Message
+
+from utils.common.rate_limit_common_utils import ChatRateLimiter
+
+# Lower value is sent first.
+INTERACTIVE_PRIORITY: int = 0
+STATUS_PRIORITY: int = 1
+BROADCAST_PRIORITY: int = 2
+
+
+class _OutboundRequest:
+    __slots__ = ("chat_id", "priority", "seq", "factory", "merge_key", "futures", "version")
+
+    def __init__(self, chat_id: int, priority: int, seq: int,
+                 factory: Callable[[], Awaitable[Any]], merge_key: Hashable | None):
+        self.chat_id: int = chat_id
+        self.priority: int = priority
+        self.seq: int = seq
+        self.factory: Callable[[], Awaitable[Any]] = factory
+        self.merge_key: Hashable | None = merge_key
+        self.futures: list[asyncio.Future] = []
+        # Bumped whenever the request is queued again, so older heap entries of it are ignored
+        self.version: int = 0
+
+    @property
+    def sort_key(self) -> tuple[int, int]:
+        return self.priority, self.seq
+
+
+class TelegramOutboundQueue:
+    """
+    Single outbound path for Telegram API calls of the process.
+
+    Calls are queued per chat and dispatched by one background task that honours the global,
+    per-chat and group-chat token buckets of ``rate_limiter``. The next call is the one with the
+    best priority among chats that are allowed to send; calls of one chat run one at a time in
+    submission order within a priority. An edit of a message that is still queued replaces the
+    queued edit instead of being sent separately, and every waiter gets the result of the edit that
+    was actually sent. ``RetryAfter`` pauses the chat and puts the call back in front of its queue.
+
+    Every chat keeps a heap of its calls. A ready heap orders chats by their best call and a timer
+    heap holds chats whose bucket is still empty, so picking the next call costs O(log n) however
+    many chats are queued. Heap entries are never updated in place: a changed call is pushed again
+    and outdated entries are skipped when they come up.
+    """
+
+    def __init__(self, bot: Bot, rate_limiter: ChatRateLimiter):
+        self.bot: Bot = bot
+        self.rate_limiter: ChatRateLimiter = rate_limiter
+        self._chat_queues: dict[int, list[tuple[int, int, int, _OutboundRequest]]] = {}
+        self._ready_chats: list[tuple[int, int, int]] = []
+        self._delayed_chats: list[tuple[float, int]] = []
+        self._pending_merges: dict[Hashable, _OutboundRequest] = {}
+        self._in_flight: set[int] = set()
+        # The event loop keeps only weak references to tasks; a collected call would never resolve its futures
+        self._tasks: set[asyncio.Task] = set()
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._dispatcher: asyncio.Task | None = None
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    def _enqueue(self, request: _OutboundRequest) -> None:
+        request.version += 1
+        heapq.heappush(self._chat_queues.setdefault(request.chat_id, []),
+                       (request.priority, request.seq, request.version, request))
+        heapq.heappush(self._ready_chats, (request.priority, request.seq, request.chat_id))
+        if request.merge_key is not None:
+            self._pending_merges[request.merge_key] = request
+        self._wakeup.set()
+
+    def _requeue_merged(self, request: _OutboundRequest, priority: int) -> None:
+        """
+        Raise the priority of a queued request that another call was merged into.
+        """
+        if priority < request.priority:
+            request.priority = priority
+            self._enqueue(request)
+        else:
+            self._wakeup.set()
+
+    def _peek_chat(self, chat_id: int) -> _OutboundRequest | None:
+        """
+        Return the best queued request of a chat, dropping outdated entries on the way.
+        """
+        chat_queue = self._chat_queues.get(chat_id)
+        while chat_queue:
+            _, _, version, request = chat_queue[0]
+            if version == request.version:
+                return request
+            heapq.heappop(chat_queue)
+        self._chat_queues.pop(chat_id, None)
+        return None
+
+    def _mark_chat_ready(self, chat_id: int) -> None:
+        head = self._peek_chat(chat_id)
+        if head is not None:
+            heapq.heappush(self._ready_chats, (head.priority, head.seq, chat_id))
+
+    def submit(self, chat_id: int, factory: Callable[[], Awaitable[Any]],
+               priority: int = INTERACTIVE_PRIORITY, merge_key: Hashable | None = None) -> asyncio.Future:
+        """
+        Queue ``factory`` to be called once ``chat_id`` may send, and return a future of its result.
+
+        :param chat_id: Chat the call counts against.
+        :param factory: Zero-argument callable returning the awaitable API call. It is invoked at
+            dispatch time, so it may read state that changes while the call is queued.
+        :param priority: ``INTERACTIVE_PRIORITY``, ``STATUS_PRIORITY`` or ``BROADCAST_PRIORITY``.
+        :param merge_key: Calls with the same key that are still queued are merged into the newest one.
+        :return: Future resolved with the result of the API call.
+        """
+        self._ensure_dispatcher()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        queued_request = self._pending_merges.get(merge_key) if merge_key is not None else None
+        if queued_request is not None:
+            queued_request.factory = factory
+            queued_request.futures.append(future)
+            self._requeue_merged(queued_request, priority)
+            return future
+
+        request = _OutboundRequest(chat_id, priority, next(self._sequence), factory, merge_key)
+        request.futures.append(future)
+        self._enqueue(request)
+        return future
+
+    def _next_ready_request(self) -> tuple[_OutboundRequest | None, float | None]:
+        """
+        Pop the best request of all chats that may send now, or return how long to wait for one.
+        """
+        now = time.monotonic()
+        while self._delayed_chats and self._delayed_chats[0][0] <= now:
+            _, chat_id = heapq.heappop(self._delayed_chats)
+            self._mark_chat_ready(chat_id)
+
+        while self._ready_chats:
+            priority, seq, chat_id = heapq.heappop(self._ready_chats)
+            head = self._peek_chat(chat_id)
+            # Outdated entry, or the chat is busy and is marked ready again when its call returns
+            if head is None or (head.priority, head.seq) != (priority, seq) or chat_id in self._in_flight:
+                continue
+            delay = self.rate_limiter.get_chat_bucket(chat_id).delay()
+            if delay > 0:
+                heapq.heappush(self._delayed_chats, (now + delay, chat_id))
+                continue
+
+            heapq.heappop(self._chat_queues[chat_id])
+            self._peek_chat(chat_id)
+            if head.merge_key is not None and self._pending_merges.get(head.merge_key) is head:
+                del self._pending_merges[head.merge_key]
+            return head, None
+
+        if self._delayed_chats:
+            return None, max(self._delayed_chats[0][0] - now, 0.0)
+        return None, None
+
+    async def _dispatch(self) -> None:
+        while True:
+            global_delay = self.rate_limiter.global_bucket.delay()
+            if global_delay > 0:
+                await asyncio.sleep(global_delay)
+                continue
+
+            self._wakeup.clear()
+            request, delay = self._next_ready_request()
+            if request is None:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                continue
+
+            self.rate_limiter.global_bucket.try_acquire()
+            self.rate_limiter.get_chat_bucket(request.chat_id).try_acquire()
+            self._in_flight.add(request.chat_id)
+            task = asyncio.create_task(self._execute(request))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, request: _OutboundRequest) -> None:
+        try:
+            result = await request.factory()
+        except TelegramRetryAfter as e:
+            self.rate_limiter.backoff(request.chat_id, e.retry_after)
+            queued_request = self._pending_merges.get(request.merge_key) if request.merge_key is not None else None
+            if queued_request is not None:
+                # A newer edit of the same message is already queued and supersedes this one.
+                queued_request.futures.extend(request.futures)
+                self._requeue_merged(queued_request, request.priority)
+            else:
+                self._enqueue(request)
+        except Exception as e:
+            for future in request.futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            self.rate_limiter.record_success(request.chat_id)
+            for future in request.futures:
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._in_flight.discard(request.chat_id)
+            self._mark_chat_ready(request.chat_id)
+            self._wakeup.set()
+
+    async def send_message(self, chat_id: int, text: str, priority: int = INTERACTIVE_PRIORITY, **kwargs) -> Message:
+        return await self.submit(
+            chat_id, lambda: self.bot.send_message(chat_id, text, **kwargs), priority
+        )
+
+    async def edit_message_text(self, chat_id: int, message_id: int, text: str,
+                                priority: int = STATUS_PRIORITY, **kwargs) -> Message | bool:
+        return await self.submit(
+            chat_id,
+            lambda: self.bot.edit_message_text(text=text, chat_id=chat_id, message_id=message_id, **kwargs),
+            priority,
+            merge_key=("edit_message_text", chat_id, message_id)
+        )
+
+    async def delete_message(self, chat_id: int, message_id: int, priority: int = INTERACTIVE_PRIORITY) -> bool:
+        return await self.submit(chat_id, lambda: self.bot.delete_message(chat_id, message_id), priority)
+
+    async def answer(self, message: Message, text: str, priority: int = INTERACTIVE_PRIORITY, **kwargs) -> Message:
+        return await self.submit(message.chat.id, lambda: message.answer(text, **kwargs), priority)
+
+    async def reply(self, message: Message, text: str, priority: int = INTERACTIVE_PRIORITY, **kwargs) -> Message:
+        return await self.submit(message.chat.id, lambda: message.reply(text, **kwargs), priority)
+
+    async def close(self) -> None:
+        """
+        Stop the dispatcher, wait for the calls already sent and fail the calls that were still queued.
+        """
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._dispatcher
+            self._dispatcher = None
+        # Calls that hit RetryAfter meanwhile go back to their queue and are failed below
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for chat_queue in self._chat_queues.values():
+            for _, _, _, request in chat_queue:
+                for future in request.futures:
+                    if not future.done():
+                        future.cancel()
+        self._chat_queues.clear()
+        self._ready_chats.clear()
+        self._delayed_chats.clear()
+        self._pending_merges.clear()
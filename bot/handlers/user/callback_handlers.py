@@ -1,55 +1,57 @@
 from aiogram.types import CallbackQuery
 
-from config.integrations import bot
+from config.integrations import outbound_queue
+from data_types.database import UserDataType
 from keyboards.keyboards import build_suggested_questions_keyboard
 from services.api.openai_api_services import get_structured_suggested_questions_with_context
-from services.database.conversation_database_services import delete_all_user_conversations
-from services.database.user_database_services import update_user_language, get_user_by_telegram_id, get_user_language
+from services.database.async_conversation_database_services import delete_all_user_conversations
+from services.database.async_user_database_services import update_user_language
+from services.search.document_search_services import invalidate_document_index
 from templates.message_templates import get_new_chat_message, get_suggestions_message, get_no_suggestions_message
 
 
 async def process_callback_uz_lang(callback_query: CallbackQuery):
     telegram_id = callback_query.from_user.id
-    update_user_language(telegram_id, "uz")
-    await bot.delete_message(telegram_id, callback_query.message.message_id)
-    await bot.send_message(telegram_id, "O'zbek tili tanlandi, savolingizga javob berishga tayyorman 😊",
-                           reply_markup=None)
+    await update_user_language(telegram_id, "uz")
+    await outbound_queue.delete_message(telegram_id, callback_query.message.message_id)
+    await outbound_queue.send_message(telegram_id, "O'zbek tili tanlandi, savolingizga javob berishga tayyorman 😊",
+                                      reply_markup=None)
 
 
 async def process_callback_ru_lang(callback_query: CallbackQuery):
     telegram_id = callback_query.from_user.id
-    update_user_language(telegram_id, "ru")
-    await bot.delete_message(telegram_id, callback_query.message.message_id)
-    await bot.send_message(telegram_id, "Выбран русский язык, я готов ответить на ваши вопросы 😊", reply_markup=None)
+    await update_user_language(telegram_id, "ru")
+    await outbound_queue.delete_message(telegram_id, callback_query.message.message_id)
+    await outbound_queue.send_message(telegram_id, "Выбран русский язык, я готов ответить на ваши вопросы 😊", reply_markup=None)
 
 
 async def process_callback_en_lang(callback_query: CallbackQuery):
     telegram_id = callback_query.from_user.id
-    update_user_language(telegram_id, "en")
-    await bot.delete_message(telegram_id, callback_query.message.message_id)
-    await bot.send_message(telegram_id, "English language selected, I am ready to answer your questions 😊",
-                           reply_markup=None)
+    await update_user_language(telegram_id, "en")
+    await outbound_queue.delete_message(telegram_id, callback_query.message.message_id)
+    await outbound_queue.send_message(telegram_id, "English language selected, I am ready to answer your questions 😊",
+                                      reply_markup=None)
 
 
-async def process_callback_new_chat(callback_query: CallbackQuery):
+async def process_callback_new_chat(callback_query: CallbackQuery, user_data: UserDataType):
     telegram_id = callback_query.from_user.id
-    user_language = get_user_language(telegram_id)
-    delete_all_user_conversations(telegram_id)
-    await bot.send_message(telegram_id, get_new_chat_message(user_language), reply_markup=None)
+    await delete_all_user_conversations(user_data["user_id"])
+    invalidate_document_index(user_data["user_id"])
+    await outbound_queue.send_message(telegram_id, get_new_chat_message(user_data["language"]), reply_markup=None)
 
 
-async def process_callback_suggestions(callback_query: CallbackQuery):
+async def process_callback_suggestions(callback_query: CallbackQuery, user_data: UserDataType):
     telegram_id = callback_query.from_user.id
-    user_language = get_user_language(telegram_id)
-    options = get_structured_suggested_questions_with_context(telegram_id)
+    user_language = user_data["language"]
+    options = await get_structured_suggested_questions_with_context(user_data)
     if len(options) > 0:
-        await bot.send_message(
+        await outbound_queue.send_message(
             telegram_id,
             get_suggestions_message(user_language),
             reply_markup=build_suggested_questions_keyboard(options)
         )
     else:
-        await bot.send_message(
+        await outbound_queue.send_message(
             telegram_id,
             get_no_suggestions_message(user_language),
             reply_markup=None
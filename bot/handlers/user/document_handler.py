@@ -1,46 +1,113 @@
-import os
+import asyncio
+import logging
 
 from aiogram.types import Message
 
-from config.integrations import document_parser, status_manager
-from services.api.openai_api_services import get_text_response_with_context
+from config.constants import DOCUMENT_MAX_SIZE, DOCUMENT_INLINE_MAX_TOKENS, DOCUMENT_SEARCH_TOP_K, OPENAI_TEXT_MODEL, \
+    DOCUMENT_SUMMARY_TIMEOUT
+from config.integrations import document_parser, status_manager, document_engine
+from exceptions.parser import DocumentTooLargeError
+from exceptions.worker import WorkerError
+from data_types.database import UserDataType
+from services.api.openai_api_services import get_text_response_with_context, summarize_document
 from services.api.telegram_api_services import download_document_file
-from services.database.conversation_database_services import save_conversation, get_conversation_list
-from services.database.user_database_services import get_user_language
+from services.cache.media_cache_services import get_cached_media_result, cache_media_result
+from services.handler.document_handler_services import parse_document_data
 from services.handler.common import handle_saved_conversation
 from services.handler.text_handler_services import process_streaming_response
-from tasks import delete_handled_file
+from services.search.document_search_services import index_document, get_relevant_document_chunks
+from utils.common.token_common_utils import count_tokens
 from templates.message_templates import get_final_request_message, get_processing_document_message, \
-    get_downloading_document_message, get_parsing_content_message, get_generating_response_message
+    get_downloading_document_message, get_parsing_content_message, get_generating_response_message, \
+    get_document_too_large_message, get_document_parsing_failed_message, get_summarizing_document_message
+
+logger = logging.getLogger(__name__)
+
+
+async def get_document_summary(text: str) -> str | None:
+    """
+    Summarize a long document within ``DOCUMENT_SUMMARY_TIMEOUT``, or return None if that fails.
+    """
+    try:
+        return await asyncio.wait_for(summarize_document(text), DOCUMENT_SUMMARY_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Document summary timed out, answering from the relevant parts only")
+    except Exception as e:
+        logger.error(f"Document summary failed: {str(e)}")
+    return None
 
 
 @status_manager.status_update_decorator()
-async def handle_document(message: Message, status_context: dict) -> None:
+async def handle_document(message: Message, user_data: UserDataType, status_context: dict) -> None:
     """Handle document processing with automated status updates."""
     document = message.document
     caption = message.caption or ""
-    user_language = get_user_language(message.from_user.id)
-    full_path = None
+    user_language = user_data["language"]
     await status_context["update_status"](get_processing_document_message(user_language))
 
-    try:
-        # Download document
+    extracted_document_content = await get_cached_media_result("document", document.file_unique_id)
+    if extracted_document_content is None:
+        # Refuse oversized documents before downloading them; the status message tells the user
+        if document.file_size and document.file_size > DOCUMENT_MAX_SIZE:
+            await status_context["update_status"](
+                get_document_too_large_message(user_language, DOCUMENT_MAX_SIZE // 2 ** 20)
+            )
+            return
+
+        # Download document into memory; the buffer is released when the block ends
         await status_context["update_status"](get_downloading_document_message(user_language))
-        full_path = await download_document_file(document)
+        with await download_document_file(document) as document_buffer:
+            document_data = document_buffer.read()
 
-        # Parse document
+        # Parse document in a worker process with a hard timeout and memory cap, so other chats never wait
         await status_context["update_status"](get_parsing_content_message(user_language))
-        extracted_document_content = document_parser.parse_document(full_path)
-
-        await status_context["update_status"](get_final_request_message(user_language))
-        # Build the message with extracted content
-        final_request_message = f"\"{extracted_document_content}\"\n\nThis is a content that was extracted from the document.\n\n{caption}"
+        try:
+            extracted_document_content = await document_engine.run(
+                parse_document_data, document_data, document.file_name, document_parser.limits
+            )
+        except DocumentTooLargeError:
+            await status_context["update_status"](
+                get_document_too_large_message(user_language, DOCUMENT_MAX_SIZE // 2 ** 20)
+            )
+            return
+        except WorkerError as e:
+            logger.error(f"Document parsing failed: {str(e)}")
+            await status_context["update_status"](get_document_parsing_failed_message(user_language))
+            return
+        if extracted_document_content is None:
+            await status_context["update_status"](get_document_parsing_failed_message(user_language))
+            return
+        await cache_media_result("document", document.file_unique_id, extracted_document_content)
 
-        await status_context["update_status"](get_generating_response_message(user_language))
-        await handle_saved_conversation(message.from_user.id, final_request_message,
-                                        status_context['status_message_id'])
+    await status_context["update_status"](get_final_request_message(user_language))
+    document_chunks = None
+    attachment = None
+    # Tokenizing a long document takes a while, keep it off the event loop
+    document_tokens = await asyncio.to_thread(count_tokens, extracted_document_content, OPENAI_TEXT_MODEL)
+    if document_tokens <= DOCUMENT_INLINE_MAX_TOKENS:
+        # The extracted content is attached to the message and kept in the history as a preview
+        attachment = extracted_document_content
+        final_request_message = f"This is a content that was extracted from the document.\n\n{caption}"
+    else:
+        # Long documents are indexed; this and every later turn only carries the chunks relevant to it,
+        # and a summary of the whole document, saved with the message, answers questions about all of it
+        await status_context["update_status"](get_summarizing_document_message(user_language))
+        chunk_list, summary = await asyncio.gather(
+            index_document(user_data["user_id"], document.file_unique_id, document.file_name,
+                           extracted_document_content),
+            get_document_summary(extracted_document_content)
+        )
+        if caption:
+            document_chunks = await get_relevant_document_chunks(user_data["user_id"], caption)
+        document_chunks = document_chunks or chunk_list[:DOCUMENT_SEARCH_TOP_K]
+        final_request_message = (
+            f"I uploaded the document \"{document.file_name}\" ({len(chunk_list)} parts). "
+            f"Its parts relevant to my messages are provided to you."
+        )
+        if summary:
+            final_request_message += f"\n\nSummary of the whole document:\n{summary}"
+        final_request_message += f"\n\n{caption}"
 
-    finally:
-        # Clean up temporary files
-        if full_path and os.path.exists(full_path):
-            delete_handled_file.delay(full_path)
+    await status_context["update_status"](get_generating_response_message(user_language))
+    await handle_saved_conversation(user_data, final_request_message,
+                                    status_context['status_message_id'], document_chunks, attachment)
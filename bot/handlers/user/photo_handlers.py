@@ -1,13 +1,13 @@
-import os
 import logging
-import pytesseract
 from aiogram import Bot
 from aiogram.types import Message
-from PIL import Image
-from config.integrations import status_manager
-from services.database.user_database_services import get_user_language
+from config.integrations import outbound_queue, status_manager, ocr_engine
+from data_types.database import UserDataType
+from services.api.telegram_api_services import download_photo_file
+from services.cache.media_cache_services import get_cached_media_result, cache_media_result
 from services.handler.common import handle_saved_conversation
-from services.handler.photo_handler_services import handle_message_photo
+from services.handler.photo_handler_services import handle_message_photo, is_usable_ocr_text, \
+    run_ocr_strategies, select_ocr_strategies
 from templates.message_templates import get_processing_photo_message, get_downloading_photo_message, \
     get_extracting_text_from_photo_message, get_final_request_message, get_generating_response_message
 
@@ -16,45 +16,52 @@ logger = logging.getLogger(__name__)
 
 
 @status_manager.status_update_decorator()
-async def handle_photo(message: Message, bot: Bot, status_context: dict) -> None:
+async def handle_photo(message: Message, bot: Bot, user_data: UserDataType, status_context: dict) -> None:
     """Handle photo messages with OCR and send AI-generated responses."""
     # Initial setup
-    user_language = get_user_language(message.from_user.id)
+    user_language = user_data["language"]
     message_caption = message.caption or ""
     await status_context["update_status"](get_processing_photo_message(user_language))
     try:
-        # Create directory and set path
-        os.makedirs("media/photos", exist_ok=True)
         photo = message.photo[-1]  # Get the highest quality photo
-        path = f"media/photos/{photo.file_id}.jpg"
 
-        # Download image
-        await status_context["update_status"](get_downloading_photo_message(user_language))
+        # Forwarded and re-sent photos share file_unique_id, so their text is reused without a download
+        extracted_text = await get_cached_media_result("ocr", photo.file_unique_id, user_language)
+        if extracted_text is None:
+            # Download image into memory; the bytes are handed to the OCR workers directly
+            await status_context["update_status"](get_downloading_photo_message(user_language))
 
-        await bot.download(photo, destination=path)
+            with await download_photo_file(photo) as photo_buffer:
+                image_data = photo_buffer.read()
 
-        # Extract text using OCR
-        await status_context["update_status"](get_extracting_text_from_photo_message(user_language))
+            # Extract text using OCR
+            await status_context["update_status"](get_extracting_text_from_photo_message(user_language))
 
-        # Try primary OCR method
-        try:
-            extracted_text = handle_message_photo(path, user_language)
-        except Exception as e:
-            logger.error(f"Primary OCR failed: {str(e)}")
-            # Fallback to basic OCR
+            # Try primary OCR method; OCR runs in worker processes so the event loop stays free
             try:
-                pil_image = Image.open(path)
-                extracted_text = pytesseract.image_to_string(pil_image)
-            except Exception as alt_e:
-                logger.error(f"Alternative OCR failed: {str(alt_e)}")
+                extracted_text = await ocr_engine.run(handle_message_photo, image_data, user_language)
+            except Exception as e:
+                logger.error(f"Primary OCR failed: {str(e)}")
                 extracted_text = ""
 
+            if not is_usable_ocr_text(extracted_text):
+                # Fallback to alternative strategies in parallel, as many as the pool load allows
+                strategies = select_ocr_strategies(ocr_engine.load)
+                try:
+                    extracted_text = await run_ocr_strategies(ocr_engine, image_data, user_language, strategies)
+                except Exception as alt_e:
+                    logger.error(f"Alternative OCR failed: {str(alt_e)}")
+                    extracted_text = ""
+
+            if is_usable_ocr_text(extracted_text):
+                await cache_media_result("ocr", photo.file_unique_id, extracted_text, user_language)
+
         # Prepare final request
         await status_context["update_status"](get_final_request_message(user_language))
 
         # Final text processing
         final_text = extracted_text.strip() if extracted_text.strip() else ""
-        final_request_message = f'"{final_text}"\n\nThis is text extracted from an image.'
+        final_request_message = "This is text extracted from an image."
 
         if message_caption:
             final_request_message += f"\n\n{message_caption}"
@@ -62,11 +69,12 @@ async def handle_photo(message: Message, bot: Bot, status_context: dict) -> None
         # Generate response
         await status_context["update_status"](get_generating_response_message(user_language))
 
-        await handle_saved_conversation(message.from_user.id, final_request_message,
-                                        status_context['status_message_id'])
+        await handle_saved_conversation(user_data, final_request_message,
+                                        status_context['status_message_id'], attachment=final_text)
 
     except Exception as e:
         logger.error(f"Error processing photo: {str(e)}", exc_info=True)
-        await message.reply(
+        await outbound_queue.reply(
+            message,
             "Sorry, I encountered an error while processing your image. Please try again or send a clearer image."
         )
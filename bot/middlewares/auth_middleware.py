@@ -1,37 +1,43 @@
 from typing import Callable, Dict, Any, Awaitable
-from aiogram import Bot
 from aiogram.types import Update, User as UserType, CallbackQuery
+from config.integrations import outbound_queue
+from data_types.database import UserDataType
+from exceptions.database import UserDoesNotExist
 from keyboards.inline_keyboards import get_lang_keyboard
-from services.database.user_database_services import get_user_language, user_exists, update_user_language
-from services.database.user_database_services import add_new_user
+from services.database.async_user_database_services import get_user_by_telegram_id
+from services.database.async_user_database_services import add_new_user
 
 async def auth_middleware(
         handler: Callable[[Update, Dict[str, Any]], Awaitable[Any]],
         event: Update,
         data: Dict[str, Any]
 ) -> Any:
+    """
+    Load the user row once per update and expose it to handlers as ``user_data``.
+    """
     user: UserType = data["event_from_user"]
-    bot: Bot = data["bot"]
     try:
-        if not user_exists(user.id):
+        try:
+            user_data: UserDataType = await get_user_by_telegram_id(user.id)
+        except UserDoesNotExist:
             if isinstance(event.event, CallbackQuery) and event.event.data.startswith('lang_'):
                 user_language = event.event.data.split('_')[1]
-                add_new_user(user)
-                update_user_language(user.id, user_language)
+                data["user_data"] = await add_new_user(user, user_language)
                 return await handler(event, data)
-            await bot.send_message(user.id,
-                                   "🇺🇿\nAssalomu alaykum, men Bilag'onman. Har qanday savolingizga javob berishga harakat qilaman 🤓\n\n"
-                                   "🇷🇺\nЗдравствуйте, я Bilag'on. Я постораюсь ответить на все ваши вопросы 🤓\n\n"
-                                   "🇺🇸\nHello, I am Bilag'on. I will try to answer all your questions 🤓"
-                                   )
-            await bot.send_message(user.id,
-                                   "🇺🇿 Savol berish uchun, oldin tilni tanlang:\n"
-                                   "🇷🇺 Что-бы задать вопрос, сначала выберите язык:\n"
-                                   "🇺🇸 To ask a question, choose the language first:",
-                                   reply_markup=get_lang_keyboard()
-                                   )
+            await outbound_queue.send_message(user.id,
+                                              "🇺🇿\nAssalomu alaykum, men Bilag'onman. Har qanday savolingizga javob berishga harakat qilaman 🤓\n\n"
+                                              "🇷🇺\nЗдравствуйте, я Bilag'on. Я постораюсь ответить на все ваши вопросы 🤓\n\n"
+                                              "🇺🇸\nHello, I am Bilag'on. I will try to answer all your questions 🤓"
+                                              )
+            await outbound_queue.send_message(user.id,
+                                              "🇺🇿 Savol berish uchun, oldin tilni tanlang:\n"
+                                              "🇷🇺 Что-бы задать вопрос, сначала выберите язык:\n"
+                                              "🇺🇸 To ask a question, choose the language first:",
+                                              reply_markup=get_lang_keyboard()
+                                              )
             return
+        data["user_data"] = user_data
         return await handler(event, data)
     except Exception as e:
         print(f"Error in auth middleware: {e}")
-        return
\ No newline at end of file
+        return
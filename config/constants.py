@@ -7,10 +7,61 @@ load_dotenv()
 BOT_TOKEN: str = os.getenv('BOT_TOKEN')
 DIVIDE_MESSAGE_AFTER: int = 4096
 MESSAGE_COMPLETION_CURSOR: str = " ▌"
+# Outgoing calls (messages and edits) per chat: one per interval with short bursts; groups allow ~20 a minute.
+TELEGRAM_CHAT_INTERVAL: float = float(os.getenv('TELEGRAM_CHAT_INTERVAL', 1.0))
+TELEGRAM_CHAT_BURST: int = int(os.getenv('TELEGRAM_CHAT_BURST', 3))
+TELEGRAM_GROUP_CHAT_INTERVAL: float = float(os.getenv('TELEGRAM_GROUP_CHAT_INTERVAL', 3.0))
+# Upper bound the per-chat interval can grow to after repeated RetryAfter responses.
+TELEGRAM_MAX_CHAT_INTERVAL: float = float(os.getenv('TELEGRAM_MAX_CHAT_INTERVAL', 10.0))
+# Announcement messages queued at the same time; more users are fed in as these are sent.
+ANNOUNCEMENT_MAX_PENDING: int = int(os.getenv('ANNOUNCEMENT_MAX_PENDING', 300))
+TELEGRAM_GLOBAL_RATE_LIMIT: float = float(os.getenv('TELEGRAM_GLOBAL_RATE_LIMIT', 30))
 
 # External API constants
 OPENAI_API_KEY: str = os.getenv('OPENAI_API_KEY')
 OPENAI_BASE_URL: str = os.getenv('OPENAI_BASE_URL')
+OPENAI_TEXT_MODEL: str = os.getenv('OPENAI_TEXT_MODEL', 'gpt-4o-mini')
+# One connection pool is shared by all OpenAI requests of a process; HTTP/2 is used when h2 is installed.
+OPENAI_MAX_CONNECTIONS: int = int(os.getenv('OPENAI_MAX_CONNECTIONS', 100))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv('OPENAI_MAX_KEEPALIVE_CONNECTIONS', 20))
+OPENAI_KEEPALIVE_EXPIRY: float = float(os.getenv('OPENAI_KEEPALIVE_EXPIRY', 30))
+OPENAI_CONNECT_TIMEOUT: float = float(os.getenv('OPENAI_CONNECT_TIMEOUT', 5))
+OPENAI_HTTP2: bool = os.getenv('OPENAI_HTTP2', 'true').lower() == 'true'
+OPENAI_MAX_RETRIES: int = int(os.getenv('OPENAI_MAX_RETRIES', 2))
+# Requests in flight and their timeout in seconds, per endpoint.
+OPENAI_TEXT_CONCURRENCY: int = int(os.getenv('OPENAI_TEXT_CONCURRENCY', 200))
+OPENAI_TEXT_TIMEOUT: float = float(os.getenv('OPENAI_TEXT_TIMEOUT', 60))
+OPENAI_AUDIO_CONCURRENCY: int = int(os.getenv('OPENAI_AUDIO_CONCURRENCY', 20))
+OPENAI_AUDIO_TIMEOUT: float = float(os.getenv('OPENAI_AUDIO_TIMEOUT', 120))
+
+# Conversation history constants
+# Number of newest messages sent to the model as context, per model.
+CONVERSATION_WINDOW_SIZES: dict[str, int] = {
+    'gpt-4o-mini': 40,
+    'gpt-4o': 40,
+    'gpt-4-turbo': 40,
+    'gpt-3.5-turbo': 12,
+}
+DEFAULT_CONVERSATION_WINDOW_SIZE: int = int(os.getenv('CONVERSATION_WINDOW_SIZE', 20))
+# Context window of each model in tokens, shared by the prompt and the response.
+MODEL_CONTEXT_SIZES: dict[str, int] = {
+    'gpt-4o-mini': 128000,
+    'gpt-4o': 128000,
+    'gpt-4-turbo': 128000,
+    'gpt-3.5-turbo': 16385,
+}
+DEFAULT_MODEL_CONTEXT_SIZE: int = int(os.getenv('MODEL_CONTEXT_SIZE', 8192))
+# Tokens reserved for the model response (max_tokens of the request).
+RESPONSE_MAX_TOKENS: int = 2000
+# Once the context window is full, everything but this many newest messages is folded into a summary.
+CONVERSATION_SUMMARY_KEEP_RECENT: int = int(os.getenv('CONVERSATION_SUMMARY_KEEP_RECENT', 10))
+CONVERSATION_SUMMARY_MAX_TOKENS: int = int(os.getenv('CONVERSATION_SUMMARY_MAX_TOKENS', 800))
+# Seconds during which a user is not queued for summarization again.
+CONVERSATION_SUMMARY_DEBOUNCE: float = float(os.getenv('CONVERSATION_SUMMARY_DEBOUNCE', 60))
+# Text extracted from media is sent whole with its own message only; the history keeps this many tokens of it.
+ATTACHMENT_PREVIEW_TOKENS: int = int(os.getenv('ATTACHMENT_PREVIEW_TOKENS', 300))
+# Follow-up turns get the newest earlier attachment of the history back, up to this many tokens of it.
+ATTACHMENT_CONTEXT_TOKENS: int = int(os.getenv('ATTACHMENT_CONTEXT_TOKENS', 2000))
 
 # Webhook constants
 WEB_SERVER_HOST: str = os.getenv('WEB_SERVER_HOST')
@@ -25,4 +76,109 @@ DB_NAME: str = os.getenv('DB_NAME')
 DB_HOST: str = os.getenv('DB_HOST')
 DB_USER: str = os.getenv('DB_USER')
 DB_PORT: str = os.getenv('DB_PORT')
-DB_PASSWORD: str = os.getenv('DB_PASSWORD')
\ No newline at end of file
+DB_PASSWORD: str = os.getenv('DB_PASSWORD')
+DB_POOL_MIN_SIZE: int = int(os.getenv('DB_POOL_MIN_SIZE', 1))
+DB_POOL_MAX_SIZE: int = int(os.getenv('DB_POOL_MAX_SIZE', 10))
+DB_POOL_TIMEOUT: float = float(os.getenv('DB_POOL_TIMEOUT', 5))
+DB_POOL_HEALTH_CHECK_INTERVAL: float = float(os.getenv('DB_POOL_HEALTH_CHECK_INTERVAL', 30))
+
+# Media constants
+# Downloaded media is kept in memory up to this many bytes and spills to an anonymous temporary file beyond it.
+MEDIA_SPOOL_MAX_SIZE: int = int(os.getenv('MEDIA_SPOOL_MAX_SIZE', 10 * 1024 * 1024))
+
+# Document parsing limits
+DOCUMENT_MAX_SIZE: int = int(os.getenv('DOCUMENT_MAX_SIZE', 20 * 1024 * 1024))
+DOCUMENT_MAX_PAGES: int = int(os.getenv('DOCUMENT_MAX_PAGES', 100))
+# Seconds after which no further page of a document is read.
+DOCUMENT_PARSE_TIMEOUT: float = float(os.getenv('DOCUMENT_PARSE_TIMEOUT', 20))
+# Tokens of document text kept from one upload; parsing stops once they are used up.
+DOCUMENT_MAX_TOKENS: int = int(os.getenv('DOCUMENT_MAX_TOKENS', 100000))
+# Documents are parsed in this many worker processes; a job running longer is killed with its worker.
+DOCUMENT_WORKERS: int = int(os.getenv('DOCUMENT_WORKERS', 2))
+DOCUMENT_MAX_PENDING_JOBS: int = int(os.getenv('DOCUMENT_MAX_PENDING_JOBS', 8))
+DOCUMENT_JOB_TIMEOUT: float = float(os.getenv('DOCUMENT_JOB_TIMEOUT', 60))
+# Address space of a document worker; a document needing more fails instead of exhausting the host.
+DOCUMENT_WORKER_MEMORY_LIMIT: int = int(os.getenv('DOCUMENT_WORKER_MEMORY_LIMIT', 1024 * 1024 * 1024))
+DOCUMENT_WORKER_MAX_JOBS: int = int(os.getenv('DOCUMENT_WORKER_MAX_JOBS', 50))
+
+# Document retrieval constants
+# Documents longer than this are indexed in chunks instead of being sent to the model whole.
+DOCUMENT_INLINE_MAX_TOKENS: int = int(os.getenv('DOCUMENT_INLINE_MAX_TOKENS', 2000))
+DOCUMENT_CHUNK_TOKENS: int = int(os.getenv('DOCUMENT_CHUNK_TOKENS', 400))
+# Chunks of the user's documents added to the prompt of every question.
+DOCUMENT_SEARCH_TOP_K: int = int(os.getenv('DOCUMENT_SEARCH_TOP_K', 4))
+# Share of a question (weighted by word rarity) a chunk has to match to be added to the prompt.
+DOCUMENT_SEARCH_MIN_COVERAGE: float = float(os.getenv('DOCUMENT_SEARCH_MIN_COVERAGE', 0.5))
+DOCUMENT_INDEX_CACHE_SIZE: int = int(os.getenv('DOCUMENT_INDEX_CACHE_SIZE', 1000))
+DOCUMENT_INDEX_CACHE_TTL: float = float(os.getenv('DOCUMENT_INDEX_CACHE_TTL', 600))
+
+# Document summary constants
+# Indexed documents are summarized part by part, then the part summaries are merged until one is left.
+DOCUMENT_SUMMARY_CHUNK_TOKENS: int = int(os.getenv('DOCUMENT_SUMMARY_CHUNK_TOKENS', 4000))
+DOCUMENT_SUMMARY_MAX_TOKENS: int = int(os.getenv('DOCUMENT_SUMMARY_MAX_TOKENS', 600))
+# Summary requests of one document that run at the same time.
+DOCUMENT_SUMMARY_CONCURRENCY: int = int(os.getenv('DOCUMENT_SUMMARY_CONCURRENCY', 4))
+# Seconds after which the answer is generated without the summary; finished parts stay cached.
+DOCUMENT_SUMMARY_TIMEOUT: float = float(os.getenv('DOCUMENT_SUMMARY_TIMEOUT', 60))
+
+# Voice transcription constants
+# Voice messages longer than VOICE_SEGMENT_MAX_SECONDS are cut at silences into segments of about
+# VOICE_SEGMENT_SECONDS, which are transcribed concurrently (requires ffmpeg).
+FFMPEG_PATH: str = os.getenv('FFMPEG_PATH', 'ffmpeg')
+VOICE_SEGMENT_SECONDS: float = float(os.getenv('VOICE_SEGMENT_SECONDS', 60))
+VOICE_SEGMENT_MAX_SECONDS: float = float(os.getenv('VOICE_SEGMENT_MAX_SECONDS', 120))
+VOICE_SILENCE_NOISE_DB: int = int(os.getenv('VOICE_SILENCE_NOISE_DB', -35))
+VOICE_SILENCE_MIN_SECONDS: float = float(os.getenv('VOICE_SILENCE_MIN_SECONDS', 0.4))
+# Transcription requests of one voice message that run at the same time.
+VOICE_TRANSCRIPTION_CONCURRENCY: int = int(os.getenv('VOICE_TRANSCRIPTION_CONCURRENCY', 4))
+
+# Worker pool constants
+# OCR jobs run in this many processes (one per CPU core by default).
+OCR_WORKERS: int = int(os.getenv('OCR_WORKERS', os.cpu_count() or 1))
+# Photos allowed to wait for a free OCR worker before new uploads wait to be queued.
+OCR_MAX_PENDING_JOBS: int = int(os.getenv('OCR_MAX_PENDING_JOBS', 32))
+OCR_JOB_TIMEOUT: float = float(os.getenv('OCR_JOB_TIMEOUT', 60))
+# Each OCR worker is replaced after this many jobs, which bounds the memory held by loaded models.
+OCR_WORKER_MAX_JOBS: int = int(os.getenv('OCR_WORKER_MAX_JOBS', 200))
+# Tesseract language sets a worker keeps loaded (with tesserocr installed).
+OCR_MAX_LOADED_MODELS: int = int(os.getenv('OCR_MAX_LOADED_MODELS', 4))
+
+# OCR preprocessing constants
+# Photos are rescaled so that the median glyph is about this many pixels high, Tesseract's sweet spot.
+OCR_TARGET_TEXT_HEIGHT: int = int(os.getenv('OCR_TARGET_TEXT_HEIGHT', 24))
+# Longest image side after rescaling, whatever the text height.
+OCR_MAX_IMAGE_SIDE: int = int(os.getenv('OCR_MAX_IMAGE_SIDE', 2500))
+# Up to this many separate text blocks are recognized one by one; more are cropped as a whole.
+OCR_MAX_TEXT_REGIONS: int = int(os.getenv('OCR_MAX_TEXT_REGIONS', 6))
+
+# OCR fallback strategies
+# Strategies tried in parallel when the main OCR pass finds no usable text, by load of the OCR pool
+# (running and queued jobs per worker): all of them when idle, fewer as the pool fills up.
+OCR_STRATEGIES_LOW_LOAD: list[str] = os.getenv(
+    'OCR_STRATEGIES_LOW_LOAD', 'grayscale,otsu,psm6,inverted,sharpened'
+).split(',')
+OCR_STRATEGIES_NORMAL_LOAD: list[str] = os.getenv('OCR_STRATEGIES_NORMAL_LOAD', 'grayscale,otsu,psm6').split(',')
+OCR_STRATEGIES_HIGH_LOAD: list[str] = os.getenv('OCR_STRATEGIES_HIGH_LOAD', 'grayscale').split(',')
+OCR_NORMAL_LOAD: float = float(os.getenv('OCR_NORMAL_LOAD', 0.5))
+OCR_HIGH_LOAD: float = float(os.getenv('OCR_HIGH_LOAD', 1.0))
+# Remaining strategies are cancelled once one reaches this mean Tesseract word confidence (0-100).
+OCR_MIN_CONFIDENCE: float = float(os.getenv('OCR_MIN_CONFIDENCE', 80))
+
+# Cache constants
+USER_CACHE_MAX_SIZE: int = int(os.getenv('USER_CACHE_MAX_SIZE', 10000))
+USER_CACHE_TTL: float = float(os.getenv('USER_CACHE_TTL', 300))
+# OCR, transcription and parsing results keyed by Telegram's file_unique_id.
+MEDIA_CACHE_MAX_SIZE: int = int(os.getenv('MEDIA_CACHE_MAX_SIZE', 1000))
+MEDIA_CACHE_TTL: float = float(os.getenv('MEDIA_CACHE_TTL', 24 * 60 * 60))
+# Results longer than this many characters (large documents) skip the in-memory tier.
+MEDIA_CACHE_MAX_ITEM_SIZE: int = int(os.getenv('MEDIA_CACHE_MAX_ITEM_SIZE', 200_000))
+# Optional second tier shared by all bot processes, e.g. redis://localhost:6379/1.
+MEDIA_CACHE_REDIS_URL: str | None = os.getenv('MEDIA_CACHE_REDIS_URL')
+MEDIA_CACHE_REDIS_TTL: int = int(os.getenv('MEDIA_CACHE_REDIS_TTL', 7 * 24 * 60 * 60))
+# Bump a version whenever its pipeline changes so that stale results are not served.
+MEDIA_PIPELINE_VERSIONS: dict[str, str] = {
+    "ocr": "3",
+    "transcription": "1",
+    "document": "4",
+    "document_summary": "1",
+}
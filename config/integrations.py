@@ -1,13 +1,108 @@
 from aiogram import Bot
+from redis import asyncio as redis_asyncio
 
+from api.openai.client import SharedOpenAIClient, EndpointLimit
 from api.openai.processors.audio import AudioProcessor
 from api.openai.processors.text import TextProcessor
-from config.constants import OPENAI_API_KEY, OPENAI_BASE_URL, BOT_TOKEN
+from api.telegram.outbound import TelegramOutboundQueue
+from config.constants import (
+    OPENAI_API_KEY,
+    OPENAI_BASE_URL,
+    OPENAI_MAX_CONNECTIONS,
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    OPENAI_KEEPALIVE_EXPIRY,
+    OPENAI_CONNECT_TIMEOUT,
+    OPENAI_HTTP2,
+    OPENAI_MAX_RETRIES,
+    OPENAI_TEXT_CONCURRENCY,
+    OPENAI_TEXT_TIMEOUT,
+    OPENAI_AUDIO_CONCURRENCY,
+    OPENAI_AUDIO_TIMEOUT,
+    BOT_TOKEN,
+    TELEGRAM_GLOBAL_RATE_LIMIT,
+    TELEGRAM_CHAT_INTERVAL,
+    TELEGRAM_CHAT_BURST,
+    TELEGRAM_GROUP_CHAT_INTERVAL,
+    TELEGRAM_MAX_CHAT_INTERVAL,
+    OCR_WORKERS,
+    OCR_MAX_PENDING_JOBS,
+    OCR_JOB_TIMEOUT,
+    OPENAI_TEXT_MODEL,
+    DOCUMENT_MAX_SIZE,
+    DOCUMENT_MAX_PAGES,
+    DOCUMENT_PARSE_TIMEOUT,
+    DOCUMENT_MAX_TOKENS,
+    DOCUMENT_WORKERS,
+    DOCUMENT_MAX_PENDING_JOBS,
+    DOCUMENT_JOB_TIMEOUT,
+    DOCUMENT_WORKER_MEMORY_LIMIT,
+    DOCUMENT_WORKER_MAX_JOBS,
+    OCR_WORKER_MAX_JOBS,
+    MEDIA_CACHE_MAX_SIZE,
+    MEDIA_CACHE_TTL,
+    MEDIA_CACHE_MAX_ITEM_SIZE,
+    MEDIA_CACHE_REDIS_URL,
+    MEDIA_CACHE_REDIS_TTL,
+)
 from decorator.status_message_manager import StatusMessageManager
-from parser.document import DocumentParser
+from parser.document import DocumentParser, DocumentLimits
+from utils.common.cache_common_utils import TTLCache, TieredCache
+from utils.common.rate_limit_common_utils import ChatRateLimiter
+from utils.handler.photo_handler_utils import init_ocr_worker
+from workers.pool import ProcessPoolEngine, limit_worker_memory
 
 bot = Bot(token=BOT_TOKEN)
-text_processor = TextProcessor(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
-audio_processor = AudioProcessor(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
-document_parser = DocumentParser()
-status_manager = StatusMessageManager(bot)
\ No newline at end of file
+outbound_queue = TelegramOutboundQueue(bot, ChatRateLimiter(
+    global_rate=TELEGRAM_GLOBAL_RATE_LIMIT,
+    chat_interval=TELEGRAM_CHAT_INTERVAL,
+    group_chat_interval=TELEGRAM_GROUP_CHAT_INTERVAL,
+    max_chat_interval=TELEGRAM_MAX_CHAT_INTERVAL,
+    chat_burst=TELEGRAM_CHAT_BURST,
+))
+openai_client = SharedOpenAIClient(
+    api_key=OPENAI_API_KEY,
+    base_url=OPENAI_BASE_URL,
+    endpoint_limits={
+        "text": EndpointLimit(OPENAI_TEXT_CONCURRENCY, OPENAI_TEXT_TIMEOUT),
+        "audio": EndpointLimit(OPENAI_AUDIO_CONCURRENCY, OPENAI_AUDIO_TIMEOUT),
+    },
+    max_connections=OPENAI_MAX_CONNECTIONS,
+    max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY,
+    connect_timeout=OPENAI_CONNECT_TIMEOUT,
+    http2=OPENAI_HTTP2,
+    max_retries=OPENAI_MAX_RETRIES,
+)
+text_processor = TextProcessor(openai_client)
+audio_processor = AudioProcessor(openai_client)
+document_parser = DocumentParser(DocumentLimits(
+    max_bytes=DOCUMENT_MAX_SIZE,
+    max_pages=DOCUMENT_MAX_PAGES,
+    max_seconds=DOCUMENT_PARSE_TIMEOUT,
+    max_tokens=DOCUMENT_MAX_TOKENS,
+    token_model=OPENAI_TEXT_MODEL,
+))
+status_manager = StatusMessageManager(outbound_queue)
+media_result_cache = TieredCache(
+    TTLCache(max_size=MEDIA_CACHE_MAX_SIZE, ttl=MEDIA_CACHE_TTL),
+    redis_client=redis_asyncio.Redis.from_url(MEDIA_CACHE_REDIS_URL) if MEDIA_CACHE_REDIS_URL else None,
+    redis_ttl=MEDIA_CACHE_REDIS_TTL,
+    key_prefix="media_result:",
+    max_memory_item_size=MEDIA_CACHE_MAX_ITEM_SIZE,
+)
+ocr_engine = ProcessPoolEngine(
+    max_workers=OCR_WORKERS,
+    max_pending=OCR_MAX_PENDING_JOBS,
+    timeout=OCR_JOB_TIMEOUT,
+    initializer=init_ocr_worker,
+    max_tasks_per_child=OCR_WORKER_MAX_JOBS,
+)
+document_engine = ProcessPoolEngine(
+    max_workers=DOCUMENT_WORKERS,
+    max_pending=DOCUMENT_MAX_PENDING_JOBS,
+    timeout=DOCUMENT_JOB_TIMEOUT,
+    initializer=limit_worker_memory,
+    initargs=(DOCUMENT_WORKER_MEMORY_LIMIT,),
+    max_tasks_per_child=DOCUMENT_WORKER_MAX_JOBS,
+    kill_on_timeout=True,
+)
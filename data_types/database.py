@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import TypedDict
 
 
@@ -13,4 +14,24 @@ class UserDataType(TypedDict):
 
 class ConversationDataType(TypedDict):
     role: str
-    content: str
\ No newline at end of file
+    content: str
+
+
+class TokenizedConversationDataType(ConversationDataType):
+    token_count: int | None
+
+
+class RecentConversationDataType(TokenizedConversationDataType):
+    attachment_id: int | None
+
+
+class ConversationSummaryDataType(TypedDict):
+    summary: str
+    summarized_until: datetime
+    token_count: int | None
+
+class DocumentChunkDataType(TypedDict):
+    file_name: str | None
+    chunk_index: int
+    content: str
+    token_count: int | None
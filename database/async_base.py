@@ -0,0 +1,108 @@
+import asyncio
+
+import asyncpg
+
+from config.constants import (
+    DB_NAME,
+    DB_USER,
+    DB_PASSWORD,
+    DB_HOST,
+    DB_PORT,
+    DB_POOL_MIN_SIZE,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_POOL_HEALTH_CHECK_INTERVAL,
+)
+from exceptions.database import DBError, DataTypeError
+
+_async_pool: asyncpg.Pool | None = None
+_async_pool_lock: asyncio.Lock | None = None
+
+
+async def get_async_pool() -> asyncpg.Pool:
+    """
+    Return the asyncpg pool of the running event loop, creating it on first use.
+    """
+    global _async_pool, _async_pool_lock
+    if _async_pool is not None:
+        return _async_pool
+
+    if _async_pool_lock is None:
+        _async_pool_lock = asyncio.Lock()
+
+    async with _async_pool_lock:
+        if _async_pool is None:
+            try:
+                _async_pool = await asyncpg.create_pool(
+                    database=DB_NAME,
+                    user=DB_USER,
+                    password=DB_PASSWORD,
+                    host=DB_HOST,
+                    port=int(DB_PORT) if DB_PORT else None,
+                    min_size=DB_POOL_MIN_SIZE,
+                    max_size=DB_POOL_MAX_SIZE,
+                    timeout=DB_POOL_TIMEOUT,
+                    max_inactive_connection_lifetime=DB_POOL_HEALTH_CHECK_INTERVAL,
+                )
+            except Exception as e:
+                raise DBError(f"Failed to create async connection pool: {str(e)}")
+    return _async_pool
+
+
+async def close_async_pool() -> None:
+    """
+    Gracefully close the asyncpg pool if it was created.
+    """
+    global _async_pool
+    if _async_pool is not None:
+        pool, _async_pool = _async_pool, None
+        await pool.close()
+
+
+class AsyncDatabase:
+    """
+    Base class for repositories interacting with a database without blocking the event loop.
+
+    Every query borrows a connection from the asyncpg pool only for its own duration.
+    """
+
+    async def _run(self, method: str, query: str, *args):
+        """
+        Execute a query with the given connection method and translate driver errors.
+        """
+        pool = await get_async_pool()
+        try:
+            async with pool.acquire(timeout=DB_POOL_TIMEOUT) as conn:
+                return await getattr(conn, method)(query, *args)
+        except asyncpg.IntegrityConstraintViolationError:
+            raise
+        except asyncpg.DataError as e:
+            raise DataTypeError(f"Data type error: {str(e)}")
+        except asyncpg.PostgresError as e:
+            raise DBError(f"Database error: {str(e)}")
+        except (asyncpg.InterfaceError, asyncio.TimeoutError, OSError) as e:
+            raise DBError(f"Operational error: {str(e)}")
+
+    async def fetch(self, query: str, *args) -> list[asyncpg.Record]:
+        """
+        Execute a query and return all rows.
+        """
+        return await self._run("fetch", query, *args)
+
+    async def fetchrow(self, query: str, *args) -> asyncpg.Record | None:
+        """
+        Execute a query and return the first row or None.
+        """
+        return await self._run("fetchrow", query, *args)
+
+    async def fetchval(self, query: str, *args) -> any:
+        """
+        Execute a query and return the first column of the first row.
+        """
+        return await self._run("fetchval", query, *args)
+
+    async def execute(self, query: str, *args) -> str:
+        """
+        Execute a query and return its status string (e.g. ``INSERT 0 1``).
+        """
+        return await self._run("execute", query, *args)
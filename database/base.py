@@ -1,27 +1,21 @@
-import os
-import psycopg2
 from psycopg2 import OperationalError, DataError
 
+from database.pool import get_pool
 from exceptions.database import RollbackError, CommitError, DBError, DataTypeError
 
 
 class Database:
     """
     Base class for repositories interacting with a database.
+
+    Connections are borrowed from the process-wide pool and handed back on ``close``.
     """
     def __init__(self):
         """
-        Initialize database connection.
+        Borrow a database connection from the pool.
         """
-        self.db_name = os.getenv("DB_NAME")
         try:
-            self.conn = psycopg2.connect(
-                database=self.db_name,
-                user=os.getenv("DB_USER"),
-                password=os.getenv("DB_PASSWORD"),
-                host=os.getenv("DB_HOST"),
-                port=os.getenv("DB_PORT")
-            )
+            self.conn = get_pool().getconn()
         except Exception as e:
             raise DBError(f"Failed to connect to database: {str(e)}")
 
@@ -48,10 +42,11 @@ class Database:
 
     def close(self):
         """
-        Close the database connection.
+        Return the database connection to the pool.
         """
-        if self.conn and not self.conn.closed:
-            self.conn.close()
+        if self.conn is not None:
+            get_pool().putconn(self.conn)
+            self.conn = None
 
     def execute_query(self, query, params=None):
         """
@@ -0,0 +1,4 @@
+-- Supports loading the newest messages of a user with ORDER BY created_at DESC LIMIT n
+-- without scanning and sorting the whole conversation history.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS conversations_user_id_created_at_idx
+    ON conversations (user_id, created_at DESC);
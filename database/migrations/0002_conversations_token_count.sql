@@ -0,0 +1,4 @@
+-- Token count of every message, computed once on insert, so prompts can be
+-- fitted into the model context without re-tokenizing the history each turn.
+-- Rows created before this migration keep NULL and are counted on read.
+ALTER TABLE conversations ADD COLUMN IF NOT EXISTS token_count INTEGER;
@@ -0,0 +1,9 @@
+-- Rolling summary of the older part of every conversation. Messages created up to
+-- summarized_until are represented by the summary and no longer loaded as context.
+CREATE TABLE IF NOT EXISTS conversation_summaries (
+    user_id INTEGER PRIMARY KEY REFERENCES users (user_id) ON DELETE CASCADE,
+    summary TEXT NOT NULL,
+    summarized_until TIMESTAMP NOT NULL,
+    token_count INTEGER,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,14 @@
+-- Chunks of long uploaded documents. Instead of resending a whole document with every
+-- question, the chunks most relevant to the question are looked up and sent.
+CREATE TABLE IF NOT EXISTS document_chunks (
+    chunk_id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (user_id) ON DELETE CASCADE,
+    file_unique_id TEXT NOT NULL,
+    file_name TEXT,
+    chunk_index INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    token_count INTEGER,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS document_chunks_user_id_index ON document_chunks (user_id, created_at);
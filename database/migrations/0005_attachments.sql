@@ -0,0 +1,16 @@
+-- Text extracted from photos and documents, stored once per distinct content and
+-- zlib-compressed by the bot. Conversation rows keep only a short preview of it, so
+-- the conversations table and the history queries stay small.
+CREATE TABLE IF NOT EXISTS attachments (
+    attachment_id SERIAL PRIMARY KEY,
+    content_hash BYTEA NOT NULL UNIQUE,
+    content BYTEA NOT NULL,
+    content_size INTEGER NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- The content is compressed already; keep TOAST from trying again.
+ALTER TABLE attachments ALTER COLUMN content SET STORAGE EXTERNAL;
+
+ALTER TABLE conversations ADD COLUMN IF NOT EXISTS attachment_id INTEGER
+    REFERENCES attachments (attachment_id) ON DELETE SET NULL;
@@ -0,0 +1,239 @@
+import os
+import threading
+import time
+from collections import deque
+
+import psycopg2
+from psycopg2 import extensions
+
+from config.constants import (
+    DB_NAME,
+    DB_USER,
+    DB_PASSWORD,
+    DB_HOST,
+    DB_PORT,
+    DB_POOL_MIN_SIZE,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_POOL_HEALTH_CHECK_INTERVAL,
+)
+from exceptions.database import ConnectionPoolError, ConnectionPoolTimeoutError
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections shared by all repositories of the process.
+    """
+
+    def __init__(self,
+                 min_size: int,
+                 max_size: int,
+                 timeout: float,
+                 health_check_interval: float,
+                 **connect_kwargs):
+        """
+        Initialize the pool. Connections are opened lazily on checkout or by ``prefill``.
+
+        :param min_size: Number of connections opened by ``prefill`` and kept even when idle for long.
+        :type min_size: int
+        :param max_size: Upper bound of connections opened by the pool at the same time.
+        :type max_size: int
+        :param timeout: Seconds to wait for a free connection before giving up.
+        :type timeout: float
+        :param health_check_interval: Idle seconds after which a connection is pinged before reuse.
+        :type health_check_interval: float
+        :param connect_kwargs: Keyword arguments passed to ``psycopg2.connect``.
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+
+        self.min_size: int = min_size
+        self.max_size: int = max_size
+        self.timeout: float = timeout
+        self.health_check_interval: float = health_check_interval
+        self._connect_kwargs: dict = connect_kwargs
+        self._idle: deque = deque()
+        self._size: int = 0
+        self._closed: bool = False
+        self._condition = threading.Condition()
+
+    def prefill(self) -> None:
+        """
+        Open connections until ``min_size`` of them exist, so the first requests skip the handshake.
+        """
+        while True:
+            with self._condition:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._condition:
+                    self._size -= 1
+                raise
+            with self._condition:
+                self._idle.append((conn, time.monotonic()))
+                self._condition.notify()
+
+    def _connect(self):
+        """
+        Open a new physical connection.
+        """
+        return psycopg2.connect(**self._connect_kwargs)
+
+    def _is_healthy(self, conn, last_used: float) -> bool:
+        """
+        Check that an idle connection can still be used.
+        """
+        if conn.closed:
+            return False
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, conn) -> None:
+        """
+        Close a connection and free its slot.
+        """
+        try:
+            if not conn.closed:
+                conn.close()
+        except Exception:
+            pass
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def getconn(self):
+        """
+        Borrow a connection, waiting up to ``timeout`` seconds when the pool is exhausted.
+
+        :raises ConnectionPoolError: If the pool is closed
+        :raises ConnectionPoolTimeoutError: If no connection became available in time
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise ConnectionPoolError("Connection pool is closed")
+                    if self._idle:
+                        conn, last_used = self._idle.pop()
+                        shrink = (len(self._idle) >= self.min_size
+                                  and time.monotonic() - last_used >= self.health_check_interval)
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        conn, last_used, shrink = None, None, False
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise ConnectionPoolTimeoutError(
+                            f"No connection available after {self.timeout} seconds (max_size={self.max_size})")
+                    self._condition.wait(remaining)
+
+            if conn is None:
+                try:
+                    return self._connect()
+                except Exception:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+
+            if not shrink and self._is_healthy(conn, last_used):
+                return conn
+            # Stale or surplus idle connection: drop it and try again with the freed slot.
+            self._discard(conn)
+
+    def putconn(self, conn) -> None:
+        """
+        Return a borrowed connection to the pool, resetting any open transaction.
+        """
+        if conn.closed:
+            self._discard(conn)
+            return
+
+        try:
+            status = conn.info.transaction_status
+            if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                self._discard(conn)
+                return
+            if status != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except Exception:
+            self._discard(conn)
+            return
+
+        with self._condition:
+            if self._closed:
+                self._size -= 1
+                conn.close()
+                return
+            self._idle.append((conn, time.monotonic()))
+            self._condition.notify()
+
+    def closeall(self) -> None:
+        """
+        Close every idle connection and refuse further checkouts.
+        """
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._size -= 1
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._condition.notify_all()
+
+
+_pool: ConnectionPool | None = None
+_pool_pid: int | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """
+    Return the process-wide connection pool, creating it on first use.
+
+    The pool is recreated after a fork (e.g. in Celery prefork workers) so that
+    connections are never shared between processes.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ConnectionPool(
+                min_size=DB_POOL_MIN_SIZE,
+                max_size=DB_POOL_MAX_SIZE,
+                timeout=DB_POOL_TIMEOUT,
+                health_check_interval=DB_POOL_HEALTH_CHECK_INTERVAL,
+                database=DB_NAME,
+                user=DB_USER,
+                password=DB_PASSWORD,
+                host=DB_HOST,
+                port=DB_PORT,
+            )
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def close_pool() -> None:
+    """
+    Close the process-wide connection pool if it was created.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.closeall()
+        _pool = None
+        _pool_pid = None
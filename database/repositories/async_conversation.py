@@ -0,0 +1,183 @@
+import hashlib
+import zlib
+
+import asyncpg
+
+from config.constants import OPENAI_TEXT_MODEL
+from data_types.database import (
+    ConversationDataType,
+    ConversationSummaryDataType,
+    RecentConversationDataType,
+)
+from database.async_base import AsyncDatabase
+from exceptions.database import RelatedRecordDoesNotExist
+from utils.common.token_common_utils import count_tokens
+
+
+class AsyncConversation(AsyncDatabase):
+    """
+    Asynchronous repository for managing user conversations.
+
+    Methods take the internal ``user_id`` loaded once by ``auth_middleware``,
+    so no extra lookup by telegram ID is needed.
+    """
+
+    def _serialize(self, conversation_record: asyncpg.Record) -> ConversationDataType:
+        """
+        Convert a conversation record to a structured dictionary.
+        """
+        try:
+            role: str = conversation_record["role"]
+            content: str = conversation_record["message"]
+            return {
+                "role": role.strip(),
+                "content": content
+            }
+        except (KeyError, IndexError) as e:
+            raise ValueError("Conversation record does not contain the required columns") from e
+        except (TypeError, AttributeError) as e:
+            raise ValueError("Invalid data type encountered while processing conversation data") from e
+
+    async def add_conversation(self, user_id: int, role: str, message: str, attachment: str | None = None) -> None:
+        """
+        Add a new conversation entry for a user together with its token count.
+
+        An ``attachment`` (text extracted from media, of which ``message`` should only carry a
+        preview) is compressed and stored once per distinct content in ``attachments``.
+        """
+        token_count = count_tokens(message, OPENAI_TEXT_MODEL)
+        try:
+            if attachment is None:
+                await self.execute(
+                    '''
+                    INSERT INTO conversations (user_id, role, message, token_count)
+                    VALUES ($1, $2, $3, $4)
+                    ''',
+                    user_id, role, message, token_count
+                )
+                return
+
+            content = attachment.encode("utf-8")
+            # DO UPDATE instead of DO NOTHING, so the existing row is returned for duplicates
+            await self.execute(
+                '''
+                WITH attachment AS (
+                    INSERT INTO attachments (content_hash, content, content_size)
+                    VALUES ($5, $6, $7)
+                    ON CONFLICT (content_hash) DO UPDATE SET content_hash = EXCLUDED.content_hash
+                    RETURNING attachment_id
+                )
+                INSERT INTO conversations (user_id, role, message, token_count, attachment_id)
+                SELECT $1, $2, $3, $4, attachment_id FROM attachment
+                ''',
+                user_id, role, message, token_count,
+                hashlib.sha256(content).digest(), zlib.compress(content), len(content)
+            )
+        except asyncpg.ForeignKeyViolationError:
+            raise RelatedRecordDoesNotExist(f"User with user_id {user_id} does not exist in the database.")
+
+    async def get_attachment(self, attachment_id: int) -> str | None:
+        """
+        Get the full text of an attachment referenced by a conversation entry.
+        """
+        content = await self.fetchval(
+            '''
+            SELECT content FROM attachments WHERE attachment_id = $1
+            ''',
+            attachment_id
+        )
+        if content is None:
+            return None
+        return zlib.decompress(content).decode("utf-8")
+
+    async def delete_all_conversations(self, user_id: int) -> None:
+        """
+        Delete all conversation entries for a user together with their summary, documents
+        and the attachments no other user's entry refers to.
+        """
+        # All parts of the statement see the rows as they were before it, so the entries
+        # deleted here still show up in the subquery and have to be excluded by user_id
+        await self.execute(
+            '''
+            WITH deleted_summary AS (
+                DELETE FROM conversation_summaries WHERE user_id = $1
+            ), deleted_documents AS (
+                DELETE FROM document_chunks WHERE user_id = $1
+            ), deleted_conversations AS (
+                DELETE FROM conversations WHERE user_id = $1
+                RETURNING attachment_id
+            )
+            DELETE FROM attachments
+            WHERE attachment_id IN (SELECT attachment_id FROM deleted_conversations)
+              AND NOT EXISTS (
+                  SELECT 1 FROM conversations
+                  WHERE conversations.attachment_id = attachments.attachment_id
+                    AND conversations.user_id <> $1
+              )
+            ''',
+            user_id
+        )
+
+    async def get_serialized_conversation_list(self, user_id: int) -> list[ConversationDataType]:
+        """
+        Get a list of all conversations for a user in serialized format.
+        """
+        conversation_records = await self.fetch(
+            '''
+            SELECT role, message FROM conversations
+            WHERE user_id = $1
+            ORDER BY created_at
+            ''',
+            user_id
+        )
+        return [self._serialize(conversation_record) for conversation_record in conversation_records]
+
+    async def get_recent_conversation_list(self, user_id: int, limit: int) -> list[RecentConversationDataType]:
+        """
+        Get the newest ``limit`` conversation entries of a user in chronological order,
+        including their stored token counts and attachment ids. Entries already folded
+        into the conversation summary are skipped.
+        """
+        conversation_records = await self.fetch(
+            '''
+            SELECT role, message, token_count, attachment_id FROM (
+                SELECT role, message, token_count, attachment_id, created_at FROM conversations
+                WHERE user_id = $1
+                  AND created_at > COALESCE(
+                      (SELECT summarized_until FROM conversation_summaries WHERE user_id = $1),
+                      '-infinity'::timestamp
+                  )
+                ORDER BY created_at DESC
+                LIMIT $2
+            ) AS recent_conversations
+            ORDER BY created_at
+            ''',
+            user_id, limit
+        )
+        return [
+            RecentConversationDataType(
+                **self._serialize(conversation_record),
+                token_count=conversation_record["token_count"],
+                attachment_id=conversation_record["attachment_id"]
+            )
+            for conversation_record in conversation_records
+        ]
+
+    async def get_conversation_summary(self, user_id: int) -> ConversationSummaryDataType | None:
+        """
+        Get the rolling summary of the older part of a user's conversation, if any.
+        """
+        summary_record = await self.fetchrow(
+            '''
+            SELECT summary, summarized_until, token_count FROM conversation_summaries
+            WHERE user_id = $1
+            ''',
+            user_id
+        )
+        if summary_record is None:
+            return None
+        return ConversationSummaryDataType(
+            summary=summary_record["summary"],
+            summarized_until=summary_record["summarized_until"],
+            token_count=summary_record["token_count"]
+        )
@@ -0,0 +1,59 @@
+import asyncpg
+
+from data_types.database import DocumentChunkDataType
+from database.async_base import AsyncDatabase
+from exceptions.database import RelatedRecordDoesNotExist
+
+
+class AsyncDocument(AsyncDatabase):
+    """
+    Asynchronous repository for the chunks of documents uploaded by users.
+    """
+
+    def _serialize(self, chunk_record: asyncpg.Record) -> DocumentChunkDataType:
+        """
+        Convert a document chunk record to a structured dictionary.
+        """
+        try:
+            return DocumentChunkDataType(
+                file_name=chunk_record["file_name"],
+                chunk_index=chunk_record["chunk_index"],
+                content=chunk_record["content"],
+                token_count=chunk_record["token_count"]
+            )
+        except (KeyError, IndexError) as e:
+            raise ValueError("Document chunk record does not contain the required columns") from e
+
+    async def add_document_chunks(self, user_id: int, file_unique_id: str, file_name: str | None,
+                                  chunks: list[str], token_counts: list[int]) -> None:
+        """
+        Store the chunks of a document, replacing the chunks of an earlier upload of the same file.
+        """
+        try:
+            await self.execute(
+                '''
+                WITH deleted_chunks AS (
+                    DELETE FROM document_chunks WHERE user_id = $1 AND file_unique_id = $2
+                )
+                INSERT INTO document_chunks (user_id, file_unique_id, file_name, chunk_index, content, token_count)
+                SELECT $1, $2, $3, chunk.chunk_number - 1, chunk.content, chunk.token_count
+                FROM unnest($4::text[], $5::integer[]) WITH ORDINALITY AS chunk(content, token_count, chunk_number)
+                ''',
+                user_id, file_unique_id, file_name, chunks, token_counts
+            )
+        except asyncpg.ForeignKeyViolationError:
+            raise RelatedRecordDoesNotExist(f"User with user_id {user_id} does not exist in the database.")
+
+    async def get_document_chunk_list(self, user_id: int) -> list[DocumentChunkDataType]:
+        """
+        Get the chunks of every document of a user, oldest document first and in document order.
+        """
+        chunk_records = await self.fetch(
+            '''
+            SELECT file_name, chunk_index, content, token_count FROM document_chunks
+            WHERE user_id = $1
+            ORDER BY created_at, file_unique_id, chunk_index
+            ''',
+            user_id
+        )
+        return [self._serialize(chunk_record) for chunk_record in chunk_records]
@@ -0,0 +1,106 @@
+import asyncpg
+
+from data_types.database import UserDataType
+from database.async_base import AsyncDatabase
+from exceptions.database import (
+    UserAlreadyExistsError,
+    UserDoesNotExist,
+)
+
+
+class AsyncUser(AsyncDatabase):
+    """
+    Asynchronous repository for managing users.
+    """
+
+    def _serialize(self, user_record: asyncpg.Record) -> UserDataType:
+        """
+        Convert a user record to a structured dictionary.
+        """
+        try:
+            return {
+                "user_id": user_record["user_id"],
+                "telegram_id": user_record["telegram_id"],
+                "username": user_record["username"],
+                "first_name": user_record["first_name"],
+                "last_name": user_record["last_name"],
+                "created_at": str(user_record["created_at"]),
+                "language": user_record["language"]
+            }
+        except (KeyError, IndexError) as e:
+            raise ValueError("User record does not contain the required columns") from e
+        except TypeError as e:
+            raise ValueError("Invalid data type encountered while processing user data") from e
+
+    async def get_serialized_user_list(self) -> list[UserDataType]:
+        """
+        Get a list of all users in serialized format.
+        """
+        user_records = await self.fetch('SELECT * FROM users')
+        return [self._serialize(user_record) for user_record in user_records]
+
+    async def get_serialized_user(self, telegram_id: int) -> UserDataType:
+        """
+        Get serialized user data by telegram ID.
+        """
+        user_record = await self.fetchrow('SELECT * FROM users WHERE telegram_id = $1', telegram_id)
+        if not user_record:
+            raise UserDoesNotExist(f"User with telegram_id {telegram_id} does not exist")
+        return self._serialize(user_record)
+
+    async def get_user_id(self, telegram_id: int) -> int:
+        """
+        Get the internal user ID by telegram ID.
+        """
+        user_id = await self.fetchval('SELECT user_id FROM users WHERE telegram_id = $1', telegram_id)
+        if user_id is None:
+            raise UserDoesNotExist(f"User with telegram_id {telegram_id} does not exist")
+        return user_id
+
+    async def add_user(self,
+                       telegram_id: int,
+                       username: str,
+                       first_name: str,
+                       last_name: str,
+                       language: str) -> UserDataType:
+        """
+        Add a new user to the database and return the stored row.
+        """
+        try:
+            user_record = await self.fetchrow(
+                '''
+                INSERT INTO users (
+                    telegram_id,
+                    username,
+                    first_name,
+                    last_name,
+                    language
+                )
+                VALUES ($1, $2, $3, $4, $5)
+                RETURNING *
+                ''',
+                telegram_id, username, first_name, last_name, language
+            )
+        except asyncpg.UniqueViolationError:
+            raise UserAlreadyExistsError(f"User with telegram_id {telegram_id} already exists")
+        return self._serialize(user_record)
+
+    async def user_exists(self, telegram_id: int) -> bool:
+        """
+        Check if a user exists by telegram ID.
+        """
+        return await self.fetchval(
+            'SELECT EXISTS(SELECT 1 FROM users WHERE telegram_id = $1)',
+            telegram_id
+        )
+
+    async def update_user_language(self, telegram_id: int, new_language: str) -> None:
+        """
+        Update a user's language preference.
+        """
+        status = await self.execute(
+            'UPDATE users SET language = $1 WHERE telegram_id = $2',
+            new_language, telegram_id
+        )
+        if status == "UPDATE 0":
+            raise UserDoesNotExist(f"User with telegram_id {telegram_id} does not exist")
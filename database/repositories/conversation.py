@@ -1,13 +1,19 @@
 from psycopg2 import DataError, OperationalError
-from data_types.database import ConversationDataType
+from config.constants import OPENAI_TEXT_MODEL
+from data_types.database import (
+    ConversationDataType,
+    ConversationSummaryDataType,
+    TokenizedConversationDataType,
+    UserDataType,
+)
 from database.base import Database
 from exceptions.database import (
-    UserDoesNotExist,
     RelatedRecordDoesNotExist,
     DBError,
     DataTypeError,
 )
-from services.database.user_database_services import get_user_id_by_telegram_id
+from services.database.user_database_services import user_cache
+from utils.common.token_common_utils import count_tokens
 
 
 class Conversation(Database):
@@ -40,12 +46,23 @@ class Conversation(Database):
     def _get_user_id(self, telegram_id: int) -> int:
         """
         Get the internal user ID by telegram ID.
+
+        A cache miss is resolved on this repository's connection; borrowing a second one
+        from the pool while holding this one could deadlock callers once the pool is exhausted.
         """
-        try:
-            user_id: int = get_user_id_by_telegram_id(telegram_id)
-            return user_id
-        except UserDoesNotExist:
+        cached_user_data: UserDataType | None = user_cache.get(telegram_id)
+        if cached_user_data is not None:
+            return cached_user_data["user_id"]
+
+        cursor = self.execute_query(
+            "SELECT user_id FROM users WHERE telegram_id = %s",
+            (telegram_id,)
+        )
+        user_id = cursor.fetchone()
+        cursor.close()
+        if not user_id:
             raise RelatedRecordDoesNotExist(f"User with telegram_id {telegram_id} does not exist in the database.")
+        return user_id[0]
 
     def add_conversation(self, telegram_id: int, role: str, message: str) -> None:
         """
@@ -59,10 +76,10 @@ class Conversation(Database):
         try:
             cursor = self.execute_query(
                 '''
-                INSERT INTO conversations (user_id, role, message)
-                VALUES (%s, %s, %s)
+                INSERT INTO conversations (user_id, role, message, token_count)
+                VALUES (%s, %s, %s, %s)
                 ''',
-                (user_id, role, message)
+                (user_id, role, message, count_tokens(message, OPENAI_TEXT_MODEL))
             )
             cursor.close()
             self.commit()
@@ -80,7 +97,8 @@ class Conversation(Database):
 
     def delete_all_conversations(self, telegram_id: int) -> None:
         """
-        Delete all conversation entries for a user.
+        Delete all conversation entries for a user together with the attachments
+        no other user's entry refers to.
         """
         try:
             user_id: int = self._get_user_id(telegram_id)
@@ -89,8 +107,24 @@ class Conversation(Database):
 
         try:
             cursor = self.execute_query(
-                'DELETE FROM conversations WHERE user_id = %s',
-                (user_id,)
+                '''
+                WITH deleted_summary AS (
+                    DELETE FROM conversation_summaries WHERE user_id = %s
+                ), deleted_documents AS (
+                    DELETE FROM document_chunks WHERE user_id = %s
+                ), deleted_conversations AS (
+                    DELETE FROM conversations WHERE user_id = %s
+                    RETURNING attachment_id
+                )
+                DELETE FROM attachments
+                WHERE attachment_id IN (SELECT attachment_id FROM deleted_conversations)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM conversations
+                      WHERE conversations.attachment_id = attachments.attachment_id
+                        AND conversations.user_id <> %s
+                  )
+                ''',
+                (user_id, user_id, user_id, user_id)
             )
             cursor.close()
             self.commit()
@@ -161,4 +195,109 @@ class Conversation(Database):
         except RelatedRecordDoesNotExist:
             raise
         except (DBError, DataTypeError):
-            raise
\ No newline at end of file
+            raise
+
+    def get_conversation_summary(self, user_id: int) -> ConversationSummaryDataType | None:
+        """
+        Get the rolling summary of the older part of a user's conversation, if any.
+        """
+        try:
+            cursor = self.execute_query(
+                '''
+                SELECT summary, summarized_until, token_count FROM conversation_summaries
+                WHERE user_id = %s
+                ''',
+                (user_id,)
+            )
+            summary_data_raw: tuple[any, ...] | None = cursor.fetchone()
+            cursor.close()
+        except OperationalError as e:
+            self.rollback()
+            raise DBError(
+                f"Internal database error occurred while getting the conversation summary of the user with user_id {user_id}: {str(e)}")
+        except Exception as e:
+            self.rollback()
+            raise DBError(f"Error retrieving conversation summary: {str(e)}")
+        finally:
+            self.commit()
+
+        if summary_data_raw is None:
+            return None
+        return ConversationSummaryDataType(
+            summary=summary_data_raw[0],
+            summarized_until=summary_data_raw[1],
+            token_count=summary_data_raw[2]
+        )
+
+    def get_unsummarized_conversation_list(self, user_id: int,
+                                           keep_recent: int) -> list[tuple[TokenizedConversationDataType, any]]:
+        """
+        Get the conversation entries that are not in the summary yet, except the
+        newest ``keep_recent`` ones, in chronological order. Every entry is paired
+        with its ``created_at`` so the caller can advance ``summarized_until``.
+        """
+        try:
+            cursor = self.execute_query(
+                '''
+                SELECT role, message, token_count, created_at FROM conversations
+                WHERE user_id = %s
+                  AND created_at > COALESCE(
+                      (SELECT summarized_until FROM conversation_summaries WHERE user_id = %s),
+                      '-infinity'::timestamp
+                  )
+                ORDER BY created_at DESC
+                OFFSET %s
+                ''',
+                (user_id, user_id, keep_recent)
+            )
+            conversations: list[tuple[any, ...]] = cursor.fetchall()
+            cursor.close()
+        except OperationalError as e:
+            self.rollback()
+            raise DBError(
+                f"Internal database error occurred while getting unsummarized conversations of the user with user_id {user_id}: {str(e)}")
+        except Exception as e:
+            self.rollback()
+            raise DBError(f"Error retrieving unsummarized conversations: {str(e)}")
+        finally:
+            self.commit()
+
+        return [
+            (
+                TokenizedConversationDataType(**self._serialize(conversation_data_raw),
+                                              token_count=conversation_data_raw[2]),
+                conversation_data_raw[3]
+            )
+            for conversation_data_raw in reversed(conversations)
+        ]
+
+    def save_conversation_summary(self, user_id: int, summary: str, summarized_until: any) -> None:
+        """
+        Create or replace the conversation summary of a user.
+        """
+        try:
+            cursor = self.execute_query(
+                '''
+                INSERT INTO conversation_summaries (user_id, summary, summarized_until, token_count)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (user_id) DO UPDATE SET
+                    summary = EXCLUDED.summary,
+                    summarized_until = EXCLUDED.summarized_until,
+                    token_count = EXCLUDED.token_count,
+                    updated_at = CURRENT_TIMESTAMP
+                ''',
+                (user_id, summary, summarized_until, count_tokens(summary, OPENAI_TEXT_MODEL))
+            )
+            cursor.close()
+            self.commit()
+        except DataError as e:
+            self.rollback()
+            raise DataTypeError(
+                f"Wrong data type was passed while saving the conversation summary of the user with user_id {user_id}: {str(e)}")
+        except OperationalError as e:
+            self.rollback()
+            raise DBError(
+                f"Internal database error occurred while saving the conversation summary of the user with user_id {user_id}: {str(e)}")
+        except Exception as e:
+            self.rollback()
+            raise DBError(f"Error saving conversation summary: {str(e)}")
@@ -4,15 +4,17 @@ from typing import Callable, Any, Dict
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import Message
 
-from services.database.user_database_services import get_user_language
+from api.telegram.outbound import STATUS_PRIORITY
+
+from services.database.async_user_database_services import get_user_language
 from templates.message_templates import get_processing_message
 
 
 class StatusMessageManager:
     """Manages status messages for long-running operations with duplicate prevention."""
 
-    def __init__(self, bot):
-        self.bot = bot
+    def __init__(self, outbound_queue):
+        self.outbound_queue = outbound_queue
         self._status_cache = {}  # Cache to track current status message text
 
     async def with_status_updates(self,
@@ -24,10 +26,11 @@ class StatusMessageManager:
         Execute a function with status updates at each defined step.
         """
         telegram_id = message.from_user.id
-        user_language = get_user_language(telegram_id)
+        user_data = kwargs.get("user_data")
+        user_language = user_data["language"] if user_data else await get_user_language(telegram_id)
         # Send initial status message
         initial_status = list(status_steps.values())[0] if status_steps else get_processing_message(user_language)
-        status_message = await message.reply(initial_status)
+        status_message = await self.outbound_queue.reply(message, initial_status)
         status_message_id = status_message.message_id
 
         # Initialize cache entry for this message
@@ -86,11 +89,8 @@ class StatusMessageManager:
             return False
 
         try:
-            await self.bot.edit_message_text(
-                chat_id=chat_id,
-                message_id=message_id,
-                text=text
-            )
+            # Status edits yield to interactive replies, and queued ones for the same message are merged
+            await self.outbound_queue.edit_message_text(chat_id, message_id, text, priority=STATUS_PRIORITY)
             # Update cache
             self._status_cache[cache_key] = text
             return True
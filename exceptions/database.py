@@ -185,3 +185,28 @@ class NoRecordsFound(Exception):
             absence of records in the database. Defaults to "No additional message".
         """
         super().__init__(f"No records found on database ({message})")
+
+
+class ConnectionPoolError(Exception):
+    """
+    Exception raised when a connection cannot be borrowed from the pool.
+
+    This exception is used when the pool is closed or otherwise unable to
+    hand out a database connection.
+    """
+
+    def __init__(self, message: str = "No additional message"):
+        """
+        Initialize the custom ConnectionPoolError exception object.
+
+        :param message: Additional error message.
+        :type message: str
+        """
+        super().__init__(f"Could not get a connection from the pool ({message})")
+
+
+class ConnectionPoolTimeoutError(ConnectionPoolError):
+    """
+    Exception raised when every pooled connection stays busy for longer
+    than the configured checkout timeout.
+    """
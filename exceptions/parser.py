@@ -0,0 +1,13 @@
+class DocumentTooLargeError(Exception):
+    """
+    Exception raised when a document exceeds the size the parser accepts.
+    """
+
+    def __init__(self, message: str = "No additional message"):
+        """
+        Initialize the custom DocumentTooLargeError exception object.
+
+        :param message: Additional error message.
+        :type message: str
+        """
+        super().__init__(f"The document is too large to be parsed ({message})")
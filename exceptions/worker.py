@@ -0,0 +1,22 @@
+class WorkerError(Exception):
+    """
+    Exception raised when a job could not be completed by a worker process.
+
+    This covers a crashed or broken process pool as well as a pool that was
+    already shut down when the job was submitted.
+    """
+
+    def __init__(self, message: str = "No additional message"):
+        """
+        Initialize the custom WorkerError exception object.
+
+        :param message: Additional error message.
+        :type message: str
+        """
+        super().__init__(f"Something went wrong while running a job in a worker process ({message})")
+
+
+class WorkerTimeoutError(WorkerError):
+    """
+    Exception raised when a job does not finish within its timeout.
+    """
@@ -5,6 +5,8 @@ from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_applicati
 from aiohttp import web
 from bot.bot import admin_router, user_router
 from bot.middlewares.auth_middleware import auth_middleware
+from config.integrations import outbound_queue, ocr_engine, document_engine, openai_client
+from database.async_base import get_async_pool, close_async_pool
 from config.constants import (
     BASE_WEBHOOK_URL,
     WEBHOOK_PATH,
@@ -46,6 +48,12 @@ def main() -> None:
     dp.include_router(user_router)
     dp.include_router(admin_router)
     dp.update.outer_middleware(auth_middleware)
+    dp.startup.register(get_async_pool)
+    dp.shutdown.register(close_async_pool)
+    dp.shutdown.register(outbound_queue.close)
+    dp.shutdown.register(ocr_engine.shutdown)
+    dp.shutdown.register(document_engine.shutdown)
+    dp.shutdown.register(openai_client.close)
 
     # Create Aiohttp web application
     app = web.Application()
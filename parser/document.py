@@ -1,100 +1,251 @@
 import os
-from typing import Optional, Dict, Callable
+import sys
+import time
+from typing import BinaryIO, Optional, Dict, Callable, Iterable, Iterator
 import PyPDF2
 from docx import Document
 
+from exceptions.parser import DocumentTooLargeError
+from utils.common.text_common_utils import DOCUMENT_TEXT_NORMALIZER
+from utils.common.token_common_utils import count_tokens, truncate_to_tokens
+
+# Documents without real pages (.docx, .txt) are split into sections of about this many characters.
+SECTION_SIZE: int = 3000
+
+
+class DocumentLimits:
+    """
+    Limits applied while a document is parsed; None disables a limit.
+    """
+
+    def __init__(self,
+                 max_bytes: Optional[int] = None,
+                 max_pages: Optional[int] = None,
+                 max_seconds: Optional[float] = None,
+                 max_tokens: Optional[int] = None,
+                 token_model: str = "gpt-4o-mini"):
+        """
+        :param max_bytes: Largest file accepted at all.
+        :type max_bytes: Optional[int]
+        :param max_pages: Pages (sections for formats without pages) read at most.
+        :type max_pages: Optional[int]
+        :param max_seconds: No further section is read once this time ran out.
+        :type max_seconds: Optional[float]
+        :param max_tokens: Token budget of the extracted text, the last section is cut to fit.
+        :type max_tokens: Optional[int]
+        :param token_model: Model whose tokenizer counts the budget.
+        :type token_model: str
+        """
+        self.max_bytes: Optional[int] = max_bytes
+        self.max_pages: Optional[int] = max_pages
+        self.max_seconds: Optional[float] = max_seconds
+        self.max_tokens: Optional[int] = max_tokens
+        self.token_model: str = token_model
+
 
 class DocumentParser:
     """
     A class to parse content from various document formats.
     """
 
-    def __init__(self):
+    def __init__(self, limits: Optional[DocumentLimits] = None):
         """
         Initialize the DocumentParser with supported file handlers.
+
+        :param limits: Limits applied to every parsed document, none by default
+        :type limits: Optional[DocumentLimits]
         """
-        # Register supported file handlers
-        self.handlers: Dict[str, Callable] = {
+        self.limits: DocumentLimits = limits or DocumentLimits()
+        # Register supported file handlers; each yields the document's sections lazily
+        self.handlers: Dict[str, Callable[[BinaryIO, range], Iterator[str]]] = {
             'docx': self._parse_docx,
             'pdf': self._parse_pdf,
             'txt': self._parse_txt
         }
 
-    def parse_document(self, file_path: str) -> Optional[str]:
+    def parse_document(self, file: str | BinaryIO, file_name: Optional[str] = None,
+                       pages: Optional[range] = None) -> Optional[str]:
         """
         Parse content from a document file.
 
-        :param file_path: Path to the document file
-        :type file_path: str
+        :param file: Path to the document file or a binary stream with its content
+        :type file: str | BinaryIO
+        :param file_name: Original file name, required to detect the format of a stream
+        :type file_name: Optional[str]
+        :param pages: Pages to read, all of them by default
+        :type pages: Optional[range]
         :return: The text content of the document or None if parsing failed
         :rtype: Optional[str]
+        :raises DocumentTooLargeError: If the file exceeds the size limit
         """
-        if not os.path.exists(file_path):
-            return None
-
-        try:
-            # Extract file extension
-            _, extension = os.path.splitext(file_path)
-            extension = extension.lower().lstrip('.')
-
-            # Check if file type is supported
-            if extension not in self.handlers:
+        if isinstance(file, str):
+            if not os.path.exists(file):
                 return None
+            file_name = file_name or file
 
-            # Process file using the appropriate handler
-            return self.handlers[extension](file_path)
+        # Check if file type is supported
+        if self._get_extension(file_name) not in self.handlers:
+            return None
 
+        try:
+            return "\n".join(self.iter_document(file, file_name, pages))
+        except DocumentTooLargeError:
+            raise
         except Exception:
             return None
 
-    def _parse_docx(self, file_path: str) -> str:
+    def iter_document(self, file: str | BinaryIO, file_name: Optional[str] = None,
+                      pages: Optional[range] = None) -> Iterator[str]:
+        """
+        Yield the normalized text of a document section by section while the limits allow.
+
+        PDF sections are pages and are only extracted when they are reached; other formats are
+        split into sections of about ``SECTION_SIZE`` characters. When a page, time or token
+        limit stops parsing early, a last section says so, so that the reader of the text (the
+        model) knows it is incomplete. Unsupported formats yield nothing.
+
+        :param file: Path to the document file or a binary stream with its content
+        :type file: str | BinaryIO
+        :param file_name: Original file name, required to detect the format of a stream
+        :type file_name: Optional[str]
+        :param pages: Pages to read (zero-based, step 1), all of them by default
+        :type pages: Optional[range]
+        :return: Iterator over non-empty sections
+        :rtype: Iterator[str]
+        :raises DocumentTooLargeError: If the file exceeds the size limit
+        """
+        if isinstance(file, str):
+            if not os.path.exists(file):
+                return
+            file_name = file_name or file
+
+        # Check if file type is supported
+        extension = self._get_extension(file_name)
+        if extension not in self.handlers:
+            return
+
+        if isinstance(file, str):
+            with open(file, 'rb') as stream:
+                yield from self._iter_stream(stream, extension, pages)
+        else:
+            yield from self._iter_stream(file, extension, pages)
+
+    def _iter_stream(self, stream: BinaryIO, extension: str, pages: Optional[range]) -> Iterator[str]:
+        limits = self.limits
+        size = stream.seek(0, os.SEEK_END)
+        stream.seek(0)
+        if limits.max_bytes is not None and size > limits.max_bytes:
+            raise DocumentTooLargeError(f"{size} bytes, the limit is {limits.max_bytes}")
+
+        start = pages.start if pages else 0
+        stop = pages.stop if pages else sys.maxsize
+        page_limited = limits.max_pages is not None and stop - start > limits.max_pages
+        if page_limited:
+            stop = start + limits.max_pages
+
+        started_at = time.monotonic()
+        tokens_left = limits.max_tokens
+        # One page past a page limit is requested only to learn whether the document goes on
+        sections = self.handlers[extension](stream, range(start, stop + 1 if page_limited else stop))
+        for page_number, section in enumerate(sections, start):
+            if page_number == stop:
+                yield self._get_truncation_note(f"only {limits.max_pages} pages are read")
+                return
+            if (limits.max_seconds is not None and page_number > start
+                    and time.monotonic() - started_at > limits.max_seconds):
+                yield self._get_truncation_note(f"only {page_number - start} pages were read in time")
+                return
+
+            section = DOCUMENT_TEXT_NORMALIZER.normalize(section)
+            if section and tokens_left is not None:
+                section_tokens = count_tokens(section, limits.token_model)
+                if section_tokens > tokens_left:
+                    section = truncate_to_tokens(section, tokens_left, limits.token_model)
+                    if section:
+                        yield section
+                    yield self._get_truncation_note(f"the text stops within page {page_number + 1}")
+                    return
+                tokens_left -= section_tokens
+            if section:
+                yield section
+
+    @staticmethod
+    def _get_extension(file_name: Optional[str]) -> str:
+        _, extension = os.path.splitext(file_name or "")
+        return extension.lower().lstrip('.')
+
+    @staticmethod
+    def _get_truncation_note(reason: str) -> str:
+        return f"[The document is longer than shown: {reason}.]"
+
+    @staticmethod
+    def _group_lines(lines: Iterable[str], pages: range) -> Iterator[str]:
+        """
+        Group lines into sections of about ``SECTION_SIZE`` characters and yield those in ``pages``.
+        """
+        section: list[str] = []
+        section_size = 0
+        page_number = 0
+        for line in lines:
+            section.append(line)
+            section_size += len(line) + 1
+            if section_size >= SECTION_SIZE:
+                if page_number >= pages.stop:
+                    return
+                if page_number >= pages.start:
+                    yield "\n".join(section)
+                section, section_size = [], 0
+                page_number += 1
+        if section and pages.start <= page_number < pages.stop:
+            yield "\n".join(section)
+
+    def _parse_docx(self, stream: BinaryIO, pages: range) -> Iterator[str]:
         """
         Parse content from a .docx file.
 
-        :param file_path: Path to the .docx file
-        :type file_path: str
-        :return: Text content of the document
-        :rtype: str
+        :param stream: Binary stream with the .docx content
+        :type stream: BinaryIO
+        :param pages: Sections to yield
+        :type pages: range
+        :return: Text of the requested sections
+        :rtype: Iterator[str]
         :raises: Various exceptions from the docx library
         """
-        doc = Document(file_path)
-        return "\n".join(paragraph.text for paragraph in doc.paragraphs)
+        doc = Document(stream)
+        yield from self._group_lines((paragraph.text for paragraph in doc.paragraphs), pages)
 
-    def _parse_pdf(self, file_path: str) -> str:
+    def _parse_pdf(self, stream: BinaryIO, pages: range) -> Iterator[str]:
         """
-        Parse content from a .pdf file.
-
-        :param file_path: Path to the .pdf file
-        :type file_path: str
-        :return: Text content of the PDF
-        :rtype: str
+        Parse content from a .pdf file, extracting each page only when it is reached.
+
+        :param stream: Binary stream with the .pdf content
+        :type stream: BinaryIO
+        :param pages: Pages to yield
+        :type pages: range
+        :return: Text of the requested pages
+        :rtype: Iterator[str]
         :raises: PyPDF2.errors.PdfReadError: If there are issues reading the PDF
         """
-        text = []
-
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text.append(page.extract_text())
-
-        return "\n".join(text)
+        pdf_reader = PyPDF2.PdfReader(stream)
+        for page_num in range(len(pdf_reader.pages))[pages.start:pages.stop]:
+            yield pdf_reader.pages[page_num].extract_text()
 
-    def _parse_txt(self, file_path: str) -> str:
+    def _parse_txt(self, stream: BinaryIO, pages: range) -> Iterator[str]:
         """
         Parse content from a .txt file.
 
-        :param file_path: Path to the .txt file
-        :type file_path: str
-        :return: Text content of the file
-        :rtype: str
+        :param stream: Binary stream with the .txt content
+        :type stream: BinaryIO
+        :param pages: Sections to yield
+        :type pages: range
+        :return: Text of the requested sections
+        :rtype: Iterator[str]
         :raises: IOError: If there are issues reading the file
-        :raises: UnicodeDecodeError: If the file cannot be decoded with the specified encoding
         """
+        content = stream.read()
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
+            text = content.decode('utf-8')
         except UnicodeDecodeError:
             # Try alternative encodings if UTF-8 fails
-            with open(file_path, 'r', encoding='latin-1') as file:
-                return file.read()
+            text = content.decode('latin-1')
+        yield from self._group_lines(text.splitlines(), pages)
@@ -1,68 +1,237 @@
+import asyncio
+import hashlib
 import json
 from typing import BinaryIO
 
+from config.constants import (
+    OPENAI_TEXT_MODEL,
+    RESPONSE_MAX_TOKENS,
+    CONVERSATION_SUMMARY_KEEP_RECENT,
+    CONVERSATION_SUMMARY_MAX_TOKENS,
+    DOCUMENT_SUMMARY_CHUNK_TOKENS,
+    DOCUMENT_SUMMARY_MAX_TOKENS,
+    DOCUMENT_SUMMARY_CONCURRENCY,
+)
 from config.integrations import text_processor, audio_processor
-from services.database.conversation_database_services import get_conversation_list
-from services.database.user_database_services import get_user_language
-
-
-def get_text_response(context: list, user_language: str = "en"):
-    stream = text_processor.generate_text_response(
-        messages=[{
-            "role": "developer",
-            "content": (
-                f"You are **Bilag'on**, an intelligent and highly capable assistant. "
-                f"Your primary goal is to provide clear, concise, and insightful responses in {user_language} language. "
-                f"You can process and analyze various types of media, including:\n\n"
-                f"- **Images**: Extract and interpret text accurately.\n"
-                f"- **Voice Messages**: Transcribe audio to text and respond meaningfully.\n"
-                f"- **Documents (TXT, DOCX, PDF)**: Retrieve and analyze document content.\n"
-                f"- **Text Messages**: Understand and respond to user queries effectively.\n\n"
-                f"Always prioritize accuracy, clarity, and usefulness in your responses."
-            )
-        }] + context,
+from data_types.database import (
+    UserDataType,
+    ConversationDataType,
+    ConversationSummaryDataType,
+    DocumentChunkDataType,
+)
+from services.database.async_conversation_database_services import (
+    get_recent_conversation_list,
+    get_conversation_window_size,
+)
+from services.cache.media_cache_services import get_cached_media_result, cache_media_result
+from services.database import conversation_database_services
+from utils.api.openai_api_utils import (
+    build_prompt_messages,
+    get_message_token_count,
+    get_model_context_size,
+    get_summary_message,
+    get_document_context_message,
+)
+from utils.common.token_common_utils import split_text_into_chunks
+
+
+async def get_text_response(context: list, user_language: str = "en"):
+    system_message = {
+        "role": "developer",
+        "content": (
+            f"You are **Bilag'on**, an intelligent and highly capable assistant. "
+            f"Your primary goal is to provide clear, concise, and insightful responses in {user_language} language. "
+            f"You can process and analyze various types of media, including:\n\n"
+            f"- **Images**: Extract and interpret text accurately.\n"
+            f"- **Voice Messages**: Transcribe audio to text and respond meaningfully.\n"
+            f"- **Documents (TXT, DOCX, PDF)**: Retrieve and analyze document content.\n"
+            f"- **Text Messages**: Understand and respond to user queries effectively.\n\n"
+            f"Always prioritize accuracy, clarity, and usefulness in your responses."
+        )
+    }
+    stream = await text_processor.async_generate_text_response(
+        messages=build_prompt_messages(context, OPENAI_TEXT_MODEL, RESPONSE_MAX_TOKENS, system_message),
+        model=OPENAI_TEXT_MODEL,
         stream=True,
-        max_tokens=2000
+        max_tokens=RESPONSE_MAX_TOKENS
     )
     return stream
 
 
-def get_text_response_in_incognito_mode(user_message: str, user_language: str = "en"):
-    stream = get_text_response([{"role": "user", "content": user_message}], user_language)
-    for chunk in stream:
-        if chunk.choices[0].delta.content is not None and chunk.choices[0].delta.content != "":
+async def get_text_response_in_incognito_mode(user_message: str, user_language: str = "en"):
+    stream = await get_text_response([{"role": "user", "content": user_message}], user_language)
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
             yield chunk.choices[0].delta.content
 
 
-def get_text_response_with_context(conversation_list: list, user_language: str = "en"):
-    stream = get_text_response(conversation_list, user_language)
-    for chunk in stream:
-        if chunk.choices[0].delta.content is not None and chunk.choices[0].delta.content != "":
+async def get_text_response_with_context(conversation_list: list,
+                                         user_language: str = "en",
+                                         summary: ConversationSummaryDataType | None = None,
+                                         document_chunks: list[DocumentChunkDataType] | None = None):
+    if document_chunks:
+        # Right before the question, so the chunks are the last thing dropped when the context is full
+        conversation_list = conversation_list[:-1] + [
+            get_document_context_message(document_chunks, OPENAI_TEXT_MODEL)
+        ] + conversation_list[-1:]
+    if summary is not None:
+        conversation_list = [get_summary_message(summary, OPENAI_TEXT_MODEL)] + conversation_list
+    stream = await get_text_response(conversation_list, user_language)
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
             yield chunk.choices[0].delta.content
 
 
-def get_transcription_of_audio(audio_file: BinaryIO) -> str:
-    transcription = audio_processor.transcribe_audio(audio_file)
+def get_conversation_summary_text(previous_summary: str | None, conversation_list: list) -> str:
+    """
+    Ask the model for a summary that merges ``previous_summary`` with the given turns.
+    """
+    instructions = (
+        "You maintain a running summary of a conversation between a user and the assistant Bilag'on. "
+        "Merge the previous summary (if any) with the new messages into one concise summary written "
+        "in the language of the conversation. Keep facts, names, numbers, decisions, open questions "
+        "and user preferences; drop greetings and filler."
+    )
+    if previous_summary:
+        instructions += f"\n\nPrevious summary:\n{previous_summary}"
+    response = text_processor.generate_text_response(
+        messages=build_prompt_messages(
+            conversation_list + [{"role": "user", "content": "Summarize the conversation above."}],
+            OPENAI_TEXT_MODEL,
+            CONVERSATION_SUMMARY_MAX_TOKENS,
+            {"role": "developer", "content": instructions}
+        ),
+        model=OPENAI_TEXT_MODEL,
+        stream=False,
+        max_tokens=CONVERSATION_SUMMARY_MAX_TOKENS
+    )
+    return response.choices[0].message.content.strip()
+
+
+def summarize_conversation_history(user_id: int) -> None:
+    """
+    Fold every message of the user except the newest ``CONVERSATION_SUMMARY_KEEP_RECENT``
+    into the stored conversation summary.
+
+    Messages are summarized in batches that fit into the model context, and the summary is
+    saved after every batch, so an interrupted run never loses already summarized turns.
+    """
+    summary_data = conversation_database_services.get_conversation_summary(user_id)
+    summary: str | None = summary_data["summary"] if summary_data is not None else None
+    pending_list = conversation_database_services.get_unsummarized_conversation_list(
+        user_id, CONVERSATION_SUMMARY_KEEP_RECENT
+    )
+    # Room for the instructions, the previous summary and the new summary itself.
+    budget = get_model_context_size(OPENAI_TEXT_MODEL) - 3 * CONVERSATION_SUMMARY_MAX_TOKENS
+
+    batch: list[ConversationDataType] = []
+    batch_tokens = 0
+    for index, (message, created_at) in enumerate(pending_list):
+        message_tokens = get_message_token_count(message, OPENAI_TEXT_MODEL)
+        if batch and batch_tokens + message_tokens > budget:
+            summary = get_conversation_summary_text(summary, batch)
+            conversation_database_services.save_conversation_summary(user_id, summary, pending_list[index - 1][1])
+            batch, batch_tokens = [], 0
+        batch.append(message)
+        batch_tokens += message_tokens
+
+    if batch:
+        summary = get_conversation_summary_text(summary, batch)
+        conversation_database_services.save_conversation_summary(user_id, summary, pending_list[-1][1])
+
+
+async def get_document_summary_text(text: str, merge: bool = False) -> str:
+    """
+    Ask the model for a summary of one part of a document, or for one summary of the summaries of consecutive parts.
+    """
+    if merge:
+        instructions = (
+            "The text consists of summaries of consecutive parts of one document. Merge them into one "
+            "concise summary of the whole, written in the language of the document."
+        )
+    else:
+        instructions = (
+            "The text is a part of a longer document. Summarize it concisely in the language of the document. "
+            "Keep facts, names, numbers, dates, definitions and conclusions; drop repetition and filler."
+        )
+    response = await text_processor.async_generate_text_response(
+        messages=[
+            {"role": "developer", "content": instructions},
+            {"role": "user", "content": text}
+        ],
+        model=OPENAI_TEXT_MODEL,
+        stream=False,
+        max_tokens=DOCUMENT_SUMMARY_MAX_TOKENS
+    )
+    return response.choices[0].message.content.strip()
+
+
+async def _get_cached_document_summary_text(text: str, merge: bool, semaphore: asyncio.Semaphore) -> str:
+    # Summaries are keyed by their input, so equal parts of any document are summarized once
+    text_hash = f"{'merge' if merge else 'part'}:{hashlib.sha256(text.encode()).hexdigest()}"
+    summary = await get_cached_media_result("document_summary", text_hash)
+    if summary is None:
+        async with semaphore:
+            summary = await get_document_summary_text(text, merge)
+        await cache_media_result("document_summary", text_hash, summary)
+    return summary
+
+
+async def summarize_document(text: str) -> str:
+    """
+    Summarize a document of any length with a map-reduce over its parts.
+
+    Parts of ``DOCUMENT_SUMMARY_CHUNK_TOKENS`` are summarized concurrently, at most
+    ``DOCUMENT_SUMMARY_CONCURRENCY`` requests at a time, then the summaries are merged in groups
+    of the same size until one is left. Every summary is cached as soon as it is ready, so a run
+    that failed or timed out resumes from the parts it already finished.
+
+    :param text: Extracted text of the document.
+    :type text: str
+    :return: Summary of the whole document.
+    :rtype: str
+    """
+    semaphore = asyncio.Semaphore(DOCUMENT_SUMMARY_CONCURRENCY)
+    parts = await asyncio.to_thread(split_text_into_chunks, text, DOCUMENT_SUMMARY_CHUNK_TOKENS, OPENAI_TEXT_MODEL)
+    summaries = await asyncio.gather(*(_get_cached_document_summary_text(part, False, semaphore) for part in parts))
+    # A group must hold several summaries, otherwise merging would never get down to one
+    group_tokens = max(DOCUMENT_SUMMARY_CHUNK_TOKENS, 3 * DOCUMENT_SUMMARY_MAX_TOKENS)
+    while len(summaries) > 1:
+        groups = split_text_into_chunks("\n\n".join(summaries), group_tokens, OPENAI_TEXT_MODEL)
+        summaries = await asyncio.gather(*(_get_cached_document_summary_text(group, True, semaphore) for group in groups))
+    return summaries[0] if summaries else ""
+
+
+async def get_transcription_of_audio(audio_file: BinaryIO | bytes, file_name: str = "voice.ogg") -> str:
+    # The file name tells the API the audio format of an in-memory buffer
+    transcription = await audio_processor.async_transcribe_audio((file_name, audio_file))
     return transcription.text
 
 
-def get_structured_suggested_questions_with_context(telegram_id: int):
+async def get_structured_suggested_questions_with_context(user_data: UserDataType):
     try:
-        user_language = get_user_language(telegram_id)
-        conversation_list = get_conversation_list(telegram_id)
+        user_language = user_data["language"]
+        conversation_list = await get_recent_conversation_list(
+            user_data["user_id"], get_conversation_window_size(OPENAI_TEXT_MODEL)
+        )
         if not conversation_list:
             return []
         prompt = f"""
        Suggest three relevant follow-up questions I might want to ask next based on our conversation history. The response should be a JSON object with a single key, "questions", whose value is a list containing exactly three elements. Each element should be a concise and relevant question in {user_language} language.
         """
 
-        response = text_processor.generate_text_response(
-            conversation_list + [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
+        response = await text_processor.async_generate_text_response(
+            build_prompt_messages(
+                conversation_list + [
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                OPENAI_TEXT_MODEL,
+                max_tokens=500
+            ),
+            model=OPENAI_TEXT_MODEL,
             stream=False,
             response_format={"type": "json_object"}
         )
@@ -0,0 +1,40 @@
+import logging
+
+from config.constants import MEDIA_PIPELINE_VERSIONS
+from config.integrations import media_result_cache
+
+logger = logging.getLogger(__name__)
+
+# Cache stats are logged once per this many lookups.
+STATS_LOG_INTERVAL = 100
+
+_lookups = 0
+
+
+def build_media_cache_key(kind: str, file_unique_id: str, language: str | None = None) -> str:
+    """
+    Build the cache key of a media processing result.
+
+    :param kind: Pipeline that produced the result: ``ocr``, ``transcription`` or ``document``.
+    :type kind: str
+    :param file_unique_id: Telegram's identifier of the file content, equal for forwarded copies.
+    :type file_unique_id: str
+    :param language: Language the pipeline was run for, if it depends on one.
+    :type language: str | None
+    :return: Key that changes whenever the pipeline version changes.
+    :rtype: str
+    """
+    return f"{kind}:v{MEDIA_PIPELINE_VERSIONS[kind]}:{language or '-'}:{file_unique_id}"
+
+
+async def get_cached_media_result(kind: str, file_unique_id: str, language: str | None = None) -> str | None:
+    global _lookups
+    result = await media_result_cache.get(build_media_cache_key(kind, file_unique_id, language))
+    _lookups += 1
+    if _lookups % STATS_LOG_INTERVAL == 0:
+        logger.info(f"Media result cache stats: {media_result_cache.stats()}")
+    return result
+
+
+async def cache_media_result(kind: str, file_unique_id: str, result: str, language: str | None = None) -> None:
+    await media_result_cache.set(build_media_cache_key(kind, file_unique_id, language), result)
@@ -0,0 +1,54 @@
+from config.constants import CONVERSATION_WINDOW_SIZES, DEFAULT_CONVERSATION_WINDOW_SIZE
+from data_types.database import ConversationSummaryDataType
+from database.repositories.async_conversation import AsyncConversation
+from exceptions.database import DBError
+from exceptions.service import ServerError
+
+
+async def save_conversation(user_id: int, role: str, content: str, attachment: str | None = None) -> None:
+    try:
+        await AsyncConversation().add_conversation(user_id, role, content, attachment)
+    except DBError:
+        raise ServerError("Internal database error occurred while adding new conversation!")
+
+
+async def get_conversation_attachment(attachment_id: int) -> str | None:
+    try:
+        return await AsyncConversation().get_attachment(attachment_id)
+    except DBError:
+        raise ServerError("Internal database error occurred while getting conversation attachment!")
+
+
+async def get_conversation_list(user_id: int) -> list:
+    try:
+        return await AsyncConversation().get_serialized_conversation_list(user_id)
+    except DBError:
+        raise ServerError("Internal database error occurred while getting conversation list!")
+
+
+async def delete_all_user_conversations(user_id: int) -> None:
+    try:
+        await AsyncConversation().delete_all_conversations(user_id)
+    except DBError:
+        raise ServerError("Internal database error occurred while deleting conversations!")
+
+
+def get_conversation_window_size(model: str) -> int:
+    """
+    Return how many of the newest messages are sent to ``model`` as context.
+    """
+    return CONVERSATION_WINDOW_SIZES.get(model, DEFAULT_CONVERSATION_WINDOW_SIZE)
+
+
+async def get_recent_conversation_list(user_id: int, limit: int) -> list:
+    try:
+        return await AsyncConversation().get_recent_conversation_list(user_id, limit)
+    except DBError:
+        raise ServerError("Internal database error occurred while getting conversation list!")
+
+
+async def get_conversation_summary(user_id: int) -> ConversationSummaryDataType | None:
+    try:
+        return await AsyncConversation().get_conversation_summary(user_id)
+    except DBError:
+        raise ServerError("Internal database error occurred while getting conversation summary!")
@@ -0,0 +1,19 @@
+from data_types.database import DocumentChunkDataType
+from database.repositories.async_document import AsyncDocument
+from exceptions.database import DBError
+from exceptions.service import ServerError
+
+
+async def save_document_chunks(user_id: int, file_unique_id: str, file_name: str | None,
+                               chunks: list[str], token_counts: list[int]) -> None:
+    try:
+        await AsyncDocument().add_document_chunks(user_id, file_unique_id, file_name, chunks, token_counts)
+    except DBError:
+        raise ServerError("Internal database error occurred while saving document chunks!")
+
+
+async def get_document_chunk_list(user_id: int) -> list[DocumentChunkDataType]:
+    try:
+        return await AsyncDocument().get_document_chunk_list(user_id)
+    except DBError:
+        raise ServerError("Internal database error occurred while getting document chunks!")
@@ -0,0 +1,81 @@
+from aiogram.types import User as UserType
+
+from data_types.database import UserDataType
+from database.repositories.async_user import AsyncUser
+from exceptions.database import UserDoesNotExist
+from services.database.user_database_services import user_cache
+
+
+async def get_user_language(telegram_id: int) -> str:
+    """
+    This service gets serialized user data and returns language field.
+
+    :param telegram_id: Unique telegram identification of the user
+    :type telegram_id: int
+
+    :return: User's language preference
+    :rtype: str
+    """
+    user_data: UserDataType = await get_user_by_telegram_id(telegram_id)
+    return user_data["language"]
+
+
+async def get_user_by_telegram_id(telegram_id: int) -> UserDataType:
+    """
+    Retrieves a user's data using their Telegram ID without blocking the event loop.
+    Rows are served from ``user_cache`` when possible and stored there after a miss.
+
+    :param telegram_id: The unique identifier associated with a Telegram user
+    :type telegram_id: int
+    :return: User data corresponding to the specified Telegram ID
+    :rtype: UserDataType
+    :raises UserDoesNotExist: If no user exists with the given Telegram ID
+    :raises DBError: If there is a database-related error during query execution
+    :raises DataTypeError: If there is an error related to the data type of the returned user data
+    """
+    cached_user_data: UserDataType | None = user_cache.get(telegram_id)
+    if cached_user_data is not None:
+        return UserDataType(**cached_user_data)
+
+    user_data: UserDataType = await AsyncUser().get_serialized_user(telegram_id)
+    user_cache.set(telegram_id, user_data)
+    return UserDataType(**user_data)
+
+
+async def get_user_id_by_telegram_id(telegram_id: int) -> int:
+    """
+    Retrieve the user ID associated with a given Telegram ID without blocking the event loop.
+
+    :param telegram_id: The unique Telegram identifier for the user
+    :return: The ID of the user in the database system
+    :raises UserDoesNotExist: If no user is found with the given Telegram ID
+    :raises DBError: If there is an issue with database connectivity or query
+    :raises DataTypeError: If there is a data type mismatch in the retrieval process
+    """
+    user_data: UserDataType = await get_user_by_telegram_id(telegram_id)
+    return user_data["user_id"]
+
+
+async def update_user_language(telegram_id: int, language: str) -> None:
+    try:
+        await AsyncUser().update_user_language(telegram_id, language)
+    except UserDoesNotExist:
+        user_cache.delete(telegram_id)
+        raise
+    cached_user_data: UserDataType | None = user_cache.peek(telegram_id)
+    if cached_user_data is not None:
+        user_cache.set(telegram_id, UserDataType(**{**cached_user_data, "language": language}))
+
+
+async def add_new_user(data: UserType, language: str = 'en') -> UserDataType:
+    user_data: UserDataType = await AsyncUser().add_user(
+        data.id, data.username, data.first_name, data.last_name, language
+    )
+    user_cache.set(data.id, user_data)
+    return UserDataType(**user_data)
+
+
+async def user_exists(telegram_id: int) -> bool:
+    if user_cache.get(telegram_id) is not None:
+        return True
+    return await AsyncUser().user_exists(telegram_id)
@@ -1,3 +1,4 @@
+from data_types.database import ConversationSummaryDataType
 from database.repositories.conversation import Conversation
 from exceptions.database import RelatedRecordDoesNotExist, DataTypeError, DBError
 from exceptions.service import ServerError
@@ -51,4 +52,36 @@ def delete_all_user_conversations(telegram_id: int) -> None:
         conversation_db.close()
         raise ServerError("Internal database error occurred while adding new conversation!")
     finally:
-        conversation_db.close()
\ No newline at end of file
+        conversation_db.close()
+
+
+def get_conversation_summary(user_id: int) -> ConversationSummaryDataType | None:
+    conversation_db: Conversation = Conversation()
+    try:
+        return conversation_db.get_conversation_summary(user_id)
+    except DBError:
+        raise ServerError("Internal database error occurred while getting conversation summary!")
+    finally:
+        conversation_db.close()
+
+
+def get_unsummarized_conversation_list(user_id: int, keep_recent: int) -> list:
+    conversation_db: Conversation = Conversation()
+    try:
+        return conversation_db.get_unsummarized_conversation_list(user_id, keep_recent)
+    except DBError:
+        raise ServerError("Internal database error occurred while getting conversation list!")
+    finally:
+        conversation_db.close()
+
+
+def save_conversation_summary(user_id: int, summary: str, summarized_until) -> None:
+    conversation_db: Conversation = Conversation()
+    try:
+        conversation_db.save_conversation_summary(user_id, summary, summarized_until)
+    except DataTypeError:
+        raise
+    except DBError:
+        raise ServerError("Internal database error occurred while saving conversation summary!")
+    finally:
+        conversation_db.close()
@@ -1,9 +1,14 @@
 from psycopg2 import IntegrityError
 
+from config.constants import USER_CACHE_MAX_SIZE, USER_CACHE_TTL
 from data_types.database import UserDataType
 from database.repositories.user import User
 from exceptions.database import UserDoesNotExist, RelatedRecordDoesNotExist, DBError, DataTypeError
 from aiogram.types import User as UserType
+from utils.common.cache_common_utils import TTLCache
+
+# Process-wide cache of user rows keyed by telegram_id, shared with the async services.
+user_cache: TTLCache = TTLCache(max_size=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL)
 
 def get_user_language(telegram_id: int) -> str:
     """
@@ -15,22 +20,7 @@ def get_user_language(telegram_id: int) -> str:
     :return: User's language preference
     :rtype: str
     """
-
-    user_db: User = User()
-    try:
-        language: str = user_db.get_serialized_user(telegram_id)["language"]
-        return language
-    except UserDoesNotExist:
-        user_db.close()
-        raise
-    except DBError:
-        user_db.close()
-        raise
-    except DataTypeError:
-        user_db.close()
-        raise
-    finally:
-        user_db.close()
+    return get_user_by_telegram_id(telegram_id)["language"]
 
 
 def get_user_by_telegram_id(telegram_id: int) -> UserDataType:
@@ -48,10 +38,15 @@ def get_user_by_telegram_id(telegram_id: int) -> UserDataType:
     :raises DBError: If there is a database-related error during query execution
     :raises DataTypeError: If there is an error related to the data type of the returned user data
     """
+    cached_user_data: UserDataType | None = user_cache.get(telegram_id)
+    if cached_user_data is not None:
+        return UserDataType(**cached_user_data)
+
     user_db: User = User()
     try:
         user_data: UserDataType = user_db.get_serialized_user(telegram_id)
-        return user_data
+        user_cache.set(telegram_id, user_data)
+        return UserDataType(**user_data)
     except UserDoesNotExist:
         user_db.close()
         raise
@@ -79,6 +74,10 @@ def get_user_id_by_telegram_id(telegram_id: int) -> int:
     :raises DBError: If there is an issue with database connectivity or query
     :raises DataTypeError: If there is a data type mismatch in the retrieval process
     """
+    cached_user_data: UserDataType | None = user_cache.get(telegram_id)
+    if cached_user_data is not None:
+        return cached_user_data["user_id"]
+
     user_db: User = User()
     try:
         user_id: int = user_db.get_user_id(telegram_id)
@@ -100,7 +99,11 @@ def update_user_language(telegram_id: int, language: str) -> None:
     user_db = User()
     try:
         user_db.update_user_language(telegram_id, language)
+        cached_user_data: UserDataType | None = user_cache.peek(telegram_id)
+        if cached_user_data is not None:
+            user_cache.set(telegram_id, UserDataType(**{**cached_user_data, "language": language}))
     except UserDoesNotExist:
+        user_cache.delete(telegram_id)
         user_db.close()
         raise
     except (DBError, DataTypeError):
@@ -118,6 +121,7 @@ def add_new_user(data: UserType) -> None:
     user_db: User = User()
     try:
         user_db.add_user(telegram_id, username, first_name, last_name, language)
+        user_cache.delete(telegram_id)
     except IntegrityError:
         user_db.close()
         raise
@@ -131,6 +135,9 @@ def add_new_user(data: UserType) -> None:
         user_db.close()
 
 def user_exists(telegram_id: int) -> bool:
+    if user_cache.get(telegram_id) is not None:
+        return True
+
     user_db: User = User()
     try:
         existence_status = user_db.user_exists(telegram_id)
@@ -1,16 +1,129 @@
-from aiogram.types import Message
+import asyncio
+
+from config.constants import OPENAI_TEXT_MODEL, USER_CACHE_MAX_SIZE, CONVERSATION_SUMMARY_DEBOUNCE, \
+    ATTACHMENT_PREVIEW_TOKENS, ATTACHMENT_CONTEXT_TOKENS
+from data_types.database import UserDataType, DocumentChunkDataType, ConversationDataType, \
+    RecentConversationDataType
 from services.api.openai_api_services import get_text_response_with_context
-from services.database.conversation_database_services import save_conversation, get_conversation_list
-from services.database.user_database_services import get_user_language
+from services.database.async_conversation_database_services import (
+    save_conversation,
+    get_conversation_attachment,
+    get_recent_conversation_list,
+    get_conversation_window_size,
+    get_conversation_summary,
+)
 from services.handler.text_handler_services import process_streaming_response
+from services.search.document_search_services import get_relevant_document_chunks
+from tasks import summarize_conversation_history
+from utils.common.cache_common_utils import TTLCache
+from utils.common.token_common_utils import truncate_to_tokens
+
+# Users recently queued for summarization, so a busy chat does not enqueue a task per message.
+queued_summaries: TTLCache = TTLCache(max_size=USER_CACHE_MAX_SIZE, ttl=CONVERSATION_SUMMARY_DEBOUNCE)
+
+
+async def schedule_conversation_summary(user_id: int) -> None:
+    """
+    Queue the background summarization of the user's older messages once per debounce period.
+    """
+    if queued_summaries.get(user_id) is not None:
+        return
+    queued_summaries.set(user_id, True)
+    try:
+        await asyncio.to_thread(summarize_conversation_history.delay, user_id)
+    except Exception as e:
+        queued_summaries.delete(user_id)
+        print(f"Error scheduling conversation summary: {str(e)}")
+
+
+def build_attachment_message(attachment: str, user_request_message: str) -> str:
+    """
+    Quote text extracted from media before the message that explains it.
+    """
+    return f'"{attachment}"\n\n{user_request_message}'
+
+
+def get_attachment_preview(attachment: str) -> str:
+    """
+    Return the beginning of an attachment that is kept in the conversation history.
+    """
+    preview = truncate_to_tokens(attachment, ATTACHMENT_PREVIEW_TOKENS, OPENAI_TEXT_MODEL)
+    if preview != attachment:
+        preview += " [...]"
+    return preview
+
+
+async def restore_latest_attachment(conversation_list: list[RecentConversationDataType]) -> None:
+    """
+    Swap the preview of the newest attachment in ``conversation_list`` for up to
+    ``ATTACHMENT_CONTEXT_TOKENS`` of its full text, so follow-up questions about a photo or
+    document are answered from its content rather than from the preview.
+    """
+    for position in range(len(conversation_list) - 1, -1, -1):
+        attachment_id = conversation_list[position].get("attachment_id")
+        if attachment_id is not None:
+            break
+    else:
+        return
+
+    attachment = await get_conversation_attachment(attachment_id)
+    if attachment is None:
+        return
+    restored = truncate_to_tokens(attachment, ATTACHMENT_CONTEXT_TOKENS, OPENAI_TEXT_MODEL)
+    if restored != attachment:
+        restored += " [...]"
+    conversation = conversation_list[position]
+    # The saved message starts with the quoted preview built by build_attachment_message
+    quoted_preview = f'"{get_attachment_preview(attachment)}"'
+    if not conversation["content"].startswith(quoted_preview):
+        return
+    conversation_list[position] = RecentConversationDataType(
+        role=conversation["role"],
+        content=f'"{restored}"' + conversation["content"][len(quoted_preview):],
+        token_count=None,
+        attachment_id=attachment_id
+    )
+
 
+async def handle_saved_conversation(user_data: UserDataType, user_request_message: str, status_message_id: int,
+                                    document_chunks: list[DocumentChunkDataType] | None = None,
+                                    attachment: str | None = None) -> None:
+    """
+    Save the user's message, stream the answer in the context of the conversation and save the answer.
 
-async def handle_saved_conversation(telegram_id: int, user_request_message: str, status_message_id: int) -> None:
-    user_language = get_user_language(telegram_id)
-    save_conversation(telegram_id=telegram_id, role="user", content=user_request_message)
-    conversation_list = get_conversation_list(telegram_id)
-    response_generator = get_text_response_with_context(conversation_list, user_language)
+    Unless ``document_chunks`` are given, the chunks of the user's documents matching the message
+    are looked up and passed to the model with the conversation. An ``attachment`` (text extracted
+    from media) is sent whole with this message only; the saved message keeps a preview of it and
+    the full text is stored separately. Later turns get the newest earlier attachment back
+    in full, up to ``ATTACHMENT_CONTEXT_TOKENS``.
+    """
+    telegram_id = user_data["telegram_id"]
+    user_id = user_data["user_id"]
+    user_language = user_data["language"]
+    if attachment is None:
+        await save_conversation(user_id=user_id, role="user", content=user_request_message)
+    else:
+        preview = get_attachment_preview(attachment)
+        await save_conversation(user_id=user_id, role="user",
+                                content=build_attachment_message(preview, user_request_message),
+                                attachment=attachment if preview != attachment else None)
+    window_size = get_conversation_window_size(OPENAI_TEXT_MODEL)
+    summary = await get_conversation_summary(user_id)
+    conversation_list = await get_recent_conversation_list(user_id, window_size)
+    if attachment is None:
+        await restore_latest_attachment(conversation_list)
+    elif conversation_list:
+        # The newest entry is the message saved above; swap its preview for the whole attachment
+        conversation_list[-1] = ConversationDataType(
+            role="user", content=build_attachment_message(attachment, user_request_message)
+        )
+    if document_chunks is None:
+        document_chunks = await get_relevant_document_chunks(user_id, user_request_message)
+    response_generator = get_text_response_with_context(conversation_list, user_language, summary, document_chunks)
     assistant_response_message = await process_streaming_response(
         telegram_id, status_message_id, response_generator, user_language
     )
-    save_conversation(telegram_id=telegram_id, role="assistant", content=assistant_response_message)
+    await save_conversation(user_id=user_id, role="assistant", content=assistant_response_message)
+    # A full window means older messages are about to fall out of the context.
+    if len(conversation_list) >= window_size:
+        await schedule_conversation_summary(user_id)
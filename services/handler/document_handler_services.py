@@ -0,0 +1,21 @@
+import io
+from typing import Optional
+
+from parser.document import DocumentParser, DocumentLimits
+
+
+def parse_document_data(data: bytes, file_name: str, limits: DocumentLimits) -> Optional[str]:
+    """
+    Parse a downloaded document; runs in the document worker pool.
+
+    :param data: Content of the document.
+    :type data: bytes
+    :param file_name: Original file name, used to detect the format.
+    :type file_name: str
+    :param limits: Limits of the parser in the bot process, applied in the worker as well.
+    :type limits: DocumentLimits
+    :return: The text content of the document or None if parsing failed.
+    :rtype: Optional[str]
+    :raises DocumentTooLargeError: If the document exceeds the size limit.
+    """
+    return DocumentParser(limits).parse_document(io.BytesIO(data), file_name)
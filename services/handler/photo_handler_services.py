@@ -1,78 +1,186 @@
-import os
+import asyncio
 import logging
-import pytesseract
 from PIL import Image, ImageEnhance
-from tasks import delete_handled_file
-from utils.handler.photo_handler_utils import postprocess_text, safe_preprocess_image, extract_text_from_image
+from config.constants import (
+    OCR_STRATEGIES_LOW_LOAD,
+    OCR_STRATEGIES_NORMAL_LOAD,
+    OCR_STRATEGIES_HIGH_LOAD,
+    OCR_NORMAL_LOAD,
+    OCR_HIGH_LOAD,
+    OCR_MIN_CONFIDENCE,
+)
+from utils.common.timing_common_utils import StageTimer
+from utils.handler.photo_handler_utils import (
+    postprocess_text,
+    safe_preprocess_image,
+    extract_text_from_image,
+    decode_image,
+    to_grayscale,
+    normalize_text_scale,
+    crop_text_regions,
+    detect_script,
+    get_tesseract_languages,
+    run_ocr_strategy,
+    score_ocr_result,
+    recognize_text,
+)
+from workers.pool import ProcessPoolEngine
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def handle_message_photo(image_path: str, lang: str) -> str:
-    """Main function to handle image processing and text extraction."""
+def handle_message_photo(image_data: bytes, lang: str) -> str:
+    """Main function to handle image processing and text extraction.
+
+    The photo arrives as the downloaded bytes, so nothing is written to or read from disk.
+    It is decoded once; verification, the quick OCR pass, preprocessing and the fallback
+    all share the same grayscale buffer. Per-stage timings are logged.
+
+    Before OCR the image is rescaled to the text height Tesseract works best with and
+    cropped to its text regions, and the detected script narrows the language list.
+    """
+    timer = StageTimer()
     try:
-        # Check if file exists
-        if not os.path.exists(image_path):
-            logger.error(f"Image file not found: {image_path}")
-            return "Error: Image file not found."
-
-        # Verify file size
-        file_size = os.path.getsize(image_path)
-        if file_size == 0:
-            logger.error(f"Image file is empty: {image_path}")
+        # Verify data size
+        if not image_data:
+            logger.error("Image data is empty")
             return "Error: Image file is empty."
 
-        logger.info(f"Processing image: {image_path}, size: {file_size} bytes")
+        logger.info(f"Processing image, size: {len(image_data)} bytes")
 
-        # Try to use PIL first as it's generally more robust for initial loading
-        try:
-            pil_image = Image.open(image_path)
-            pil_image.verify()  # Verify the image is valid
-            logger.info(f"Successfully opened image with PIL: {image_path}")
+        # Decode once; a failed decode means the data is not a valid image
+        with timer.stage("decode"):
+            image = decode_image(image_data)
+        if image is None:
+            logger.error("Image could not be decoded")
+            return "Error: Image file could not be decoded."
 
-            # Re-open because verify() closes the file
-            pil_image = Image.open(image_path)
+        with timer.stage("grayscale"):
+            gray = to_grayscale(image)
+        # Only the grayscale buffer is needed from here on
+        del image
 
-            # Extract text directly with PIL if possible
-            extracted_text = pytesseract.image_to_string(pil_image)
+        with timer.stage("scale"):
+            gray = normalize_text_scale(gray)
+        with timer.stage("regions"):
+            crops = crop_text_regions(gray)
+        with timer.stage("script"):
+            script = detect_script(max(crops, key=lambda crop: crop.size))
+        langs = get_tesseract_languages(lang, script)
+        logger.info(f"OCR input: {gray.shape[1]}x{gray.shape[0]}, {len(crops)} region(s), languages {langs}")
+
+        # Extract text directly if possible
+        try:
+            with timer.stage("quick_ocr"):
+                extracted_text = _join_texts(recognize_text(crop, langs) for crop in crops)
 
             # If text looks good enough, return it
             if len(extracted_text.strip()) > 10:
-                cleaned_text = postprocess_text(extracted_text, lang)
+                with timer.stage("postprocess"):
+                    cleaned_text = postprocess_text(extracted_text, lang)
                 return cleaned_text
 
             # If basic extraction wasn't good enough, continue with advanced processing
-        except Exception as pil_error:
-            logger.warning(f"PIL initial processing failed: {str(pil_error)}")
+        except Exception as quick_ocr_error:
+            logger.warning(f"Quick OCR pass failed: {str(quick_ocr_error)}")
 
-        # Preprocess the image using the safer approach
-        preprocessed_image = safe_preprocess_image(image_path)
+        # Preprocess the crops using the safer approach
+        with timer.stage("preprocess"):
+            preprocessed_crops = [safe_preprocess_image(crop) for crop in crops]
 
-        if preprocessed_image is None:
-            # Fallback to direct PIL processing if OpenCV fails
+        if any(preprocessed is None for preprocessed in preprocessed_crops):
+            # Fallback to PIL-based contrast enhancement of the same buffers if OpenCV fails
             logger.warning("OpenCV preprocessing failed, falling back to PIL")
-            pil_image = Image.open(image_path)
-
-            # Apply PIL-based preprocessing
-            pil_image = pil_image.convert('L')  # Convert to grayscale
-            pil_image = ImageEnhance.Contrast(pil_image).enhance(2.0)  # Enhance contrast
-
-            # Extract text with PIL
-            extracted_text = pytesseract.image_to_string(pil_image)
+            with timer.stage("fallback_ocr"):
+                extracted_text = _join_texts(
+                    recognize_text(ImageEnhance.Contrast(Image.fromarray(crop)).enhance(2.0), langs)
+                    for crop in crops
+                )
         else:
-            # Extract text with enhanced settings using the preprocessed image
-            extracted_text = extract_text_from_image(preprocessed_image, lang)
+            # Extract text with enhanced settings using the preprocessed crops
+            with timer.stage("ocr"):
+                extracted_text = _join_texts(
+                    extract_text_from_image(preprocessed, lang, langs) for preprocessed in preprocessed_crops
+                )
 
         # Postprocess the extracted text
-        cleaned_text = postprocess_text(extracted_text, lang)
+        with timer.stage("postprocess"):
+            cleaned_text = postprocess_text(extracted_text, lang)
 
         return cleaned_text
     except Exception as e:
         logger.error(f"Error in handle_message_photo: {str(e)}", exc_info=True)
         return f"Error processing image: {str(e)}"
     finally:
-        # Schedule file deletion regardless of success/failure
-        try:
-            delete_handled_file.delay(image_path)
-        except Exception as e:
-            logger.error(f"Failed to schedule file deletion: {str(e)}")
+        logger.info(f"OCR timings: {timer}")
+
+
+def _join_texts(texts) -> str:
+    """Join the text of separate regions as paragraphs, skipping empty ones."""
+    return "\n\n".join(text.strip() for text in texts if text and text.strip())
+
+
+def is_usable_ocr_text(text: str | None) -> bool:
+    """Whether OCR produced text rather than an error or the no-text notice."""
+    return bool(text) and not text.startswith(("Error", "No text detected"))
+
+
+def extract_text_with_strategy(image_data: bytes, strategy: str, lang: str) -> tuple[str, float]:
+    """Run one fallback OCR strategy in a worker process; see ``run_ocr_strategies``."""
+    image = decode_image(image_data)
+    if image is None:
+        return "", 0.0
+    gray = normalize_text_scale(to_grayscale(image))
+    return run_ocr_strategy(gray, strategy, get_tesseract_languages(lang))
+
+
+def select_ocr_strategies(load: float) -> list[str]:
+    """Pick the fallback OCR strategies allowed at the given load of the OCR pool."""
+    if load >= OCR_HIGH_LOAD:
+        return OCR_STRATEGIES_HIGH_LOAD
+    if load >= OCR_NORMAL_LOAD:
+        return OCR_STRATEGIES_NORMAL_LOAD
+    return OCR_STRATEGIES_LOW_LOAD
+
+
+async def run_ocr_strategies(engine: ProcessPoolEngine, image_data: bytes, lang: str,
+                             strategies: list[str], min_confidence: float = OCR_MIN_CONFIDENCE) -> str:
+    """Run OCR strategies in parallel on the worker pool and return the best text.
+
+    Results are scored as they arrive. Once one reaches ``min_confidence`` the remaining
+    strategies are cancelled: queued jobs never start, while jobs already running in a
+    worker finish in the background and their result is dropped.
+
+    :param engine: Pool the strategies run in.
+    :param image_data: Downloaded image bytes; each worker decodes its own copy.
+    :param lang: User language preference.
+    :param strategies: Names of ``OCR_STRATEGIES`` to try.
+    :param min_confidence: Mean word confidence that ends the search early.
+    :return: Postprocessed text of the best strategy, or an empty string if none found text.
+    """
+    async def attempt(strategy: str) -> tuple[str, str, float]:
+        text, confidence = await engine.run(extract_text_with_strategy, image_data, strategy, lang)
+        return strategy, text, confidence
+
+    tasks = [asyncio.create_task(attempt(strategy)) for strategy in strategies]
+    best_text, best_score = "", 0.0
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            try:
+                strategy, text, confidence = await next_result
+            except Exception as e:
+                logger.warning(f"OCR strategy failed: {str(e)}")
+                continue
+
+            score = score_ocr_result(text, confidence)
+            logger.info(f"OCR strategy {strategy}: confidence {confidence:.0f}, score {score:.1f}")
+            if score > best_score:
+                best_text, best_score = text, score
+            if confidence >= min_confidence and len(text.strip()) > 10:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return postprocess_text(best_text, lang) if best_text.strip() else ""
@@ -1,51 +1,35 @@
-import asyncio
-from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
 from config.constants import DIVIDE_MESSAGE_AFTER, MESSAGE_COMPLETION_CURSOR
-from config.integrations import bot
+from config.integrations import outbound_queue
 from utils.common.format_common_utils import format_response_chunk
-from utils.handler.text_handler_utils import send_message_chunk, send_remaining_chunks
+from utils.handler.text_handler_utils import StreamingMessageEditor, send_remaining_chunks
 
 
 async def process_streaming_response(chat_id, original_message_id, response_generator, user_language):
-    """Process streaming response from generator and handle message chunking."""
+    """Process streaming response from an async generator and handle message chunking.
+
+    Chunks are awaited with ``async for``, so other updates are served while the model is generating.
+    Intermediate edits go through ``StreamingMessageEditor``, which paces them by time instead of by
+    chunk count and coalesces everything generated between two edits.
+    """
     dummy_response_text = ""
     assistant_response_message = ""
-    generator_counter = 0
+    editor = StreamingMessageEditor(chat_id, original_message_id)
 
     try:
-        while True:
-            try:
-                next_chunk = next(response_generator)
-
-                dummy_response_text += format_response_chunk(next_chunk)
-                assistant_response_message += next_chunk
-
-                if len(dummy_response_text) >= DIVIDE_MESSAGE_AFTER:
-                    await send_message_chunk(
-                        chat_id,
-                        original_message_id,
-                        dummy_response_text[:DIVIDE_MESSAGE_AFTER]
-                    )
-                    dummy_response_text = dummy_response_text[DIVIDE_MESSAGE_AFTER:]
-                    original_message = await bot.send_message(chat_id, MESSAGE_COMPLETION_CURSOR)
-                    original_message_id = original_message.message_id
-
-                generator_counter += 1
-                if generator_counter >= 80:
-                    await send_message_chunk(
-                        chat_id,
-                        original_message_id,
-                        dummy_response_text + MESSAGE_COMPLETION_CURSOR
-                    )
-                    generator_counter = 0
-
-            except TelegramBadRequest as e:
-                continue
-            except TelegramRetryAfter as e:
-                await asyncio.sleep(e.retry_after)
-
-    except StopIteration:
-        pass
+        async for next_chunk in response_generator:
+            dummy_response_text += format_response_chunk(next_chunk)
+            assistant_response_message += next_chunk
+
+            if len(dummy_response_text) >= DIVIDE_MESSAGE_AFTER:
+                await editor.finish(dummy_response_text[:DIVIDE_MESSAGE_AFTER])
+                dummy_response_text = dummy_response_text[DIVIDE_MESSAGE_AFTER:]
+                original_message = await outbound_queue.send_message(chat_id, MESSAGE_COMPLETION_CURSOR)
+                original_message_id = original_message.message_id
+                editor = StreamingMessageEditor(chat_id, original_message_id)
+
+            editor.update(dummy_response_text + MESSAGE_COMPLETION_CURSOR)
+    finally:
+        await editor.stop()
 
     await send_remaining_chunks(chat_id, original_message_id, dummy_response_text, user_language)
     return assistant_response_message
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+
+from config.constants import VOICE_SEGMENT_SECONDS, VOICE_SEGMENT_MAX_SECONDS, VOICE_TRANSCRIPTION_CONCURRENCY
+from services.api.openai_api_services import get_transcription_of_audio
+from utils.handler.voice_handler_utils import (
+    is_ffmpeg_available,
+    detect_silences,
+    choose_split_points,
+    cut_audio_segment,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _split_voice(data: bytes, duration: float) -> list[bytes]:
+    silences = await detect_silences(data, duration)
+    points = choose_split_points(silences, duration, VOICE_SEGMENT_SECONDS, VOICE_SEGMENT_MAX_SECONDS)
+    bounds = zip([0.0] + points, points + [None])
+    return list(await asyncio.gather(*(cut_audio_segment(data, start, end) for start, end in bounds)))
+
+
+async def transcribe_voice(data: bytes, file_name: str, duration: float) -> str:
+    """
+    Transcribe a voice message, cutting long ones at silences into segments transcribed concurrently.
+
+    Voice messages up to ``VOICE_SEGMENT_MAX_SECONDS`` are sent in one request, and so is every
+    voice message when ffmpeg is not installed or fails to split it.
+
+    :param data: Content of the OGG/Opus file.
+    :type data: bytes
+    :param file_name: File name that tells the API the audio format.
+    :type file_name: str
+    :param duration: Length of the voice message in seconds, as reported by Telegram.
+    :type duration: float
+    :return: Transcript of the whole voice message.
+    :rtype: str
+    """
+    if duration <= VOICE_SEGMENT_MAX_SECONDS or not is_ffmpeg_available():
+        return await get_transcription_of_audio(data, file_name)
+
+    try:
+        segments = await _split_voice(data, duration)
+    except Exception as e:
+        logger.error(f"Splitting a voice message failed, transcribing it whole: {str(e)}")
+        return await get_transcription_of_audio(data, file_name)
+
+    semaphore = asyncio.Semaphore(VOICE_TRANSCRIPTION_CONCURRENCY)
+
+    async def transcribe_segment(segment: bytes) -> str:
+        async with semaphore:
+            return await get_transcription_of_audio(segment, file_name)
+
+    # gather keeps the order of the segments, whatever order they finish in
+    transcripts = await asyncio.gather(*(transcribe_segment(segment) for segment in segments))
+    return " ".join(transcript.strip() for transcript in transcripts if transcript.strip())
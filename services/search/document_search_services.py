@@ -0,0 +1,91 @@
+import asyncio
+
+from config.constants import (
+    OPENAI_TEXT_MODEL,
+    DOCUMENT_CHUNK_TOKENS,
+    DOCUMENT_SEARCH_TOP_K,
+    DOCUMENT_SEARCH_MIN_COVERAGE,
+    DOCUMENT_INDEX_CACHE_SIZE,
+    DOCUMENT_INDEX_CACHE_TTL,
+)
+from data_types.database import DocumentChunkDataType
+from services.database.async_document_database_services import save_document_chunks, get_document_chunk_list
+from utils.common.cache_common_utils import TTLCache
+from utils.common.search_common_utils import BM25Index
+from utils.common.token_common_utils import split_text_into_chunks, count_tokens
+
+# Search index over each user's document chunks; rebuilt from the database once it expired or changed.
+# Users without documents are cached as well, so plain text messages do not query the database every time.
+document_indexes: TTLCache = TTLCache(max_size=DOCUMENT_INDEX_CACHE_SIZE, ttl=DOCUMENT_INDEX_CACHE_TTL)
+
+
+def _chunk_document(text: str) -> tuple[list[str], list[int]]:
+    chunks = split_text_into_chunks(text, DOCUMENT_CHUNK_TOKENS, OPENAI_TEXT_MODEL)
+    return chunks, [count_tokens(chunk, OPENAI_TEXT_MODEL) for chunk in chunks]
+
+
+def _build_document_index(chunk_list: list[DocumentChunkDataType]) -> BM25Index | None:
+    if not chunk_list:
+        return None
+    return BM25Index([chunk["content"] for chunk in chunk_list])
+
+
+def invalidate_document_index(user_id: int) -> None:
+    """
+    Drop the cached index of the user after their documents changed.
+    """
+    document_indexes.delete(user_id)
+
+
+async def index_document(user_id: int, file_unique_id: str, file_name: str | None,
+                         text: str) -> list[DocumentChunkDataType]:
+    """
+    Split a parsed document into chunks and store them for later questions of the user.
+
+    :param user_id: Owner of the document.
+    :type user_id: int
+    :param file_unique_id: Telegram's identifier of the file; uploading it again replaces its chunks.
+    :type file_unique_id: str
+    :param file_name: Original file name, shown to the model with every chunk.
+    :type file_name: str | None
+    :param text: Extracted text of the document.
+    :type text: str
+    :return: Stored chunks in document order.
+    :rtype: list[DocumentChunkDataType]
+    """
+    # Tokenizing a long document takes a while, keep it off the event loop
+    chunks, token_counts = await asyncio.to_thread(_chunk_document, text)
+    await save_document_chunks(user_id, file_unique_id, file_name, chunks, token_counts)
+    invalidate_document_index(user_id)
+    return [
+        DocumentChunkDataType(file_name=file_name, chunk_index=chunk_index, content=chunk, token_count=token_count)
+        for chunk_index, (chunk, token_count) in enumerate(zip(chunks, token_counts))
+    ]
+
+
+async def get_relevant_document_chunks(user_id: int, query: str,
+                                       k: int = DOCUMENT_SEARCH_TOP_K) -> list[DocumentChunkDataType]:
+    """
+    Find the chunks of the user's documents that match ``query`` best.
+
+    :param user_id: Owner of the documents.
+    :type user_id: int
+    :param query: Message of the user the chunks should help to answer.
+    :type query: str
+    :param k: Maximum number of chunks.
+    :type k: int
+    :return: Matching chunks in document order, empty if the user has no documents or nothing matches.
+    :rtype: list[DocumentChunkDataType]
+    """
+    cached_index = document_indexes.get(user_id)
+    if cached_index is None:
+        chunk_list = await get_document_chunk_list(user_id)
+        cached_index = (await asyncio.to_thread(_build_document_index, chunk_list), chunk_list)
+        document_indexes.set(user_id, cached_index)
+
+    index, chunk_list = cached_index
+    if index is None:
+        return []
+    # Neighbouring chunks read better in their original order than by score
+    positions = sorted(position for position, _ in index.search(query, k, DOCUMENT_SEARCH_MIN_COVERAGE))
+    return [chunk_list[position] for position in positions]
@@ -1,14 +1,35 @@
-import os
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 
 app = Celery(
     "tasks", broker="redis://localhost:6379/0", backend="redis://localhost:6379/0"
 )
 
 
+# Only the worker uses the psycopg2 pool; the bot process talks to the database through asyncpg.
+@worker_process_init.connect
+def open_database_pool(**kwargs) -> None:
+    from database.pool import get_pool
+
+    try:
+        get_pool().prefill()
+    except Exception as e:
+        print(f"Error opening database connections: {str(e)}")
+
+
+@worker_process_shutdown.connect
+def close_database_pool(**kwargs) -> None:
+    from database.pool import close_pool
+
+    close_pool()
+
+
 @app.task
-def delete_handled_file(path: str) -> None:
+def summarize_conversation_history(user_id: int) -> None:
+    # Imported lazily so that the worker only loads the API stack when it runs this task.
+    from services.api.openai_api_services import summarize_conversation_history as summarize
+
     try:
-        os.remove(path)
-    except OSError as e:
-        print(f"Error: {e.filename} - {e.strerror}.")
+        summarize(user_id)
+    except Exception as e:
+        print(f"Error summarizing conversation of user {user_id}: {str(e)}")
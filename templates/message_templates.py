@@ -333,6 +333,22 @@ def get_downloading_document_message(lang):
     }
     return message[lang]
 
+def get_document_too_large_message(lang, max_size_mb):
+    message = {
+        'uz': f"Hujjat juda katta. Iltimos, {max_size_mb} MB dan kichik hujjat yuboring.",
+        'ru': f"Документ слишком большой. Пожалуйста, отправьте документ меньше {max_size_mb} МБ.",
+        'en': f"The document is too large. Please send a document smaller than {max_size_mb} MB.",
+    }
+    return message[lang]
+
+def get_document_parsing_failed_message(lang):
+    message = {
+        'uz': "Hujjatni o'qib bo'lmadi. Iltimos, boshqa faylni yuboring.",
+        'ru': 'Не удалось прочитать документ. Пожалуйста, отправьте другой файл.',
+        'en': 'The document could not be read. Please send another file.',
+    }
+    return message[lang]
+
 def get_parsing_content_message(lang):
     message = {
         'uz': 'Kontent tahlil qilinmoqda...',
@@ -341,6 +357,14 @@ def get_parsing_content_message(lang):
     }
     return message[lang]
 
+def get_summarizing_document_message(lang):
+    message = {
+        'uz': 'Hujjatning qisqacha mazmuni tayyorlanmoqda...',
+        'ru': 'Составление краткого содержания документа...',
+        'en': 'Summarizing the document...',
+    }
+    return message[lang]
+
 def get_processing_text_message(lang):
     message = {
         'uz': 'Matnli xabaringiz qayta ishlanmoqda...',
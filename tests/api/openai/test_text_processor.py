@@ -0,0 +1,58 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+from api.openai.client import SharedOpenAIClient, EndpointLimit
+from api.openai.processors.audio import AudioProcessor
+from api.openai.processors.text import TextProcessor
+
+
+def _shared_client(text_concurrency: int = 2) -> SharedOpenAIClient:
+    return SharedOpenAIClient(
+        api_key="test-key",
+        base_url=None,
+        endpoint_limits={"text": EndpointLimit(text_concurrency, 10), "audio": EndpointLimit(1, 30)},
+    )
+
+
+def test_async_generate_text_response_awaits_async_client():
+    text_processor = TextProcessor(_shared_client())
+    text_processor.async_client.chat.completions.create = AsyncMock(return_value="stream")
+
+    response = asyncio.run(text_processor.async_generate_text_response(
+        [{"role": "user", "content": "Hi"}], model="test-model", stream=True
+    ))
+
+    assert response == "stream"
+    call_kwargs = text_processor.async_client.chat.completions.create.await_args.kwargs
+    assert call_kwargs["model"] == "test-model"
+    assert call_kwargs["stream"] is True
+    assert call_kwargs["timeout"] == 10
+
+
+def test_async_requests_respect_the_endpoint_concurrency():
+    text_processor = TextProcessor(_shared_client(text_concurrency=2))
+    in_flight = 0
+    max_in_flight = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "response"
+
+    text_processor.async_client.chat.completions.create = create
+
+    async def run() -> list:
+        return await asyncio.gather(*(
+            text_processor.async_generate_text_response([{"role": "user", "content": "Hi"}]) for _ in range(5)
+        ))
+
+    assert asyncio.run(run()) == ["response"] * 5
+    assert max_in_flight == 2
+
+
+def test_processors_share_one_connection_pool():
+    shared_client = _shared_client()
+    assert TextProcessor(shared_client).async_client is AudioProcessor(shared_client).async_client
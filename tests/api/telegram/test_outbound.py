@@ -0,0 +1,139 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from aiogram.exceptions import TelegramRetryAfter
+
+from api.telegram.outbound import (
+    TelegramOutboundQueue,
+    INTERACTIVE_PRIORITY,
+    STATUS_PRIORITY,
+    BROADCAST_PRIORITY,
+)
+from utils.common.rate_limit_common_utils import ChatRateLimiter
+
+
+def _queue() -> TelegramOutboundQueue:
+    rate_limiter = ChatRateLimiter(global_rate=1000, chat_interval=0.01, group_chat_interval=0.01,
+                                   max_chat_interval=0.02)
+    return TelegramOutboundQueue(MagicMock(), rate_limiter)
+
+
+def test_interactive_calls_are_sent_before_broadcasts():
+    async def run() -> list[str]:
+        queue = _queue()
+        sent: list[str] = []
+
+        async def record(name: str) -> str:
+            sent.append(name)
+            return name
+
+        futures = [
+            queue.submit(1, lambda: record("broadcast"), BROADCAST_PRIORITY),
+            queue.submit(2, lambda: record("status"), STATUS_PRIORITY),
+            queue.submit(3, lambda: record("reply"), INTERACTIVE_PRIORITY),
+        ]
+        await asyncio.gather(*futures)
+        await queue.close()
+        return sent
+
+    assert asyncio.run(run()) == ["reply", "status", "broadcast"]
+
+
+def test_queued_edits_of_the_same_message_are_merged():
+    async def run() -> tuple[list[str], list[str]]:
+        queue = _queue()
+        sent: list[str] = []
+
+        async def edit(text: str) -> str:
+            sent.append(text)
+            return text
+
+        # Keep the chat busy so the edits stay queued.
+        queue.rate_limiter.get_chat_bucket(1).block_for(0.05)
+        merge_key = ("edit_message_text", 1, 10)
+        futures = [
+            queue.submit(1, lambda: edit("first"), STATUS_PRIORITY, merge_key),
+            queue.submit(1, lambda: edit("second"), STATUS_PRIORITY, merge_key),
+            queue.submit(1, lambda: edit("final"), INTERACTIVE_PRIORITY, merge_key),
+        ]
+        results = await asyncio.gather(*futures)
+        await queue.close()
+        return sent, results
+
+    sent, results = asyncio.run(run())
+    assert sent == ["final"]
+    assert results == ["final", "final", "final"]
+
+
+def test_delayed_chat_does_not_hold_up_other_chats():
+    async def run() -> list[int]:
+        queue = _queue()
+        sent: list[int] = []
+
+        async def record(chat_id: int) -> None:
+            sent.append(chat_id)
+
+        queue.rate_limiter.get_chat_bucket(1).block_for(0.05)
+        futures = [queue.submit(1, lambda: record(1), INTERACTIVE_PRIORITY)]
+        futures += [queue.submit(chat_id, lambda chat_id=chat_id: record(chat_id), BROADCAST_PRIORITY)
+                    for chat_id in range(2, 6)]
+        await asyncio.gather(*futures)
+        await queue.close()
+        return sent
+
+    assert asyncio.run(run()) == [2, 3, 4, 5, 1]
+
+
+def test_retry_after_pauses_chat_and_retries():
+    async def run() -> tuple[int, str]:
+        queue = _queue()
+        attempts = 0
+
+        async def flaky_send() -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise TelegramRetryAfter(method=MagicMock(), message="Flood control exceeded", retry_after=0)
+            return "sent"
+
+        result = await queue.submit(1, flaky_send)
+        await queue.close()
+        return attempts, result
+
+    assert asyncio.run(run()) == (2, "sent")
+
+
+def test_errors_are_delivered_to_the_caller():
+    async def run() -> None:
+        queue = _queue()
+
+        async def failing_send() -> None:
+            raise ValueError("chat not found")
+
+        try:
+            await queue.submit(1, failing_send)
+        finally:
+            await queue.close()
+
+    with pytest.raises(ValueError, match="chat not found"):
+        asyncio.run(run())
+
+
+def test_close_waits_for_calls_in_flight():
+    async def run() -> str:
+        queue = _queue()
+        started = asyncio.Event()
+
+        async def slow_call() -> str:
+            started.set()
+            await asyncio.sleep(0.05)
+            return "sent"
+
+        future = queue.submit(1, slow_call, INTERACTIVE_PRIORITY)
+        await started.wait()
+        await queue.close()
+        assert not queue._tasks
+        return await future
+
+    assert asyncio.run(run()) == "sent"
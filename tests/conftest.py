@@ -0,0 +1,16 @@
+import pytest
+
+from database.pool import close_pool
+from services.database.user_database_services import user_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_connection_pool():
+    yield
+    close_pool()
+
+
+@pytest.fixture(autouse=True)
+def reset_user_cache():
+    yield
+    user_cache.clear()
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, AsyncMock, MagicMock, patch
 
 
 class TestRepositoryBase:
@@ -16,3 +16,25 @@ class TestRepositoryBase:
         setattr(mock_cursor, method_name, Mock(return_value=return_value))
         self.db.conn.cursor.return_value = mock_cursor
         return getattr(mock_cursor, method_name)
+
+
+class TestAsyncRepositoryBase:
+    def setup_method(self):
+        self.telegram_id = 957481488
+        self.user_id = 1
+        self.connection = Mock()
+        self.connection.fetch = AsyncMock()
+        self.connection.fetchrow = AsyncMock()
+        self.connection.fetchval = AsyncMock()
+        self.connection.execute = AsyncMock()
+        acquire_context = MagicMock()
+        acquire_context.__aenter__ = AsyncMock(return_value=self.connection)
+        acquire_context.__aexit__ = AsyncMock(return_value=False)
+        self.pool = Mock()
+        self.pool.acquire.return_value = acquire_context
+        self.pool_patcher = patch('database.async_base.get_async_pool', AsyncMock(return_value=self.pool))
+        self.pool_patcher.start()
+
+    def teardown_method(self, method):
+        self.pool_patcher.stop()
+        self.__dict__.clear()
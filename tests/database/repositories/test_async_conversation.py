@@ -0,0 +1,91 @@
+import asyncio
+import hashlib
+import zlib
+
+import pytest
+from unittest.mock import patch
+from asyncpg import ForeignKeyViolationError
+
+from database.repositories.async_conversation import AsyncConversation
+from exceptions.database import RelatedRecordDoesNotExist
+from tests.database.repositories.base import TestAsyncRepositoryBase
+
+
+class TestAsyncConversation(TestAsyncRepositoryBase):
+    def setup_method(self) -> None:
+        super().setup_method()
+        self.conversation_records: list[dict[str, any]] = [
+            {'role': 'user', 'message': 'Hello, how are you?', 'token_count': 6},
+            {'role': 'assistant ', 'message': 'Fine, thanks!', 'token_count': None},
+        ]
+        self.serialized_conversation_list: list[dict[str, any]] = [
+            {'role': 'user', 'content': 'Hello, how are you?', 'token_count': 6},
+            {'role': 'assistant', 'content': 'Fine, thanks!', 'token_count': None},
+        ]
+        self.db: AsyncConversation = AsyncConversation()
+
+    def test_add_conversation_raises_related_record_does_not_exist(self) -> None:
+        self.connection.execute.side_effect = ForeignKeyViolationError("conversations_user_id_fkey")
+        with pytest.raises(RelatedRecordDoesNotExist):
+            asyncio.run(self.db.add_conversation(self.user_id, 'user', 'Hello, how are you?'))
+
+    def test_add_conversation_stores_token_count(self) -> None:
+        with patch('database.repositories.async_conversation.count_tokens', return_value=6):
+            asyncio.run(self.db.add_conversation(self.user_id, 'user', 'Hello, how are you?'))
+        assert self.connection.execute.await_args.args[1:] == (self.user_id, 'user', 'Hello, how are you?', 6)
+
+    def test_add_conversation_stores_compressed_attachment_once(self) -> None:
+        attachment = 'Extracted document text. ' * 100
+        with patch('database.repositories.async_conversation.count_tokens', return_value=6):
+            asyncio.run(self.db.add_conversation(self.user_id, 'user', 'Preview [...]', attachment))
+        query, *params = self.connection.execute.await_args.args
+        assert "ON CONFLICT (content_hash)" in query
+        assert params[:4] == [self.user_id, 'user', 'Preview [...]', 6]
+        content_hash, content, content_size = params[4:]
+        assert content_hash == hashlib.sha256(attachment.encode()).digest()
+        assert zlib.decompress(content).decode() == attachment
+        assert len(content) < content_size == len(attachment)
+
+    def test_get_attachment_decompresses_content(self) -> None:
+        self.connection.fetchval.return_value = zlib.compress('Extracted text'.encode())
+        assert asyncio.run(self.db.get_attachment(7)) == 'Extracted text'
+        self.connection.fetchval.return_value = None
+        assert asyncio.run(self.db.get_attachment(8)) is None
+
+    def test_get_recent_conversation_list_successful(self) -> None:
+        self.connection.fetch.return_value = [
+            {**conversation_record, 'attachment_id': attachment_id}
+            for conversation_record, attachment_id in zip(self.conversation_records, [7, None])
+        ]
+        method_result = asyncio.run(self.db.get_recent_conversation_list(self.user_id, 2))
+        assert method_result == [
+            {**conversation, 'attachment_id': attachment_id}
+            for conversation, attachment_id in zip(self.serialized_conversation_list, [7, None])
+        ]
+        query, user_id, limit = self.connection.fetch.await_args.args
+        assert "ORDER BY created_at DESC" in query
+        assert "LIMIT $2" in query
+        assert (user_id, limit) == (self.user_id, 2)
+        assert "conversation_summaries" in query
+
+    def test_get_conversation_summary_returns_none_without_summary(self) -> None:
+        self.connection.fetchrow.return_value = None
+        assert asyncio.run(self.db.get_conversation_summary(self.user_id)) is None
+
+    def test_get_conversation_summary_successful(self) -> None:
+        summary_record = {'summary': 'User asked about Tashkent.', 'summarized_until': '2024-12-04 19:07:22', 'token_count': 7}
+        self.connection.fetchrow.return_value = summary_record
+        assert asyncio.run(self.db.get_conversation_summary(self.user_id)) == summary_record
+
+    def test_delete_all_conversations_deletes_summary(self) -> None:
+        asyncio.run(self.db.delete_all_conversations(self.user_id))
+        query, user_id = self.connection.execute.await_args.args
+        assert "DELETE FROM conversation_summaries" in query
+        assert user_id == self.user_id
+
+    def test_delete_all_conversations_deletes_unreferenced_attachments(self) -> None:
+        asyncio.run(self.db.delete_all_conversations(self.user_id))
+        query = self.connection.execute.await_args.args[0]
+        assert "RETURNING attachment_id" in query
+        assert "DELETE FROM attachments" in query
+        assert "conversations.user_id <> $1" in query
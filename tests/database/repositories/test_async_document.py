@@ -0,0 +1,36 @@
+import asyncio
+import pytest
+from asyncpg import ForeignKeyViolationError
+
+from database.repositories.async_document import AsyncDocument
+from exceptions.database import RelatedRecordDoesNotExist
+from tests.database.repositories.base import TestAsyncRepositoryBase
+
+
+class TestAsyncDocument(TestAsyncRepositoryBase):
+    def setup_method(self) -> None:
+        super().setup_method()
+        self.chunk_records: list[dict[str, any]] = [
+            {'file_name': 'contract.pdf', 'chunk_index': 0, 'content': 'The contract is signed.', 'token_count': 5},
+            {'file_name': 'contract.pdf', 'chunk_index': 1, 'content': 'Payment is due.', 'token_count': 4},
+        ]
+        self.db: AsyncDocument = AsyncDocument()
+
+    def test_add_document_chunks_replaces_earlier_upload(self) -> None:
+        asyncio.run(self.db.add_document_chunks(self.user_id, 'file-1', 'contract.pdf',
+                                                ['The contract is signed.', 'Payment is due.'], [5, 4]))
+        query, *params = self.connection.execute.await_args.args
+        assert "DELETE FROM document_chunks" in query
+        assert params == [self.user_id, 'file-1', 'contract.pdf', ['The contract is signed.', 'Payment is due.'], [5, 4]]
+
+    def test_add_document_chunks_raises_related_record_does_not_exist(self) -> None:
+        self.connection.execute.side_effect = ForeignKeyViolationError("document_chunks_user_id_fkey")
+        with pytest.raises(RelatedRecordDoesNotExist):
+            asyncio.run(self.db.add_document_chunks(self.user_id, 'file-1', None, ['text'], [1]))
+
+    def test_get_document_chunk_list_successful(self) -> None:
+        self.connection.fetch.return_value = self.chunk_records
+        assert asyncio.run(self.db.get_document_chunk_list(self.user_id)) == self.chunk_records
+        query, user_id = self.connection.fetch.await_args.args
+        assert "ORDER BY created_at, file_unique_id, chunk_index" in query
+        assert user_id == self.user_id
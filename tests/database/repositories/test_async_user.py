@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+from asyncpg import UniqueViolationError, PostgresError
+
+from database.repositories.async_user import AsyncUser
+from exceptions.database import UserDoesNotExist, UserAlreadyExistsError, DBError
+from tests.database.repositories.base import TestAsyncRepositoryBase
+
+
+class TestAsyncUser(TestAsyncRepositoryBase):
+    def setup_method(self) -> None:
+        super().setup_method()
+        self.user_record: dict[str, any] = {
+            'user_id': 1,
+            'telegram_id': 957481488,
+            'username': 'javoxirone',
+            'first_name': 'Javohir',
+            'last_name': 'Nurmatjonov',
+            'created_at': '2024-12-04 19:07:22.795534',
+            'language': 'en'
+        }
+        self.db: AsyncUser = AsyncUser()
+
+    def test_get_serialized_user_successful(self) -> None:
+        self.connection.fetchrow.return_value = self.user_record
+        method_result = asyncio.run(self.db.get_serialized_user(self.telegram_id))
+        assert method_result == self.user_record
+        self.connection.fetchrow.assert_awaited_once()
+
+    def test_get_serialized_user_raises_user_does_not_exist(self) -> None:
+        self.connection.fetchrow.return_value = None
+        with pytest.raises(UserDoesNotExist):
+            asyncio.run(self.db.get_serialized_user(self.telegram_id))
+
+    def test_get_user_id_successful(self) -> None:
+        self.connection.fetchval.return_value = 1
+        assert asyncio.run(self.db.get_user_id(self.telegram_id)) == 1
+
+    def test_add_user_returns_serialized_user(self) -> None:
+        self.connection.fetchrow.return_value = self.user_record
+        method_result = asyncio.run(self.db.add_user(self.telegram_id, "javoxirone", "Javohir", "Nurmatjonov", "en"))
+        assert method_result == self.user_record
+
+    def test_add_user_raises_user_already_exists(self) -> None:
+        self.connection.fetchrow.side_effect = UniqueViolationError()
+        with pytest.raises(UserAlreadyExistsError):
+            asyncio.run(self.db.add_user(self.telegram_id, "javoxirone", "Javohir", "Nurmatjonov", "en"))
+
+    def test_update_user_language_user_does_not_exist(self) -> None:
+        self.connection.execute.return_value = "UPDATE 0"
+        with pytest.raises(UserDoesNotExist):
+            asyncio.run(self.db.update_user_language(self.telegram_id, "uz"))
+
+    def test_driver_error_translated_to_db_error(self) -> None:
+        self.connection.fetchval.side_effect = PostgresError("relation \"users\" does not exist")
+        with pytest.raises(DBError):
+            asyncio.run(self.db.user_exists(self.telegram_id))
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import patch, Mock
 from database.repositories.conversation import Conversation
 from exceptions.database import UserDoesNotExist, RelatedRecordDoesNotExist
+from services.database.user_database_services import user_cache
 from tests.database.repositories.base import TestRepositoryBase
 
 
@@ -35,6 +36,22 @@ class TestConversation(TestRepositoryBase):
         with pytest.raises(ValueError):
             self.db._serialize((None,))  # type: ignore
 
+    def test_private_get_user_id_queries_on_its_own_connection(self) -> None:
+        self.db.conn.cursor.return_value.fetchone.return_value = (self.user_id,)
+        with patch('database.base.get_pool') as mock_get_pool:
+            assert self.db._get_user_id(self.telegram_id) == self.user_id
+            mock_get_pool.assert_not_called()
+
+    def test_private_get_user_id_uses_cached_user(self) -> None:
+        user_cache.set(self.telegram_id, {'user_id': 5})
+        assert self.db._get_user_id(self.telegram_id) == 5
+        self.db.conn.cursor.assert_not_called()
+
+    def test_private_get_user_id_raises_for_unknown_user(self) -> None:
+        self.db.conn.cursor.return_value.fetchone.return_value = None
+        with pytest.raises(RelatedRecordDoesNotExist):
+            self.db._get_user_id(self.telegram_id)
+
     def test_private_get_user_id_successful(self) -> None:
         with patch('psycopg2.connect') as mock_connect:
             mock_cursor: Mock = Mock()
@@ -0,0 +1,105 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from psycopg2 import extensions
+
+from database.pool import ConnectionPool
+from exceptions.database import ConnectionPoolTimeoutError, ConnectionPoolError
+
+
+def _make_connection():
+    connection = MagicMock()
+    connection.closed = 0
+    connection.info.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+    return connection
+
+
+class TestConnectionPool:
+    @patch('psycopg2.connect')
+    def test_prefill_opens_min_size_connections(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: _make_connection()
+        pool = ConnectionPool(min_size=2, max_size=4, timeout=0.1, health_check_interval=30, database="db")
+        assert mock_connect.call_count == 0
+
+        pool.prefill()
+
+        assert mock_connect.call_count == 2
+        mock_connect.assert_called_with(database="db")
+
+    @patch('psycopg2.connect')
+    def test_returned_connection_is_reused(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: _make_connection()
+        pool = ConnectionPool(min_size=0, max_size=2, timeout=0.1, health_check_interval=30)
+
+        conn = pool.getconn()
+        pool.putconn(conn)
+
+        assert pool.getconn() is conn
+        assert mock_connect.call_count == 1
+
+    @patch('psycopg2.connect')
+    def test_checkout_timeout_when_exhausted(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: _make_connection()
+        pool = ConnectionPool(min_size=0, max_size=1, timeout=0.05, health_check_interval=30)
+
+        pool.getconn()
+
+        with pytest.raises(ConnectionPoolTimeoutError):
+            pool.getconn()
+
+    @patch('psycopg2.connect')
+    def test_closed_connection_is_replaced(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: _make_connection()
+        pool = ConnectionPool(min_size=1, max_size=1, timeout=0.1, health_check_interval=30)
+        pool.prefill()
+
+        conn = pool.getconn()
+        pool.putconn(conn)
+        conn.closed = 1
+
+        new_conn = pool.getconn()
+        assert new_conn is not conn
+        assert mock_connect.call_count == 2
+
+    @patch('psycopg2.connect')
+    def test_stale_connection_fails_health_check(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: _make_connection()
+        pool = ConnectionPool(min_size=1, max_size=1, timeout=0.1, health_check_interval=0)
+
+        conn = pool.getconn()
+        conn.cursor.return_value.execute.side_effect = Exception("server closed the connection")
+        pool.putconn(conn)
+
+        assert pool.getconn() is not conn
+
+    @patch('psycopg2.connect')
+    def test_open_transaction_rolled_back_on_return(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: _make_connection()
+        pool = ConnectionPool(min_size=0, max_size=1, timeout=0.1, health_check_interval=30)
+
+        conn = pool.getconn()
+        conn.info.transaction_status = extensions.TRANSACTION_STATUS_INTRANS
+        pool.putconn(conn)
+
+        conn.rollback.assert_called_once()
+
+    @patch('psycopg2.connect')
+    def test_getconn_after_closeall_raises(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: _make_connection()
+        pool = ConnectionPool(min_size=1, max_size=1, timeout=0.1, health_check_interval=30)
+        pool.prefill()
+
+        pool.closeall()
+
+        with pytest.raises(ConnectionPoolError):
+            pool.getconn()
+
+    @patch('psycopg2.connect')
+    def test_surplus_idle_connection_is_closed(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: _make_connection()
+        pool = ConnectionPool(min_size=0, max_size=2, timeout=0.1, health_check_interval=0)
+
+        conn = pool.getconn()
+        pool.putconn(conn)
+
+        assert pool.getconn() is not conn
+        conn.close.assert_called_once()
@@ -0,0 +1,89 @@
+import io
+
+import pytest
+from docx import Document
+
+from exceptions.parser import DocumentTooLargeError
+from parser.document import DocumentParser, DocumentLimits
+from utils.common.token_common_utils import count_tokens
+
+
+def test_parse_txt_stream_with_file_name():
+    stream = io.BytesIO("Salom, dunyo!".encode("utf-8"))
+
+    assert DocumentParser().parse_document(stream, "notes.TXT") == "Salom, dunyo!"
+
+
+def test_parse_txt_stream_falls_back_to_latin_1():
+    stream = io.BytesIO("café".encode("latin-1"))
+
+    assert DocumentParser().parse_document(stream, "notes.txt") == "café"
+
+
+def test_parse_docx_stream():
+    document = Document()
+    document.add_paragraph("First paragraph")
+    document.add_paragraph("Second paragraph")
+    stream = io.BytesIO()
+    document.save(stream)
+
+    assert DocumentParser().parse_document(stream, "report.docx") == "First paragraph\nSecond paragraph"
+
+
+def test_parse_stream_with_unsupported_extension_returns_none():
+    assert DocumentParser().parse_document(io.BytesIO(b"data"), "archive.zip") is None
+
+
+def test_parse_path_still_supported(tmp_path):
+    (tmp_path / "notes.txt").write_text("From disk", encoding="utf-8")
+
+    assert DocumentParser().parse_document(str(tmp_path / "notes.txt")) == "From disk"
+
+
+def test_parsed_text_is_normalized():
+    stream = io.BytesIO("Header   \r\n\r\n\r\n\tBody\x00 text  \n".encode("utf-8"))
+
+    assert DocumentParser().parse_document(stream, "notes.txt") == "Header\n\nBody text"
+
+
+def _text_stream(lines: int) -> io.BytesIO:
+    return io.BytesIO("".join(f"Line {number} {'x' * 90}\n" for number in range(lines)).encode("utf-8"))
+
+
+def test_iter_document_yields_requested_sections_lazily():
+    sections = DocumentParser().iter_document(_text_stream(100), "notes.txt", pages=range(1, 2))
+
+    section = next(sections)
+    assert section.startswith("Line 31 ")
+    assert next(sections, None) is None
+
+
+def test_page_limit_stops_with_a_note():
+    parser = DocumentParser(DocumentLimits(max_pages=1))
+
+    sections = list(parser.iter_document(_text_stream(100), "notes.txt"))
+
+    assert len(sections) == 2
+    assert sections[1] == "[The document is longer than shown: only 1 pages are read.]"
+
+
+def test_page_limit_without_more_pages_adds_no_note():
+    parser = DocumentParser(DocumentLimits(max_pages=1))
+
+    assert parser.parse_document(_text_stream(2), "notes.txt").count("\n") == 1
+
+
+def test_token_budget_cuts_the_text():
+    parser = DocumentParser(DocumentLimits(max_tokens=50))
+
+    text = parser.parse_document(_text_stream(100), "notes.txt")
+
+    assert count_tokens(text.rsplit("\n", 1)[0], "gpt-4o-mini") <= 50
+    assert text.endswith("[The document is longer than shown: the text stops within page 1.]")
+
+
+def test_byte_limit_raises():
+    parser = DocumentParser(DocumentLimits(max_bytes=10))
+
+    with pytest.raises(DocumentTooLargeError):
+        parser.parse_document(_text_stream(1), "notes.txt")
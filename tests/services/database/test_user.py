@@ -1,6 +1,12 @@
 import pytest
 from unittest.mock import patch, Mock
-from services.database.user_database_services import get_user_id_by_telegram_id
+from services.database.user_database_services import (
+    get_user_id_by_telegram_id,
+    get_user_by_telegram_id,
+    get_user_language,
+    update_user_language,
+    user_cache,
+)
 
 
 @patch('psycopg2.connect')
@@ -14,3 +20,33 @@ def test_get_user_id_by_telegram_id_successful(mock_connect):
 
     result = get_user_id_by_telegram_id(123456789)
     assert result == 1
+
+
+@patch('psycopg2.connect')
+def test_get_user_by_telegram_id_served_from_cache(mock_connect):
+    mock_cursor = Mock()
+    mock_cursor.fetchone.return_value = (1, 123456789, 'javoxirone', 'Javohir', 'Nurmatjonov',
+                                         '2024-12-04 19:07:22.795534', 'en')
+    mock_connection = Mock()
+    mock_connection.cursor.return_value = mock_cursor
+    mock_connect.return_value = mock_connection
+
+    assert get_user_by_telegram_id(123456789)["language"] == 'en'
+    assert get_user_by_telegram_id(123456789)["language"] == 'en'
+    assert mock_cursor.fetchone.call_count == 1
+
+
+@patch('psycopg2.connect')
+def test_update_user_language_writes_through_cache(mock_connect):
+    user_cache.set(123456789, {'user_id': 1, 'telegram_id': 123456789, 'username': 'javoxirone',
+                               'first_name': 'Javohir', 'last_name': 'Nurmatjonov',
+                               'created_at': '2024-12-04 19:07:22.795534', 'language': 'en'})
+    mock_cursor = Mock()
+    mock_cursor.fetchone.return_value = (1,)
+    mock_connection = Mock()
+    mock_connection.cursor.return_value = mock_cursor
+    mock_connect.return_value = mock_connection
+
+    update_user_language(123456789, 'uz')
+
+    assert get_user_language(123456789) == 'uz'
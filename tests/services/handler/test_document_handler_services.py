@@ -0,0 +1,12 @@
+import pytest
+
+from exceptions.parser import DocumentTooLargeError
+from parser.document import DocumentLimits
+from services.handler.document_handler_services import parse_document_data
+
+
+def test_parse_document_data_applies_the_given_limits():
+    assert parse_document_data(b"Salom  dunyo", "notes.txt", DocumentLimits()) == "Salom dunyo"
+
+    with pytest.raises(DocumentTooLargeError):
+        parse_document_data(b"Salom dunyo", "notes.txt", DocumentLimits(max_bytes=4))
@@ -0,0 +1,53 @@
+import asyncio
+
+from services.handler.photo_handler_services import run_ocr_strategies, select_ocr_strategies
+
+
+class FakeEngine:
+    """Stands in for the process pool: each strategy finishes after its own delay."""
+
+    def __init__(self, results: dict[str, tuple[float, str, float]]):
+        self.results = results
+        self.finished: list[str] = []
+
+    async def run(self, func, image_data, strategy, lang):
+        delay, text, confidence = self.results[strategy]
+        await asyncio.sleep(delay)
+        if isinstance(text, Exception):
+            raise text
+        self.finished.append(strategy)
+        return text, confidence
+
+
+def test_confident_result_cancels_remaining_strategies():
+    engine = FakeEngine({
+        "grayscale": (0.0, "Confident text from photo", 95),
+        "otsu": (0.5, "Slower text that is never awaited", 99),
+    })
+
+    text = asyncio.run(run_ocr_strategies(engine, b"image", "en", ["grayscale", "otsu"], min_confidence=80))
+
+    assert text == "Confident text from photo"
+    assert engine.finished == ["grayscale"]
+
+
+def test_best_scored_result_wins_without_confident_one():
+    engine = FakeEngine({
+        "grayscale": (0.0, "x#~", 40),
+        "psm6": (0.01, "Readable words here", 60),
+        "inverted": (0.02, RuntimeError("worker died"), 0),
+    })
+
+    text = asyncio.run(run_ocr_strategies(engine, b"image", "en", ["grayscale", "psm6", "inverted"]))
+
+    assert text == "Readable words here"
+
+
+def test_no_text_returns_empty_string():
+    engine = FakeEngine({"grayscale": (0.0, "", 0)})
+
+    assert asyncio.run(run_ocr_strategies(engine, b"image", "en", ["grayscale"])) == ""
+
+
+def test_fewer_strategies_under_load():
+    assert len(select_ocr_strategies(0.0)) > len(select_ocr_strategies(0.6)) > len(select_ocr_strategies(2.0))
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+from utils.api.openai_api_utils import build_prompt_messages, get_summary_message, get_document_context_message
+from utils.common.token_common_utils import MESSAGE_TOKEN_OVERHEAD, REPLY_PRIMING_TOKENS
+
+
+def _message(role: str, content: str, token_count: int) -> dict:
+    return {"role": role, "content": content, "token_count": token_count}
+
+
+@patch('utils.api.openai_api_utils.get_model_context_size', return_value=1000)
+def test_build_prompt_messages_keeps_everything_that_fits(mock_context_size):
+    conversation_list = [_message("user", "Hi", 10), _message("assistant", "Hello!", 10)]
+
+    prompt = build_prompt_messages(conversation_list, "test-model", max_tokens=100)
+
+    assert prompt == [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello!"}]
+
+
+@patch('utils.api.openai_api_utils.get_model_context_size', return_value=1000)
+def test_build_prompt_messages_drops_oldest_messages_over_budget(mock_context_size):
+    budget = 1000 - 100 - REPLY_PRIMING_TOKENS
+    conversation_list = [
+        _message("user", "oldest", budget),
+        _message("assistant", "middle", 300),
+        _message("user", "newest", 300),
+    ]
+
+    prompt = build_prompt_messages(conversation_list, "test-model", max_tokens=100)
+
+    assert [message["content"] for message in prompt] == ["middle", "newest"]
+
+
+@patch('utils.api.openai_api_utils.get_model_context_size', return_value=1000)
+def test_build_prompt_messages_accounts_for_system_message(mock_context_size):
+    system_message = {"role": "developer", "content": "x" * 2000}
+    conversation_list = [_message("user", "older", 400), _message("user", "newest", 400)]
+
+    with patch('utils.common.token_common_utils._get_encoding', return_value=None):
+        prompt = build_prompt_messages(conversation_list, "test-model", 100, system_message)
+
+    assert prompt == [system_message, {"role": "user", "content": "newest"}]
+
+
+@patch('utils.api.openai_api_utils.get_model_context_size', return_value=200)
+def test_build_prompt_messages_truncates_oversized_newest_message(mock_context_size):
+    conversation_list = [_message("user", "a" * 4000, 1000)]
+
+    with patch('utils.common.token_common_utils._get_encoding', return_value=None):
+        prompt = build_prompt_messages(conversation_list, "test-model", max_tokens=100)
+
+    expected_tokens = 200 - 100 - REPLY_PRIMING_TOKENS - MESSAGE_TOKEN_OVERHEAD
+    assert prompt == [{"role": "user", "content": "a" * expected_tokens * 4}]
+
+
+@patch('utils.api.openai_api_utils.count_tokens', return_value=9)
+def test_get_summary_message_reuses_stored_token_count(mock_count_tokens):
+    summary = {"summary": "User lives in Tashkent.", "summarized_until": None, "token_count": 5}
+
+    message = get_summary_message(summary, "test-model")
+
+    assert message["role"] == "developer"
+    assert message["content"].endswith("User lives in Tashkent.")
+    assert message["token_count"] == 14
+
+
+def test_get_document_context_message_labels_chunks():
+    document_chunks = [
+        {"file_name": "contract.pdf", "chunk_index": 2, "content": "Payment is due.", "token_count": 4},
+        {"file_name": None, "chunk_index": 0, "content": "Notes.", "token_count": 2},
+    ]
+
+    with patch('utils.common.token_common_utils._get_encoding', return_value=None):
+        message = get_document_context_message(document_chunks, "test-model")
+
+    assert message["role"] == "developer"
+    assert "[contract.pdf, part 3]\nPayment is due." in message["content"]
+    assert "[document, part 1]\nNotes." in message["content"]
+    assert message["token_count"] > 0
@@ -0,0 +1,68 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from utils.common.cache_common_utils import TTLCache, TieredCache
+
+
+class TestTTLCache:
+    def test_get_returns_stored_value_and_counts_hit(self) -> None:
+        cache = TTLCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = TTLCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+        assert len(cache) == 2
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        cache = TTLCache(max_size=2, ttl=10)
+        with patch('utils.common.cache_common_utils.time.monotonic', return_value=100.0):
+            cache.set("a", 1)
+        with patch('utils.common.cache_common_utils.time.monotonic', return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_peek_does_not_touch_counters(self) -> None:
+        cache = TTLCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        assert cache.peek("a") == 1
+        assert cache.stats()["hits"] == 0
+
+
+class TestTieredCache:
+    def test_redis_hit_is_copied_to_memory(self) -> None:
+        redis_client = AsyncMock()
+        redis_client.get.return_value = b"text"
+        cache = TieredCache(TTLCache(max_size=2, ttl=60), redis_client, key_prefix="p:")
+        assert asyncio.run(cache.get("a")) == "text"
+        assert asyncio.run(cache.get("a")) == "text"
+        redis_client.get.assert_awaited_once_with("p:a")
+        assert cache.stats()["redis_hits"] == 1
+        assert cache.stats()["total_hit_rate"] == 1.0
+
+    def test_redis_errors_are_treated_as_misses(self) -> None:
+        redis_client = AsyncMock()
+        redis_client.get.side_effect = ConnectionError()
+        redis_client.set.side_effect = ConnectionError()
+        cache = TieredCache(TTLCache(max_size=2, ttl=60), redis_client)
+        asyncio.run(cache.set("a", "text"))
+        assert asyncio.run(cache.get("b")) is None
+        assert cache.stats()["redis_errors"] == 2
+
+    def test_large_values_skip_memory_tier(self) -> None:
+        cache = TieredCache(TTLCache(max_size=2, ttl=60), max_memory_item_size=3)
+        asyncio.run(cache.set("a", "long text"))
+        asyncio.run(cache.set("b", "ok"))
+        assert asyncio.run(cache.get("a")) is None
+        assert asyncio.run(cache.get("b")) == "ok"
@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+from utils.common.rate_limit_common_utils import TokenBucket, ChatRateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_refills_at_rate():
+    clock = FakeClock()
+    with patch('utils.common.rate_limit_common_utils.time.monotonic', clock):
+        bucket = TokenBucket(rate=2, capacity=1)
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+        assert bucket.delay() == 0.5
+        clock.now += 0.5
+        assert bucket.try_acquire()
+
+
+def test_token_bucket_block_for_delays_tokens():
+    clock = FakeClock()
+    with patch('utils.common.rate_limit_common_utils.time.monotonic', clock):
+        bucket = TokenBucket(rate=10, capacity=5)
+        bucket.block_for(3)
+        assert bucket.delay() == 3
+        clock.now += 3
+        assert bucket.try_acquire()
+
+
+def test_chat_rate_limiter_backoff_halves_rate_and_recovers():
+    limiter = ChatRateLimiter(global_rate=30, chat_interval=1, group_chat_interval=3, max_chat_interval=10)
+    bucket = limiter.get_chat_bucket(42)
+    assert bucket.rate == 1
+
+    limiter.backoff(42, retry_after=5)
+    assert bucket.rate == 0.5
+    assert bucket.delay() > 4
+
+    limiter.record_success(42)
+    assert bucket.rate == 0.6
+
+
+def test_chat_rate_limiter_uses_group_interval_for_groups():
+    limiter = ChatRateLimiter(global_rate=30, chat_interval=1, group_chat_interval=3, max_chat_interval=10)
+    assert limiter.get_chat_bucket(-100123).rate == 1 / 3
+
+
+def test_chat_rate_limiter_evicts_least_recently_used_idle_buckets():
+    limiter = ChatRateLimiter(global_rate=30, chat_interval=0.001, group_chat_interval=3, max_chat_interval=10)
+    limiter.MAX_CHAT_BUCKETS = 2
+    first_bucket = limiter.get_chat_bucket(1)
+    limiter.get_chat_bucket(2)
+    limiter.get_chat_bucket(1)
+    limiter.get_chat_bucket(3)
+    assert limiter.get_chat_bucket(1) is first_bucket
+    assert set(limiter._chat_buckets) == {1, 3}
+
+
+def test_chat_rate_limiter_keeps_buckets_that_still_limit_their_chat():
+    limiter = ChatRateLimiter(global_rate=30, chat_interval=1, group_chat_interval=3, max_chat_interval=10)
+    limiter.MAX_CHAT_BUCKETS = 1
+    blocked_bucket = limiter.get_chat_bucket(1)
+    limiter.backoff(1, retry_after=5)
+    limiter.get_chat_bucket(2)
+    assert limiter.get_chat_bucket(1) is blocked_bucket
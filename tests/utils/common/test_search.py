@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+from utils.common.search_common_utils import BM25Index, tokenize_for_search
+from utils.common.token_common_utils import count_tokens, split_text_into_chunks
+
+
+def test_tokenize_for_search_lowercases_and_skips_single_characters() -> None:
+    assert tokenize_for_search("Toshkent — a city, Тошкент!") == ["toshkent", "city", "тошкент"]
+
+
+class TestBM25Index:
+    def setup_method(self) -> None:
+        self.index = BM25Index([
+            "The contract is signed in Tashkent on the first of May.",
+            "Payment is due within thirty days after delivery.",
+            "Delivery of the goods takes place in Samarkand.",
+        ])
+
+    def test_search_ranks_the_matching_text_first(self) -> None:
+        results = self.index.search("When is the payment due?", k=3)
+        assert results[0][0] == 1
+
+    def test_search_leaves_out_texts_without_common_words(self) -> None:
+        assert [position for position, _ in self.index.search("Samarkand", k=3)] == [2]
+        assert self.index.search("unrelated question", k=3) == []
+
+    def test_unrelated_question_returns_nothing(self) -> None:
+        assert self.index.search("What is the weather like today?", k=3, min_coverage=0.5) == []
+
+    def test_stopwords_do_not_match(self) -> None:
+        assert tokenize_for_search("What is the price of it in Tashkent?") == ["price", "tashkent"]
+        assert self.index.search("is the in of", k=3) == []
+
+    def test_min_coverage_leaves_out_texts_matching_only_part_of_the_question(self) -> None:
+        results = self.index.search("delivery of goods to Samarkand", k=3, min_coverage=0.5)
+        assert [position for position, _ in results] == [2]
+
+    def test_search_returns_at_most_k_results(self) -> None:
+        assert len(self.index.search("the delivery payment contract", k=2)) == 2
+
+    def test_rare_words_weigh_more(self) -> None:
+        results = dict(self.index.search("Tashkent delivery", k=3))
+        assert results[0] > results[1]
+
+    def test_empty_index_finds_nothing(self) -> None:
+        assert BM25Index([]).search("anything", k=3) == []
+
+
+class TestSplitTextIntoChunks:
+    def setup_method(self) -> None:
+        self.encoding_patcher = patch('utils.common.token_common_utils._get_encoding', return_value=None)
+        self.encoding_patcher.start()
+
+    def teardown_method(self) -> None:
+        self.encoding_patcher.stop()
+
+    def test_short_text_is_one_chunk(self) -> None:
+        assert split_text_into_chunks("First line\n\nSecond line", 100, "test-model") == ["First line\nSecond line"]
+
+    def test_chunks_end_at_line_breaks_and_respect_the_limit(self) -> None:
+        lines = [f"Line {number} " + "x" * 30 for number in range(20)]
+        chunks = split_text_into_chunks("\n".join(lines), 50, "test-model")
+        assert len(chunks) > 1
+        assert "\n".join(chunks).splitlines() == lines
+        assert all(count_tokens(chunk, "test-model") <= 50 for chunk in chunks)
+
+    def test_long_line_is_split_between_words(self) -> None:
+        line = " ".join(f"word{number}" for number in range(200))
+        chunks = split_text_into_chunks(line, 40, "test-model")
+        assert len(chunks) > 1
+        assert " ".join(chunks) == line
+        assert all(count_tokens(chunk, "test-model") <= 40 for chunk in chunks)
+
+    def test_words_longer_than_a_chunk_are_split_without_losing_text(self) -> None:
+        text = "Intro " + "x" * 4000 + " " + "漢字" * 500 + " outro"
+        chunks = split_text_into_chunks(text, 100, "test-model")
+        assert len(chunks) > 1
+        assert "".join("".join(chunks).split()) == "".join(text.split())
+        assert all(count_tokens(chunk, "test-model") <= 100 for chunk in chunks)
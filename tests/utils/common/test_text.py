@@ -0,0 +1,51 @@
+import re
+import random
+
+from utils.common.text_common_utils import OCR_TEXT_NORMALIZER, DOCUMENT_TEXT_NORMALIZER
+
+
+def legacy_postprocess_text(text: str) -> str:
+    """The regex chain postprocess_text used before TextNormalizer, kept as the reference."""
+    cleaned = re.sub(r'\s+', ' ', text).strip()
+    cleaned = cleaned.replace('|', 'I')
+    cleaned = cleaned.replace('0', 'O', 1) if cleaned.startswith('0') else cleaned
+    cleaned = re.sub(r'(\w)\.(\w)', r'\1. \2', cleaned)
+    cleaned = re.sub(r'([,:;])(\w)', r'\1 \2', cleaned)
+    cleaned = re.sub(r'(\w)-\s*\n\s*(\w)', r'\1\2', cleaned)
+    cleaned = re.sub(r'(?<!\n)\n(?!\n)', ' ', cleaned)
+    cleaned = re.sub(r'\n{2,}', '\n\n', cleaned)
+    cleaned = ''.join(char for char in cleaned if char.isprintable() or char in ['\n', '\t'])
+    cleaned = re.sub(r'wwwv\.', 'www.', cleaned)
+    cleaned = re.sub(r'([a-zA-Z0-9_\-\.]+)@([a-zA-Z0-9_\-\.]+)\.([a-zA-Z]{2,5})', r'\1@\2.\3', cleaned)
+    return cleaned
+
+
+OCR_SAMPLES = [
+    "0rder |D: 12.5\nTotal:100,00 so'm\n\nThank you!",
+    "Visit wwwv.example.com or mail info@bilagon.uz;call +998 90 123-45-67",
+    "Привет,мир.Это тест:проверка;OCR  \t текст с пробелами",
+    "Salom,dunyo.Bu o'zbekcha matn.Inter-\nnational",
+    "a.b.c.d, x,y,z; e:f\x00.g wwwv\x07.site zero​width",
+    "   \n\n  ",
+    "|||0|0.0.0",
+    "Line one\r\nLine two\x0cpage sep\x1cfile",
+]
+
+
+def test_ocr_normalizer_matches_legacy_postprocess_on_samples():
+    for sample in OCR_SAMPLES:
+        assert OCR_TEXT_NORMALIZER.normalize(sample) == legacy_postprocess_text(sample), sample
+
+
+def test_ocr_normalizer_matches_legacy_postprocess_on_random_text():
+    alphabet = "ab0Ow.|,:;@-_ \n\t\r\x00\x07 ​вю"
+    generator = random.Random(18)
+    for _ in range(2000):
+        sample = "".join(generator.choice(alphabet) for _ in range(generator.randint(0, 30)))
+        assert OCR_TEXT_NORMALIZER.normalize(sample) == legacy_postprocess_text(sample), repr(sample)
+
+
+def test_document_normalizer_keeps_paragraphs_and_literal_characters():
+    text = "Title  \n\n\n  | a | b |\t\n3.14 is pi,see\x00 table\n\n"
+
+    assert DOCUMENT_TEXT_NORMALIZER.normalize(text) == "Title\n\n| a | b |\n3.14 is pi,see table"
@@ -0,0 +1,19 @@
+from unittest.mock import patch
+
+from utils.common.timing_common_utils import StageTimer
+
+
+def test_stage_timer_accumulates_stage_durations():
+    clock = iter([0.0, 0.5, 1.0, 1.25, 2.0, 2.5])
+    timer = StageTimer()
+    with patch('utils.common.timing_common_utils.time.perf_counter', lambda: next(clock)):
+        with timer.stage("decode"):
+            pass
+        with timer.stage("ocr"):
+            pass
+        with timer.stage("decode"):
+            pass
+
+    assert timer.timings == {"decode": 1.0, "ocr": 0.25}
+    assert timer.total == 1.25
+    assert str(timer) == "decode=1000.0ms ocr=250.0ms total=1250.0ms"
@@ -0,0 +1,179 @@
+import cv2
+import numpy as np
+from unittest.mock import MagicMock, patch
+from PIL import Image
+
+from utils.handler.photo_handler_utils import (
+    decode_image,
+    to_grayscale,
+    safe_preprocess_image,
+    estimate_text_height,
+    normalize_text_scale,
+    crop_text_regions,
+    detect_script,
+    get_tesseract_languages,
+    ocr_data_confidence,
+    recognize_text,
+    recognize_text_with_confidence,
+)
+
+
+def _write_test_image(path) -> np.ndarray:
+    image = np.zeros((40, 120, 3), dtype=np.uint8)
+    cv2.putText(image, "OCR", (5, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+    cv2.imwrite(str(path), image)
+    return image
+
+
+def test_decode_image_returns_bgr_array(tmp_path):
+    original = _write_test_image(tmp_path / "photo.png")
+
+    image = decode_image(str(tmp_path / "photo.png"))
+
+    assert image.shape == original.shape
+    assert np.array_equal(image, original)
+
+
+def test_decode_image_falls_back_to_pillow(tmp_path):
+    Image.new("RGB", (8, 4), (255, 0, 0)).save(tmp_path / "photo.gif")
+
+    image = decode_image(str(tmp_path / "photo.gif"))
+
+    assert image.shape == (4, 8, 3)
+    assert tuple(image[0, 0]) == (0, 0, 255)
+
+
+def test_decode_image_rejects_invalid_files(tmp_path):
+    (tmp_path / "empty.jpg").write_bytes(b"")
+    (tmp_path / "broken.jpg").write_bytes(b"not an image")
+
+    assert decode_image(str(tmp_path / "empty.jpg")) is None
+    assert decode_image(str(tmp_path / "broken.jpg")) is None
+
+
+def test_preprocessing_reuses_grayscale_buffer(tmp_path):
+    gray = to_grayscale(_write_test_image(tmp_path / "photo.png"))
+
+    assert to_grayscale(gray) is gray
+    binary = safe_preprocess_image(gray)
+    assert binary.shape == gray.shape
+    assert set(np.unique(binary)) <= {0, 255}
+
+
+def test_decode_image_accepts_downloaded_bytes(tmp_path):
+    original = _write_test_image(tmp_path / "photo.png")
+
+    image = decode_image((tmp_path / "photo.png").read_bytes())
+
+    assert np.array_equal(image, original)
+
+
+def _text_page(scale: float) -> np.ndarray:
+    page = np.full((int(400 * scale), int(600 * scale)), 255, dtype=np.uint8)
+    for line in range(3):
+        cv2.putText(page, "Sample text line", (int(20 * scale), int((60 + 40 * line) * scale)),
+                    cv2.FONT_HERSHEY_SIMPLEX, scale, 0, max(1, int(2 * scale)))
+    return page
+
+
+def test_large_text_is_downscaled_to_target_height():
+    page = _text_page(4)
+
+    normalized = normalize_text_scale(page, target_text_height=24, max_side=10_000)
+
+    assert normalized.shape[0] < page.shape[0] / 2
+    assert abs(estimate_text_height(normalized) - 24) < 8
+
+
+def test_image_without_text_is_only_capped():
+    blank = np.full((300, 3000), 255, dtype=np.uint8)
+
+    assert normalize_text_scale(blank, max_side=1500).shape == (150, 1500)
+    assert normalize_text_scale(blank[:, :1000], max_side=1500) is not None
+
+
+def test_separate_text_blocks_are_cropped():
+    page = np.full((800, 800), 255, dtype=np.uint8)
+    cv2.putText(page, "Top", (20, 60), cv2.FONT_HERSHEY_SIMPLEX, 1, 0, 2)
+    cv2.putText(page, "Bottom", (500, 760), cv2.FONT_HERSHEY_SIMPLEX, 1, 0, 2)
+
+    crops = crop_text_regions(page)
+
+    assert len(crops) == 2
+    assert sum(crop.size for crop in crops) < page.size / 10
+
+
+def test_blank_image_is_returned_whole():
+    blank = np.full((100, 100), 255, dtype=np.uint8)
+
+    assert crop_text_regions(blank)[0] is blank
+
+
+def test_detected_script_narrows_languages():
+    assert get_tesseract_languages("uz", "Latin") == "uzb+eng"
+    assert get_tesseract_languages("en", "Latin") == "eng"
+    assert get_tesseract_languages("ru", "Latin") == "eng"
+    assert get_tesseract_languages("uz", "Cyrillic") == "rus"
+    assert get_tesseract_languages("ru", None) == "rus+eng+rus+uzb"
+    assert get_tesseract_languages("de", "Arabic") == "eng+rus+uzb"
+
+
+def test_failed_or_unsure_script_detection_returns_none():
+    with patch("utils.handler.photo_handler_utils.pytesseract.image_to_osd", side_effect=RuntimeError("Too few characters")):
+        assert detect_script(np.zeros((10, 10), dtype=np.uint8)) is None
+    with patch("utils.handler.photo_handler_utils.pytesseract.image_to_osd",
+               return_value={"script": "Cyrillic", "script_conf": 0.2}):
+        assert detect_script(np.zeros((10, 10), dtype=np.uint8)) is None
+    with patch("utils.handler.photo_handler_utils.pytesseract.image_to_osd",
+               return_value={"script": "Cyrillic", "script_conf": 4.0}):
+        assert detect_script(np.zeros((10, 10), dtype=np.uint8)) == "Cyrillic"
+
+
+def test_ocr_data_confidence_is_the_mean_of_recognized_words():
+    data = {
+        "text": ["", "Hello", "world", "", "Again"],
+        "conf": [-1, 90, 80, -1, "70"],
+    }
+
+    assert ocr_data_confidence(data) == 80.0
+    assert ocr_data_confidence({"text": [""], "conf": [-1]}) == 0.0
+
+
+def test_recognize_text_reuses_loaded_tesserocr_api():
+    api = MagicMock()
+    api.GetUTF8Text.return_value = "text"
+    api.MeanTextConf.return_value = 91
+    with patch("utils.handler.photo_handler_utils._get_tesserocr", return_value=MagicMock()), \
+            patch("utils.handler.photo_handler_utils._get_tesseract_api", return_value=api) as get_api:
+        image = np.zeros((10, 10), dtype=np.uint8)
+        assert recognize_text_with_confidence(image, "eng", 6) == ("text", 91.0)
+        get_api.assert_called_once_with("eng", 6)
+        api.Clear.assert_called_once()
+
+
+def _write_tesseract_output(input_filename, output_base, extension, lang, config):
+    with open(f"{output_base}.txt", "w", encoding="utf-8") as text_file:
+        text_file.write("Hello    world\n\nNext paragraph\n\x0c")
+    with open(f"{output_base}.tsv", "w", encoding="utf-8") as tsv_file:
+        tsv_file.write("level\tconf\ttext\n5\t80\tHello\n5\t70\tworld\n5\t-1\t\n")
+
+
+def test_recognize_text_falls_back_to_one_tesseract_run_with_image_to_string_text():
+    with patch("utils.handler.photo_handler_utils._get_tesserocr", return_value=None), \
+            patch("utils.handler.photo_handler_utils.pytesseract.pytesseract.run_tesseract",
+                  side_effect=_write_tesseract_output) as run_tesseract:
+        text, confidence = recognize_text_with_confidence(np.zeros((10, 10), dtype=np.uint8), "rus", 3, True)
+
+    # The plain text output keeps interword spacing and paragraph breaks as image_to_string does
+    assert (text, confidence) == ("Hello    world\n\nNext paragraph\n\x0c", 75.0)
+    run_tesseract.assert_called_once()
+    _, _, extension, lang, config = run_tesseract.call_args.args
+    assert (extension, lang) == ("txt", "rus")
+    assert config == "--oem 1 --psm 3 -c preserve_interword_spaces=1 -c tessedit_create_tsv=1"
+
+
+def test_recognize_text_falls_back_to_image_to_string():
+    with patch("utils.handler.photo_handler_utils._get_tesserocr", return_value=None), \
+            patch("utils.handler.photo_handler_utils.pytesseract.image_to_string", return_value="Hi\n") as image_to_string:
+        assert recognize_text(np.zeros((10, 10), dtype=np.uint8), "eng", 6) == "Hi\n"
+        assert image_to_string.call_args.kwargs == {"lang": "eng", "config": "--oem 1 --psm 6"}
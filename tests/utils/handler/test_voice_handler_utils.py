@@ -0,0 +1,27 @@
+from utils.handler.voice_handler_utils import parse_silences, choose_split_points
+
+FFMPEG_OUTPUT = """
+[silencedetect @ 0x5581] silence_start: -0.01
+[silencedetect @ 0x5581] silence_end: 0.52 | silence_duration: 0.53
+size=N/A time=00:00:10.00 bitrate=N/A speed= 320x
+[silencedetect @ 0x5581] silence_start: 4.2
+[silencedetect @ 0x5581] silence_end: 4.9 | silence_duration: 0.7
+[silencedetect @ 0x5581] silence_start: 9.5
+"""
+
+
+def test_parse_silences_pairs_starts_and_ends():
+    assert parse_silences(FFMPEG_OUTPUT, 10.0) == [(0.0, 0.52), (4.2, 4.9), (9.5, 10.0)]
+
+
+def test_short_audio_is_not_split():
+    assert choose_split_points([(30.0, 31.0)], 100.0, target_seconds=60, max_seconds=120) == []
+
+
+def test_audio_is_cut_in_the_silence_closest_to_the_target_length():
+    silences = [(20.0, 21.0), (58.0, 59.0), (95.0, 96.0), (118.0, 119.0), (170.0, 171.0)]
+    assert choose_split_points(silences, 200.0, target_seconds=60, max_seconds=120) == [58.5, 118.5]
+
+
+def test_audio_without_silences_is_cut_at_the_maximum_length():
+    assert choose_split_points([], 250.0, target_seconds=60, max_seconds=120) == [120.0, 240.0]
@@ -0,0 +1,139 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from exceptions.worker import WorkerError, WorkerTimeoutError
+from workers.pool import ProcessPoolEngine, limit_worker_memory
+
+
+def square(number: int) -> int:
+    return number * number
+
+
+def sleep_for(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def fail(message: str) -> None:
+    raise ValueError(message)
+
+
+def test_run_returns_results_of_concurrent_jobs():
+    async def run() -> list[int]:
+        engine = ProcessPoolEngine(max_workers=2, max_pending=1, timeout=30)
+        try:
+            return await asyncio.gather(*(engine.run(square, number) for number in range(5)))
+        finally:
+            await engine.shutdown()
+
+    assert asyncio.run(run()) == [0, 1, 4, 9, 16]
+
+
+def test_run_raises_worker_timeout_error():
+    async def run() -> None:
+        engine = ProcessPoolEngine(max_workers=1, timeout=30)
+        try:
+            await engine.run(sleep_for, 2, timeout=0.5)
+        finally:
+            await engine.shutdown()
+
+    with pytest.raises(WorkerTimeoutError):
+        asyncio.run(run())
+
+
+def test_job_exceptions_are_propagated():
+    async def run() -> None:
+        engine = ProcessPoolEngine(max_workers=1, timeout=30)
+        try:
+            await engine.run(fail, "bad image")
+        finally:
+            await engine.shutdown()
+
+    with pytest.raises(ValueError, match="bad image"):
+        asyncio.run(run())
+
+
+def test_run_after_shutdown_raises_worker_error():
+    async def run() -> None:
+        engine = ProcessPoolEngine(max_workers=1)
+        await engine.shutdown()
+        await engine.run(square, 2)
+
+    with pytest.raises(WorkerError):
+        asyncio.run(run())
+
+
+def test_load_counts_running_jobs_per_worker():
+    async def run() -> tuple[float, float]:
+        engine = ProcessPoolEngine(max_workers=2, timeout=30)
+        try:
+            job = asyncio.create_task(engine.run(sleep_for, 1))
+            await asyncio.sleep(0.1)
+            busy_load = engine.load
+            await job
+            return busy_load, engine.load
+        finally:
+            await engine.shutdown()
+
+    assert asyncio.run(run()) == (0.5, 0.0)
+
+
+_initialized_pid: int | None = None
+
+
+def mark_initialized() -> None:
+    global _initialized_pid
+    _initialized_pid = os.getpid()
+
+
+def worker_state() -> tuple[int, int | None]:
+    return os.getpid(), _initialized_pid
+
+
+def test_workers_are_initialized_once_and_recycled():
+    async def run() -> list[tuple[int, int | None]]:
+        engine = ProcessPoolEngine(max_workers=1, timeout=30, initializer=mark_initialized, max_tasks_per_child=2)
+        try:
+            return [await engine.run(worker_state) for _ in range(4)]
+        finally:
+            await engine.shutdown()
+
+    states = asyncio.run(run())
+    assert all(pid == initialized_pid for pid, initialized_pid in states)
+    assert states[0][0] == states[1][0]
+    assert len({pid for pid, _ in states}) == 2
+
+
+def allocate(size: int) -> int:
+    return len(bytearray(size))
+
+
+def test_memory_limit_fails_the_job_not_the_host():
+    async def run() -> None:
+        engine = ProcessPoolEngine(max_workers=1, timeout=30, initializer=limit_worker_memory,
+                                   initargs=(1024 ** 3,))
+        try:
+            await engine.run(allocate, 2 * 1024 ** 3)
+        finally:
+            await engine.shutdown()
+
+    with pytest.raises(MemoryError):
+        asyncio.run(run())
+
+
+def test_hung_job_is_killed_on_timeout():
+    async def run() -> int:
+        engine = ProcessPoolEngine(max_workers=1, timeout=30, kill_on_timeout=True)
+        try:
+            with pytest.raises(WorkerTimeoutError):
+                await engine.run(sleep_for, 60, timeout=0.5)
+            # The killed worker is replaced for the next job
+            return await engine.run(square, 3)
+        finally:
+            await engine.shutdown()
+
+    started_at = time.monotonic()
+    assert asyncio.run(run()) == 9
+    assert time.monotonic() - started_at < 20
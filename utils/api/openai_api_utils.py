@@ -0,0 +1,135 @@
+from config.constants import MODEL_CONTEXT_SIZES, DEFAULT_MODEL_CONTEXT_SIZE
+from data_types.database import (
+    ConversationDataType,
+    ConversationSummaryDataType,
+    DocumentChunkDataType,
+    TokenizedConversationDataType,
+)
+from utils.common.token_common_utils import (
+    count_tokens,
+    truncate_to_tokens,
+    MESSAGE_TOKEN_OVERHEAD,
+    REPLY_PRIMING_TOKENS,
+)
+
+
+def get_model_context_size(model: str) -> int:
+    """
+    Return the context window of ``model`` in tokens.
+
+    :param model: Name of the OpenAI model.
+    :type model: str
+    :return: Number of tokens shared by the prompt and the response.
+    :rtype: int
+    """
+    return MODEL_CONTEXT_SIZES.get(model, DEFAULT_MODEL_CONTEXT_SIZE)
+
+
+def get_message_token_count(message: ConversationDataType | TokenizedConversationDataType, model: str) -> int:
+    """
+    Return the prompt cost of a chat message, using its stored token count when present.
+
+    :param message: Chat message, optionally carrying ``token_count``.
+    :param model: Name of the OpenAI model.
+    :type model: str
+    :return: Tokens the message takes in the prompt including per-message overhead.
+    :rtype: int
+    """
+    token_count = message.get("token_count")
+    if token_count is None:
+        token_count = count_tokens(message["content"], model)
+    return token_count + MESSAGE_TOKEN_OVERHEAD
+
+
+SUMMARY_MESSAGE_PREFIX = "Summary of the earlier part of this conversation:\n"
+
+
+def get_summary_message(summary: ConversationSummaryDataType, model: str) -> TokenizedConversationDataType:
+    """
+    Turn a stored conversation summary into a message placed before the recent turns.
+
+    :param summary: Rolling summary of the older part of the conversation.
+    :param model: Name of the OpenAI model.
+    :type model: str
+    :return: Developer message carrying the summary and its token count.
+    :rtype: TokenizedConversationDataType
+    """
+    token_count = summary["token_count"]
+    if token_count is not None:
+        token_count += count_tokens(SUMMARY_MESSAGE_PREFIX, model)
+    return TokenizedConversationDataType(
+        role="developer",
+        content=SUMMARY_MESSAGE_PREFIX + summary["summary"],
+        token_count=token_count
+    )
+
+
+DOCUMENT_CONTEXT_MESSAGE_PREFIX = (
+    "Excerpts of documents the user uploaded, selected for the latest message. "
+    "Answer from them when they are relevant and say so when they do not contain the answer.\n"
+)
+
+
+def get_document_context_message(document_chunks: list[DocumentChunkDataType],
+                                 model: str) -> TokenizedConversationDataType:
+    """
+    Turn retrieved document chunks into a message placed before the latest user message.
+
+    :param document_chunks: Chunks of the user's documents, in the order they should be shown.
+    :param model: Name of the OpenAI model.
+    :type model: str
+    :return: Developer message carrying the chunks and its token count.
+    :rtype: TokenizedConversationDataType
+    """
+    content = DOCUMENT_CONTEXT_MESSAGE_PREFIX + "".join(
+        f"\n[{chunk['file_name'] or 'document'}, part {chunk['chunk_index'] + 1}]\n{chunk['content']}\n"
+        for chunk in document_chunks
+    )
+    return TokenizedConversationDataType(
+        role="developer",
+        content=content,
+        token_count=count_tokens(content, model)
+    )
+
+
+def build_prompt_messages(conversation_list: list[ConversationDataType | TokenizedConversationDataType],
+                          model: str,
+                          max_tokens: int,
+                          system_message: ConversationDataType | None = None) -> list[ConversationDataType]:
+    """
+    Assemble the largest recent suffix of ``conversation_list`` that fits into the model context.
+
+    The budget is the model context minus the ``max_tokens`` reserved for the answer and the
+    system message. If even the newest message does not fit, its content is truncated instead of
+    letting the request fail with a context overflow.
+
+    :param conversation_list: Chronological chat history, newest message last.
+    :param model: Name of the OpenAI model.
+    :type model: str
+    :param max_tokens: Tokens reserved for the response.
+    :type max_tokens: int
+    :param system_message: Optional message prepended to the prompt.
+    :return: Messages ready to be sent to the chat completions API.
+    :rtype: list[ConversationDataType]
+    """
+    budget = get_model_context_size(model) - max_tokens - REPLY_PRIMING_TOKENS
+    if system_message is not None:
+        budget -= get_message_token_count(system_message, model)
+
+    selected_messages: list[ConversationDataType] = []
+    for message in reversed(conversation_list):
+        message_tokens = get_message_token_count(message, model)
+        if message_tokens <= budget:
+            budget -= message_tokens
+            selected_messages.append({"role": message["role"], "content": message["content"]})
+            continue
+        if not selected_messages:
+            content = truncate_to_tokens(message["content"], budget - MESSAGE_TOKEN_OVERHEAD, model)
+            if content:
+                selected_messages.append({"role": message["role"], "content": content})
+        break
+
+    selected_messages.reverse()
+    if system_message is not None:
+        return [system_message] + selected_messages
+    return selected_messages
@@ -1,32 +1,30 @@
-import os
+from tempfile import SpooledTemporaryFile
+
+from config.constants import MEDIA_SPOOL_MAX_SIZE
 from config.integrations import bot
 
 
-async def download_file(file_obj: object, dir_path: str, file_name: str, file_type: str) -> str:
+async def download_file_to_buffer(file_obj: object, max_memory_size: int = MEDIA_SPOOL_MAX_SIZE) -> SpooledTemporaryFile:
     """
-    This utility function downloads the file according to the passed parameters.
+    This utility function streams the file into a memory buffer.
+
+    Files larger than ``max_memory_size`` spill to an anonymous temporary file that is removed
+    on close, so nothing has to be cleaned up afterwards. The caller closes the buffer, e.g. by
+    using it as a context manager.
 
     :param file_obj: The telegram file object (e.g. voice, photo, etc.).
     :type file_obj: object
 
-    :param dir_path: Path to the directory where the file is to be downloaded.
-    :type dir_path: str
-
-    :param file_name: The name of the file to be downloaded.
-    :type file_name: str
-
-    :param file_type: The type of file to be downloaded.
-    :type file_type: str
+    :param max_memory_size: Number of bytes kept in memory before spilling to disk.
+    :type max_memory_size: int
 
-    :return: The full path of the downloaded file.
-    :rtype: str
+    :return: The buffer with the file content, positioned at the start.
+    :rtype: SpooledTemporaryFile
     """
+    buffer = SpooledTemporaryFile(max_size=max_memory_size)
     try:
-        os.makedirs(dir_path, exist_ok=True)
-        path = f"{dir_path}/{file_name}.{file_type}"
-        await bot.download(file_obj, destination=path)
-        return path
-    except FileExistsError:
-        raise FileExistsError("File already exists")
-    except Exception as e:
-        raise e
\ No newline at end of file
+        await bot.download(file_obj, destination=buffer)
+    except Exception:
+        buffer.close()
+        raise
+    return buffer
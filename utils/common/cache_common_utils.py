@@ -0,0 +1,194 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries also expire ``ttl`` seconds after they were stored.
+
+    The least recently used entry is evicted once ``max_size`` is reached, so memory
+    stays bounded no matter how many distinct keys are seen.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        :param max_size: Maximum number of entries kept in memory.
+        :type max_size: int
+        :param ttl: Seconds an entry stays valid after it was stored.
+        :type ttl: float
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for ``key`` or ``default`` when it is missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value without touching the LRU order or the hit/miss counters.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return default
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store ``value`` under ``key``, evicting the least recently used entry if needed.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Drop ``key`` from the cache if it is present.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the counters.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Return hit/miss counters together with the current size and hit rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TieredCache:
+    """
+    String cache with a bounded in-memory ``TTLCache`` in front of an optional Redis tier.
+
+    Redis hits are copied into memory. Redis failures are counted and treated as misses,
+    so an unavailable Redis only costs the second tier, never the request.
+    """
+
+    def __init__(self,
+                 memory_cache: TTLCache,
+                 redis_client: Any = None,
+                 redis_ttl: int | None = None,
+                 key_prefix: str = "",
+                 max_memory_item_size: int | None = None):
+        """
+        :param memory_cache: First tier, shared by every lookup of the process.
+        :type memory_cache: TTLCache
+        :param redis_client: Optional ``redis.asyncio`` client used as the second tier.
+        :param redis_ttl: Seconds an entry stays in Redis, forever when None.
+        :type redis_ttl: int | None
+        :param key_prefix: Prefix of every Redis key, to share a database with other users.
+        :type key_prefix: str
+        :param max_memory_item_size: Values longer than this are only stored in Redis.
+        :type max_memory_item_size: int | None
+        """
+        self.memory_cache: TTLCache = memory_cache
+        self.redis_client: Any = redis_client
+        self.redis_ttl: int | None = redis_ttl
+        self.key_prefix: str = key_prefix
+        self.max_memory_item_size: int | None = max_memory_item_size
+        self.redis_hits: int = 0
+        self.redis_misses: int = 0
+        self.redis_errors: int = 0
+
+    def _set_memory(self, key: str, value: str) -> None:
+        if self.max_memory_item_size is None or len(value) <= self.max_memory_item_size:
+            self.memory_cache.set(key, value)
+
+    async def get(self, key: str) -> str | None:
+        """
+        Return the cached value from memory, then from Redis, or None.
+        """
+        value = self.memory_cache.get(key)
+        if value is not None or self.redis_client is None:
+            return value
+
+        try:
+            value = await self.redis_client.get(self.key_prefix + key)
+        except Exception:
+            self.redis_errors += 1
+            return None
+        if value is None:
+            self.redis_misses += 1
+            return None
+
+        self.redis_hits += 1
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        self._set_memory(key, value)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """
+        Store ``value`` in both tiers.
+        """
+        self._set_memory(key, value)
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.set(self.key_prefix + key, value, ex=self.redis_ttl)
+        except Exception:
+            self.redis_errors += 1
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Return the memory tier stats together with Redis counters and the combined hit rate.
+        """
+        stats = self.memory_cache.stats()
+        lookups = stats["hits"] + stats["misses"]
+        hits = stats["hits"] + self.redis_hits
+        stats.update({
+            "redis_hits": self.redis_hits,
+            "redis_misses": self.redis_misses,
+            "redis_errors": self.redis_errors,
+            "total_hit_rate": hits / lookups if lookups else 0.0,
+        })
+        return stats
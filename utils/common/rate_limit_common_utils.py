@@ -0,0 +1,122 @@
+import time
+from collections import OrderedDict
+
+
+class TokenBucket:
+    """
+    Token bucket: ``rate`` tokens per second, at most ``capacity`` stored.
+
+    ``try_acquire`` takes a token without waiting; ``delay`` tells when the next one is due,
+    so the caller schedules its own retry. ``block_for`` empties the bucket and
+    refuses tokens for a while, which is how a ``RetryAfter`` from Telegram is honoured.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._tokens: float = capacity
+        self._updated_at: float = time.monotonic()
+        self._blocked_until: float = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def delay(self) -> float:
+        """
+        Return how many seconds until ``try_acquire`` succeeds.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        wait = max(self._blocked_until - now, 0.0)
+        if self._tokens < 1:
+            wait = max(wait, (1 - self._tokens) / self.rate)
+        return wait
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token if one is available without waiting.
+        """
+        if self.delay() > 0:
+            return False
+        self._tokens -= 1
+        return True
+
+    def block_for(self, seconds: float) -> None:
+        """
+        Refuse tokens for ``seconds`` and start refilling from empty afterwards.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = 0
+        self._blocked_until = max(self._blocked_until, now + seconds)
+
+    @property
+    def idle(self) -> bool:
+        """
+        Whether the bucket is full again, i.e. nobody used it recently.
+        """
+        return self.delay() == 0 and self._tokens >= self.capacity
+
+
+class ChatRateLimiter:
+    """
+    Rate limiter for Telegram calls that combines a global bucket with one bucket per chat.
+
+    Group chats (negative ids) get their own, slower rate. After a ``RetryAfter`` the chat is
+    paused for the requested time and its rate is halved; every successful call then restores
+    a tenth of the base rate, so the limiter settles just below what Telegram tolerates.
+    """
+
+    # Buckets kept in memory; beyond this the least recently used idle ones are evicted.
+    MAX_CHAT_BUCKETS: int = 1000
+
+    def __init__(self, global_rate: float, chat_interval: float, group_chat_interval: float,
+                 max_chat_interval: float, chat_burst: int = 1):
+        self.global_bucket: TokenBucket = TokenBucket(global_rate, capacity=global_rate)
+        self.chat_interval: float = chat_interval
+        self.chat_burst: int = chat_burst
+        self.group_chat_interval: float = group_chat_interval
+        self.max_chat_interval: float = max_chat_interval
+        self._chat_buckets: OrderedDict[int, TokenBucket] = OrderedDict()
+
+    def _base_rate(self, chat_id: int) -> float:
+        return 1 / (self.group_chat_interval if chat_id < 0 else self.chat_interval)
+
+    def get_chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is not None:
+            self._chat_buckets.move_to_end(chat_id)
+            return bucket
+
+        # Group chats get no burst: their limit is per minute and much stricter.
+        capacity = 1 if chat_id < 0 else self.chat_burst
+        bucket = self._chat_buckets[chat_id] = TokenBucket(self._base_rate(chat_id), capacity)
+        self._evict_idle_buckets()
+        return bucket
+
+    def _evict_idle_buckets(self) -> None:
+        """
+        Drop least recently used buckets beyond ``MAX_CHAT_BUCKETS`` as long as they are idle.
+
+        A bucket that is still limiting its chat (e.g. after a ``RetryAfter``) stops the eviction
+        until it is idle, so no chat gets a fresh bucket and sends too early.
+        """
+        while len(self._chat_buckets) > self.MAX_CHAT_BUCKETS:
+            oldest_chat_id, oldest_bucket = next(iter(self._chat_buckets.items()))
+            if not oldest_bucket.idle:
+                return
+            del self._chat_buckets[oldest_chat_id]
+
+    def record_success(self, chat_id: int) -> None:
+        bucket = self.get_chat_bucket(chat_id)
+        base_rate = self._base_rate(chat_id)
+        bucket.rate = min(base_rate, bucket.rate + base_rate / 10)
+
+    def backoff(self, chat_id: int, retry_after: float) -> None:
+        """
+        Pause the chat for ``retry_after`` seconds and halve its rate.
+        """
+        bucket = self.get_chat_bucket(chat_id)
+        bucket.rate = max(1 / self.max_chat_interval, bucket.rate / 2)
+        bucket.block_for(retry_after)
@@ -0,0 +1,102 @@
+import math
+import re
+from collections import Counter
+
+# Words of any script; single characters carry too little meaning to be searched for.
+_WORD_PATTERN = re.compile(r'\w{2,}')
+
+# Function words of the bot's languages (English, Russian, Uzbek). They occur in almost every text,
+# so matching them says nothing about relevance.
+STOPWORDS: frozenset[str] = frozenset("""
+    about after all also am an and any are as at be been before but by can could did do does for from
+    had has have he her here him his how if in into is it its me more my no not of on or our out she so
+    some than that the their them then there these they this those to too up us was we were what when
+    where which who whom why will with would you your please tell know give show
+    без более бы был была были было быть в вам вас весь во вот все всех вы где да для до его ее если есть
+    еще же за здесь и из или им их к как какой когда кто ли либо мне может мы на над нам нас не него нет
+    ни но ну о об он она они оно от по под при про с со так также там те тем то того тоже только том ты у
+    уже хотя чем что чтобы эта эти это я
+    ham va bilan uchun bu shu u ular men sen biz siz edi emas bor yoq lekin yoki qanday qachon nima kim
+    qaysi qayerda nega mi esa da dan ga ni ning haqida
+""".split())
+
+
+def tokenize_for_search(text: str) -> list[str]:
+    """
+    Split text into lowercase words for lexical search, leaving out stopwords.
+
+    :param text: Text of a document chunk or a question.
+    :type text: str
+    :return: Words in their order of appearance.
+    :rtype: list[str]
+    """
+    return [word for word in _WORD_PATTERN.findall(text.lower()) if word not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    In-memory Okapi BM25 index over a fixed list of texts.
+
+    Term frequencies are computed once when the index is built, so a search only touches the
+    postings of the words in the query.
+    """
+
+    def __init__(self, texts: list[str], k1: float = 1.5, b: float = 0.75):
+        """
+        :param texts: Texts to index; search results refer to their positions.
+        :type texts: list[str]
+        :param k1: Term frequency saturation.
+        :type k1: float
+        :param b: Strength of the document length normalization.
+        :type b: float
+        """
+        self.k1: float = k1
+        self.b: float = b
+        self.size: int = len(texts)
+        self._lengths: list[int] = []
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        for position, text in enumerate(texts):
+            words = tokenize_for_search(text)
+            self._lengths.append(len(words))
+            for word, frequency in Counter(words).items():
+                self._postings.setdefault(word, []).append((position, frequency))
+        self._average_length: float = sum(self._lengths) / self.size if self.size else 0.0
+
+    def _idf(self, word: str) -> float:
+        document_frequency = len(self._postings.get(word, ()))
+        return math.log(1 + (self.size - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def search(self, query: str, k: int, min_coverage: float = 0.0) -> list[tuple[int, float]]:
+        """
+        Return the positions and scores of the ``k`` texts that match ``query`` best.
+
+        :param query: Question or keywords.
+        :type query: str
+        :param k: Maximum number of results.
+        :type k: int
+        :param min_coverage: Share of the query that a text has to match, weighted by the idf of the
+            query words found in the index, so a text matching only the query's common words is left out.
+        :type min_coverage: float
+        :return: ``(position, score)`` pairs, best first; texts sharing no word with the query are left out.
+        :rtype: list[tuple[int, float]]
+        """
+        scores: dict[int, float] = {}
+        matched_idf: dict[int, float] = {}
+        query_idf = 0.0
+        for word in set(tokenize_for_search(query)):
+            postings = self._postings.get(word)
+            if not postings:
+                continue
+            idf = self._idf(word)
+            query_idf += idf
+            for position, frequency in postings:
+                length_norm = 1 - self.b + self.b * self._lengths[position] / (self._average_length or 1)
+                scores[position] = scores.get(position, 0.0) + idf * frequency * (self.k1 + 1) / (
+                    frequency + self.k1 * length_norm
+                )
+                matched_idf[position] = matched_idf.get(position, 0.0) + idf
+        results = [
+            (position, score) for position, score in scores.items()
+            if matched_idf[position] >= min_coverage * query_idf
+        ]
+        return sorted(results, key=lambda item: item[1], reverse=True)[:k]
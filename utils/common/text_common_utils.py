@@ -0,0 +1,86 @@
+import re
+
+# Space after a period between two word characters, and after a comma, colon or semicolon followed
+# by one. Periods consume the following character, so "a.b.c" becomes "a. b.c" as it always did.
+_PUNCTUATION_SPACING_PATTERN = re.compile(r'(\w)\.(\w)|([,:;])(?=\w)')
+
+
+def _space_punctuation(match: re.Match) -> str:
+    if match.group(3):
+        return match.group(3) + ' '
+    return f'{match.group(1)}. {match.group(2)}'
+
+
+def _remove_non_printable(text: str) -> str:
+    # Fast path: most text has nothing to remove and is checked in C.
+    if text.isprintable():
+        return text
+    return ''.join(char for char in text if char.isprintable())
+
+
+class TextNormalizer:
+    """
+    Cleans extracted text with precompiled patterns in as few passes over the text as possible.
+
+    ``OCR_TEXT_NORMALIZER`` reproduces the original ``postprocess_text`` output: all whitespace
+    collapses into single spaces and common OCR mistakes are fixed. ``DOCUMENT_TEXT_NORMALIZER``
+    keeps line breaks and only tidies whitespace, since parsed documents have no OCR mistakes
+    and their characters (e.g. ``|`` in tables) are meant literally.
+    """
+
+    def __init__(self, keep_line_breaks: bool = False, fix_ocr_errors: bool = False):
+        """
+        :param keep_line_breaks: Keep lines and single blank lines between paragraphs instead of
+            joining everything into one line.
+        :type keep_line_breaks: bool
+        :param fix_ocr_errors: Fix characters Tesseract commonly confuses and missing spaces
+            after punctuation.
+        :type fix_ocr_errors: bool
+        """
+        self.keep_line_breaks: bool = keep_line_breaks
+        self.fix_ocr_errors: bool = fix_ocr_errors
+
+    def normalize(self, text: str) -> str:
+        """
+        Return the normalized text.
+
+        :param text: Text as extracted from an image or a document.
+        :type text: str
+        :return: Normalized text, empty if it contained only whitespace.
+        :rtype: str
+        """
+        if self.keep_line_breaks:
+            return self._normalize_lines(text)
+
+        # Same as collapsing \s+ into one space and stripping, without the regex engine
+        return self._clean_line(' '.join(text.split()))
+
+    def _normalize_lines(self, text: str) -> str:
+        lines = []
+        blank_line = False
+        for line in text.splitlines():
+            line = ' '.join(line.split())
+            if not line:
+                blank_line = bool(lines)
+                continue
+            if blank_line:
+                lines.append('')
+                blank_line = False
+            lines.append(self._clean_line(line))
+        return '\n'.join(lines)
+
+    def _clean_line(self, text: str) -> str:
+        # The steps run in the order of the original postprocess_text, which matters around
+        # characters that are removed as non-printable.
+        if not self.fix_ocr_errors:
+            return _remove_non_printable(text)
+
+        text = text.replace('|', 'I')  # Common OCR mistake
+        if text.startswith('0'):
+            text = 'O' + text[1:]  # Fix starting with zero instead of O
+        text = _PUNCTUATION_SPACING_PATTERN.sub(_space_punctuation, text)
+        return _remove_non_printable(text).replace('wwwv.', 'www.')  # Fix common URL typo
+
+
+OCR_TEXT_NORMALIZER = TextNormalizer(fix_ocr_errors=True)
+DOCUMENT_TEXT_NORMALIZER = TextNormalizer(keep_line_breaks=True)
@@ -0,0 +1,34 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class StageTimer:
+    """
+    Collects wall-clock durations of the named stages of a pipeline.
+    """
+
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Measure the block and add its duration to ``name``, also when it raises.
+
+        :param name: Stage name used in the report.
+        :type name: str
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - started_at
+
+    @property
+    def total(self) -> float:
+        return sum(self.timings.values())
+
+    def __str__(self) -> str:
+        stages = " ".join(f"{name}={duration * 1000:.1f}ms" for name, duration in self.timings.items())
+        return f"{stages} total={self.total * 1000:.1f}ms"
@@ -0,0 +1,161 @@
+import codecs
+import functools
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+# Tokens every chat message costs on top of its content (role, separators).
+MESSAGE_TOKEN_OVERHEAD: int = 4
+# Tokens the API adds to prime the assistant reply.
+REPLY_PRIMING_TOKENS: int = 3
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """
+    Return the tiktoken encoding of ``model`` or None when tiktoken or its data is unavailable.
+    """
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"Falling back to estimated token counts for {model}: {str(e)}")
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """
+    Count the tokens of ``text`` for ``model``.
+
+    Uses tiktoken when available, otherwise a conservative estimate of one token per
+    four UTF-8 bytes (which over-counts Cyrillic rather than under-counts it).
+
+    :param text: Text to measure.
+    :type text: str
+    :param model: Name of the OpenAI model.
+    :type model: str
+    :return: Number of tokens.
+    :rtype: int
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return math.ceil(len(text.encode("utf-8")) / 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str) -> str:
+    """
+    Keep the beginning of ``text`` so that it fits into ``max_tokens``.
+
+    :param text: Text to shorten.
+    :type text: str
+    :param max_tokens: Token limit of the result.
+    :type max_tokens: int
+    :param model: Name of the OpenAI model.
+    :type model: str
+    :return: The original text or its longest prefix that fits.
+    :rtype: str
+    """
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        encoded = text.encode("utf-8")
+        if len(encoded) <= max_tokens * 4:
+            return text
+        return encoded[:max_tokens * 4].decode("utf-8", errors="ignore")
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def _split_long_word(word: str, max_tokens: int, model: str) -> list[str]:
+    """
+    Split a word without spaces into consecutive slices of about ``max_tokens`` tokens, losing nothing.
+    """
+    max_tokens = max(max_tokens, 1)
+    encoding = _get_encoding(model)
+    if encoding is None:
+        data = word.encode("utf-8")
+        step = max_tokens * 4
+        windows = (data[index:index + step] for index in range(0, len(data), step))
+    else:
+        tokens = encoding.encode(word, disallowed_special=())
+        windows = (encoding.decode_bytes(tokens[index:index + max_tokens])
+                   for index in range(0, len(tokens), max_tokens))
+    # A window may end inside a multibyte character; its bytes are carried over to the next slice
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    slices = [decoder.decode(window) for window in windows]
+    slices[-1] += decoder.decode(b"", final=True)
+    return [piece for piece in slices if piece]
+
+
+def _split_long_line(line: str, max_tokens: int, model: str) -> list[tuple[str, int]]:
+    """
+    Split a line into pieces of at most ``max_tokens`` tokens between words, with their token counts.
+
+    Words longer than a piece are split into slices themselves.
+    """
+    pieces: list[tuple[str, int]] = []
+    words: list[str] = []
+    tokens = 0
+    for word in line.split():
+        # Every word costs one more token for the space that joins it to the piece
+        word_tokens = count_tokens(word, model) + 1
+        if word_tokens <= max_tokens:
+            slices = [(word, word_tokens)]
+        else:
+            # Two tokens of margin: one for the space, one for a character carried over between slices
+            slices = [(piece, count_tokens(piece, model) + 1)
+                      for piece in _split_long_word(word, max_tokens - 2, model)]
+        for piece, piece_tokens in slices:
+            if words and tokens + piece_tokens > max_tokens:
+                pieces.append((" ".join(words), tokens))
+                words, tokens = [], 0
+            words.append(piece)
+            tokens += piece_tokens
+    if words:
+        pieces.append((" ".join(words), tokens))
+    return pieces
+
+
+def split_text_into_chunks(text: str, max_tokens: int, model: str) -> list[str]:
+    """
+    Split ``text`` into consecutive chunks of at most ``max_tokens`` tokens.
+
+    Chunks end at line breaks where possible; a line longer than a chunk is split between words.
+
+    :param text: Text to split.
+    :type text: str
+    :param max_tokens: Token limit of every chunk.
+    :type max_tokens: int
+    :param model: Name of the OpenAI model.
+    :type model: str
+    :return: Non-empty chunks in text order.
+    :rtype: list[str]
+    """
+    chunks: list[str] = []
+    lines: list[str] = []
+    tokens = 0
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        # Every line costs one more token for the line break that joins it to the chunk
+        line_tokens = count_tokens(line, model) + 1
+        pieces = [(line, line_tokens)] if line_tokens <= max_tokens else _split_long_line(line, max_tokens, model)
+        for piece, piece_tokens in pieces:
+            if lines and tokens + piece_tokens > max_tokens:
+                chunks.append("\n".join(lines))
+                lines, tokens = [], 0
+            lines.append(piece)
+            tokens += piece_tokens
+    if lines:
+        chunks.append("\n".join(lines))
+    return chunks
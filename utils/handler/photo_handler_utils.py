@@ -1,39 +1,415 @@
 import cv2
+import functools
+import io
 import numpy as np
-import re
 import os
 import platform
 import logging
 import pytesseract
-from PIL import Image, ImageEnhance, ImageFilter
-from typing import List, Optional
+from PIL import Image, ImageFilter
+from typing import List, Optional, Tuple
+
+from config.constants import OCR_TARGET_TEXT_HEIGHT, OCR_MAX_IMAGE_SIDE, OCR_MAX_TEXT_REGIONS, OCR_MAX_LOADED_MODELS
+from utils.common.text_common_utils import OCR_TEXT_NORMALIZER
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Map user language to Tesseract language codes
+TESSERACT_LANGUAGES = {
+    'en': 'eng',
+    'ru': 'rus',
+    'uz': 'uzb',
+}
+
+# Tesseract languages written in each script reported by orientation and script detection;
+# the first one is used when the user's language is written in another script.
+SCRIPT_LANGUAGES = {
+    'Latin': ('eng', 'uzb'),
+    'Cyrillic': ('rus',),
+}
+
+# Script detection below this confidence is ignored and every language is tried
+MIN_SCRIPT_CONFIDENCE = 1.0
+
+
+def _otsu_binarize(gray: np.ndarray) -> np.ndarray:
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
 
+def _sharpen(gray: np.ndarray) -> np.ndarray:
+    return np.asarray(Image.fromarray(gray).filter(ImageFilter.SHARPEN))
 
-def safe_preprocess_image(image_path: str) -> Optional[np.ndarray]:
+
+# OCR strategies by name: how the grayscale image is transformed and which page segmentation mode reads it
+OCR_STRATEGIES = {
+    'grayscale': (lambda gray: gray, 3),
+    'inverted': (cv2.bitwise_not, 3),
+    'otsu': (_otsu_binarize, 3),
+    'sharpened': (_sharpen, 3),
+    'psm6': (lambda gray: gray, 6),  # Assume single uniform block of text
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tesserocr():
     """
-    A safer version of preprocess_image that handles errors better.
+    Return the tesserocr module, or None when it is not installed and pytesseract is used instead.
+    """
+    try:
+        import tesserocr
+        return tesserocr
+    except ImportError:
+        logger.info("tesserocr is not installed, every OCR call starts a tesseract process")
+        return None
+
+
+@functools.lru_cache(maxsize=OCR_MAX_LOADED_MODELS)
+def _get_tesseract_api(langs: str, psm: int):
+    """
+    Return a tesserocr API with ``langs`` loaded, kept for the lifetime of the worker process.
+
+    Loading the traineddata is the expensive part of a call, so APIs are reused per language
+    list and page segmentation mode; the least recently used one is released beyond
+    ``OCR_MAX_LOADED_MODELS``.
+    """
+    tesserocr = _get_tesserocr()
+    oem = tesserocr.OEM.DEFAULT if psm == tesserocr.PSM.OSD_ONLY else tesserocr.OEM.LSTM_ONLY
+    return tesserocr.PyTessBaseAPI(lang=langs, psm=psm, oem=oem)
+
+
+def _to_pil_image(image) -> Image.Image:
+    return image if isinstance(image, Image.Image) else Image.fromarray(image)
+
+
+def _tesseract_config(psm: int, preserve_interword_spaces: bool) -> str:
+    config = f'--oem 1 --psm {psm}'
+    if preserve_interword_spaces:
+        config += ' -c preserve_interword_spaces=1'
+    return config
+
+
+def recognize_text(image, langs: str = 'eng', psm: int = 3, preserve_interword_spaces: bool = False) -> str:
+    """
+    Run Tesseract on an image, in this process when tesserocr is installed.
+
+    Args:
+        image: Image as numpy array or PIL image
+        langs: Tesseract languages joined with ``+``
+        psm: Page segmentation mode
+        preserve_interword_spaces: Keep runs of spaces between words
 
     Returns:
-        A preprocessed image as numpy array or None if processing fails
+        Recognized text, as ``pytesseract.image_to_string`` returns it
+    """
+    if _get_tesserocr() is not None:
+        return recognize_text_with_confidence(image, langs, psm, preserve_interword_spaces)[0]
+
+    set_tesseract_cmd()
+    return pytesseract.image_to_string(image, lang=langs, config=_tesseract_config(psm, preserve_interword_spaces))
+
+
+def recognize_text_with_confidence(image, langs: str = 'eng', psm: int = 3,
+                                   preserve_interword_spaces: bool = False) -> Tuple[str, float]:
+    """
+    Run Tesseract on an image and also return the mean confidence (0-100) of the recognized words.
+
+    With tesserocr the models stay loaded in the worker between calls; without it a single
+    ``tesseract`` process writes both the plain text (the same as ``image_to_string``) and the
+    TSV the confidence is read from.
+    """
+    if _get_tesserocr() is not None:
+        api = _get_tesseract_api(langs, psm)
+        api.SetVariable("preserve_interword_spaces", "1" if preserve_interword_spaces else "0")
+        api.SetImage(_to_pil_image(image))
+        try:
+            return api.GetUTF8Text(), float(api.MeanTextConf())
+        finally:
+            api.Clear()
+
+    set_tesseract_cmd()
+    config = f'{_tesseract_config(psm, preserve_interword_spaces)} -c tessedit_create_tsv=1'
+    with pytesseract.pytesseract.save(image) as (output_base, input_filename):
+        pytesseract.pytesseract.run_tesseract(input_filename, output_base, 'txt', langs, config)
+        with open(f'{output_base}.txt', encoding='utf-8') as text_file:
+            text = text_file.read()
+        with open(f'{output_base}.tsv', encoding='utf-8') as tsv_file:
+            data = pytesseract.pytesseract.file_to_dict(tsv_file.read(), '\t', -1)
+    return text, ocr_data_confidence(data)
+
+
+def detect_orientation_and_script(image) -> dict:
+    """
+    Run Tesseract's orientation and script detection.
+
+    Returns:
+        Dictionary with at least ``script`` and ``script_conf``
+    """
+    tesserocr = _get_tesserocr()
+    if tesserocr is not None:
+        api = _get_tesseract_api('osd', tesserocr.PSM.OSD_ONLY)
+        api.SetImage(_to_pil_image(image))
+        try:
+            osd = api.DetectOrientationScript()
+        finally:
+            api.Clear()
+        if not osd:
+            raise RuntimeError("Orientation and script detection found too few characters")
+        return {"script": osd["script_name"], "script_conf": osd["script_conf"]}
+
+    set_tesseract_cmd()
+    return pytesseract.image_to_osd(image, output_type=pytesseract.Output.DICT)
+
+
+def init_ocr_worker() -> None:
+    """
+    Prepare an OCR worker process once, before its first job.
+
+    Resolves the tesseract binary and, with tesserocr, loads the script detection and English
+    models so that the first photo does not pay for it. Other language lists load on first use.
+    """
+    set_tesseract_cmd()
+    tesserocr = _get_tesserocr()
+    if tesserocr is None:
+        return
+    try:
+        _get_tesseract_api('osd', tesserocr.PSM.OSD_ONLY)
+        _get_tesseract_api('eng', tesserocr.PSM.AUTO)
+    except Exception as e:
+        logger.warning(f"Preloading Tesseract models failed: {str(e)}")
+
+
+
+def decode_image(source: str | bytes) -> Optional[np.ndarray]:
+    """
+    Decode an image exactly once into a BGR numpy array.
+
+    A file is read into memory a single time and downloaded bytes are used as they are;
+    OpenCV decodes them and Pillow is only asked for formats OpenCV does not support,
+    using the same in-memory bytes. A successful decode doubles as verification that
+    the data is a valid image.
+
+    Args:
+        source: Path to the image file or its encoded content
+
+    Returns:
+        The decoded image or None if the data is not a readable image
     """
     try:
-        # Try to read with OpenCV
-        img = cv2.imread(image_path)
+        if isinstance(source, str):
+            data = np.fromfile(source, dtype=np.uint8)
+        else:
+            data = np.frombuffer(source, dtype=np.uint8)
+        if data.size == 0:
+            logger.warning("Image data is empty")
+            return None
+
+        img = cv2.imdecode(data, cv2.IMREAD_COLOR)
+        if img is None:
+            with Image.open(io.BytesIO(data)) as pil_image:
+                img = cv2.cvtColor(np.asarray(pil_image.convert('RGB')), cv2.COLOR_RGB2BGR)
 
-        # Check if image was loaded correctly
-        if img is None or img.size == 0:
-            logger.warning(f"OpenCV couldn't load image at {image_path}")
+        if img.size == 0:
+            logger.warning("Decoded image is empty")
             return None
+        return img
+    except Exception as e:
+        logger.error(f"Error in decode_image: {str(e)}", exc_info=True)
+        return None
+
+
+def to_grayscale(image: np.ndarray) -> np.ndarray:
+    """Return a single-channel view of the image, converting only if it has color channels."""
+    if image.ndim == 2:
+        return image
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+def estimate_text_height(gray: np.ndarray) -> Optional[float]:
+    """
+    Estimate the median glyph height of a grayscale image from its connected components.
+
+    Args:
+        gray: Grayscale image as numpy array
+
+    Returns:
+        Median height in pixels or None if too few glyph-like components were found
+    """
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    # Text is the minority of pixels; flip the polarity for light text on a dark background
+    if cv2.countNonZero(binary) > binary.size / 2:
+        binary = cv2.bitwise_not(binary)
+
+    _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    height, width = gray.shape[:2]
+    heights = [
+        h for _, _, w, h, area in stats[1:]
+        if 4 <= h <= height / 4 and w <= width / 2 and area >= 8
+    ]
+    if len(heights) < 5:
+        return None
+    return float(np.median(heights))
+
+
+def normalize_text_scale(gray: np.ndarray,
+                         target_text_height: int = OCR_TARGET_TEXT_HEIGHT,
+                         max_side: int = OCR_MAX_IMAGE_SIDE) -> np.ndarray:
+    """
+    Rescale the image so that its text is about ``target_text_height`` pixels high.
+
+    Tesseract time grows with the pixel count, and phone photos usually have far more pixels
+    than the text needs. Images whose text height cannot be estimated are only capped to
+    ``max_side``.
+
+    Args:
+        gray: Grayscale image as numpy array
+        target_text_height: Desired median glyph height in pixels
+        max_side: Maximum length of the longest side after rescaling
+
+    Returns:
+        The rescaled image, or the same array if it is already close to the target
+    """
+    height, width = gray.shape[:2]
+    text_height = estimate_text_height(gray)
+    scale = min(max(target_text_height / text_height, 0.25), 2.0) if text_height else 1.0
+    scale = min(scale, max_side / max(height, width))
+    if abs(scale - 1.0) < 0.1:
+        return gray
+
+    interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_CUBIC
+    return cv2.resize(gray, (max(1, round(width * scale)), max(1, round(height * scale))),
+                      interpolation=interpolation)
+
+
+def detect_text_regions(gray: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    """
+    Find blocks of text with a morphological gradient, so that OCR can skip the background.
+
+    Args:
+        gray: Grayscale image as numpy array
+
+    Returns:
+        Bounding boxes ``(x, y, w, h)`` of the text blocks in reading order
+    """
+    height, width = gray.shape[:2]
+    gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)))
+    _, binary = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    # Join the characters of a line, then neighbouring lines into blocks
+    joined = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (15, 3)))
+    joined = cv2.dilate(joined, cv2.getStructuringElement(cv2.MORPH_RECT, (9, 9)))
+
+    contours, _ = cv2.findContours(joined, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    padding = 8
+    regions = []
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        if w < 12 or h < 8:
+            continue
+        x0, y0 = max(x - padding, 0), max(y - padding, 0)
+        x1, y1 = min(x + w + padding, width), min(y + h + padding, height)
+        regions.append((x0, y0, x1 - x0, y1 - y0))
+    return sorted(regions, key=lambda region: (region[1], region[0]))
+
+
+def crop_text_regions(gray: np.ndarray, max_regions: int = OCR_MAX_TEXT_REGIONS) -> List[np.ndarray]:
+    """
+    Crop the parts of the image that contain text.
+
+    A few scattered blocks are returned one by one; many blocks, or blocks covering most of
+    their bounding box, are returned as that single box. An image without detected text is
+    returned whole, so detection misses never lose text.
+
+    Args:
+        gray: Grayscale image as numpy array
+        max_regions: Maximum number of separate crops
 
-        logger.info(f"Successfully opened image with OpenCV: {image_path}")
+    Returns:
+        Views of the original array in reading order
+    """
+    regions = detect_text_regions(gray)
+    if not regions:
+        return [gray]
+
+    x0 = min(x for x, _, _, _ in regions)
+    y0 = min(y for _, y, _, _ in regions)
+    x1 = max(x + w for x, _, w, _ in regions)
+    y1 = max(y + h for _, y, _, h in regions)
+    regions_area = sum(w * h for _, _, w, h in regions)
+    if len(regions) <= max_regions and regions_area < 0.5 * (x1 - x0) * (y1 - y0):
+        return [gray[y:y + h, x:x + w] for x, y, w, h in regions]
+    return [gray[y0:y1, x0:x1]]
+
+
+def detect_script(image: np.ndarray) -> Optional[str]:
+    """
+    Detect the script of the text with Tesseract's orientation and script detection.
+
+    Args:
+        image: Grayscale image as numpy array
+
+    Returns:
+        Script name such as ``Latin`` or ``Cyrillic``, or None if detection failed or is unsure
+    """
+    try:
+        osd = detect_orientation_and_script(image)
+    except Exception as e:
+        # OSD refuses images with too few characters; all languages are tried then
+        logger.info(f"Script detection skipped: {str(e)}")
+        return None
+    if osd.get("script_conf", 0) < MIN_SCRIPT_CONFIDENCE:
+        return None
+    return osd.get("script")
+
+
+def get_tesseract_languages(lang: str, script: Optional[str] = None) -> str:
+    """
+    Build the Tesseract language list for the user language and the detected script.
+
+    Every language slows Tesseract down, so a known script limits the list to the script's
+    main language, preceded by the user's language if it is written in that script.
+
+    Args:
+        lang: User language preference
+        script: Detected script or None
+
+    Returns:
+        Languages joined with ``+``
+    """
+    user_lang = TESSERACT_LANGUAGES.get(lang)
+    script_langs = SCRIPT_LANGUAGES.get(script)
+    if script_langs:
+        langs = [user_lang] if user_lang in script_langs else []
+        if script_langs[0] not in langs:
+            langs.append(script_langs[0])
+        return "+".join(langs)
+
+    # Default to multiple languages for better detection
+    if user_lang:
+        # Put the user's language first
+        return f"{user_lang}+eng+rus+uzb"
+    return "+".join(["eng", "rus", "uzb"])
+
+
+def safe_preprocess_image(image: np.ndarray) -> Optional[np.ndarray]:
+    """
+    A safer version of preprocess_image that handles errors better.
+
+    Args:
+        image: Decoded image (BGR or grayscale) as numpy array
+
+    Returns:
+        A preprocessed image as numpy array or None if processing fails
+    """
+    try:
+        # Check if image is usable
+        if image is None or image.size == 0:
+            logger.warning("Empty image passed to safe_preprocess_image")
+            return None
 
         # Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        gray = to_grayscale(image)
 
         # Apply basic processing - aim for reliability over perfection
         # Apply simple thresholding
@@ -45,24 +421,24 @@ def safe_preprocess_image(image_path: str) -> Optional[np.ndarray]:
         return None
 
 
-def preprocess_image(image_path: str) -> Optional[np.ndarray]:
+def preprocess_image(image: np.ndarray) -> Optional[np.ndarray]:
     """
     Apply various preprocessing techniques to improve OCR accuracy.
 
+    Args:
+        image: Decoded image (BGR or grayscale) as numpy array
+
     Returns:
         A preprocessed image as numpy array or None if processing fails
     """
     try:
-        # Read the image
-        img = cv2.imread(image_path)
-
-        # Check if image was loaded correctly
-        if img is None:
-            logger.warning(f"Failed to load image at {image_path}")
+        # Check if image is usable
+        if image is None or image.size == 0:
+            logger.warning("Empty image passed to preprocess_image")
             return None
 
         # Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        gray = to_grayscale(image)
 
         # Apply adaptive thresholding
         thresh = cv2.adaptiveThreshold(
@@ -94,48 +470,24 @@ def preprocess_image(image_path: str) -> Optional[np.ndarray]:
         return None
 
 
-def extract_text_from_image(image: np.ndarray, lang: str) -> str:
+def extract_text_from_image(image: np.ndarray, lang: str, langs: Optional[str] = None) -> str:
     """
     Extract text from the preprocessed image using Tesseract with optimized settings.
 
     Args:
         image: Preprocessed image as numpy array
         lang: User language preference
+        langs: Tesseract languages to use instead of the ones derived from ``lang``
 
     Returns:
         Extracted text
     """
     try:
-        set_tesseract_cmd()
-
-        # Map user language to Tesseract language codes
-        language_map = {
-            'en': 'eng',
-            'ru': 'rus',
-            'uz': 'uzb',
-        }
-
-        # Default to multiple languages for better detection
-        langs = "+".join(["eng", "rus", "uzb"])
-
-        # If user language is known, prioritize it
-        if lang in language_map:
-            # Put the user's language first
-            user_lang = language_map[lang]
-            langs = f"{user_lang}+eng+rus+uzb"
-
-        # Convert numpy array back to PIL Image
-        pil_image = Image.fromarray(image)
-
-        # Set Tesseract configuration for better accuracy
-        config = '--oem 1 --psm 3 -c preserve_interword_spaces=1'
+        if langs is None:
+            langs = get_tesseract_languages(lang)
 
         # Extract text with optimized settings
-        extracted_text = pytesseract.image_to_string(
-            pil_image,
-            lang=langs,
-            config=config
-        )
+        extracted_text = recognize_text(image, langs, psm=3, preserve_interword_spaces=True)
 
         return extracted_text
     except Exception as e:
@@ -143,6 +495,39 @@ def extract_text_from_image(image: np.ndarray, lang: str) -> str:
         return f"Error extracting text: {str(e)}"
 
 
+def ocr_data_confidence(data: dict) -> float:
+    """
+    Return the mean word confidence of a ``pytesseract.image_to_data`` result.
+
+    Args:
+        data: ``image_to_data`` output as a dictionary of columns
+
+    Returns:
+        Mean confidence (0-100) of the recognized words, 0 without any
+    """
+    confidences = [
+        float(confidence) for word, confidence in zip(data.get('text', []), data.get('conf', []))
+        if float(confidence) >= 0 and str(word).strip()
+    ]
+    return sum(confidences) / len(confidences) if confidences else 0.0
+
+
+def run_ocr_strategy(image: np.ndarray, strategy: str, langs: str) -> Tuple[str, float]:
+    """
+    Run one of ``OCR_STRATEGIES`` on the image.
+
+    Args:
+        image: Decoded image (BGR or grayscale) as numpy array
+        strategy: Name of the strategy
+        langs: Tesseract languages joined with ``+``
+
+    Returns:
+        Extracted text and its mean word confidence
+    """
+    build_variant, psm = OCR_STRATEGIES[strategy]
+    return recognize_text_with_confidence(build_variant(to_grayscale(image)), langs, psm)
+
+
 def postprocess_text(text: str, lang: str) -> str:
     """
     Clean and improve the extracted text.
@@ -158,30 +543,8 @@ def postprocess_text(text: str, lang: str) -> str:
         if not text or text.isspace():
             return "No text detected in the image."
 
-        # Remove excessive whitespace
-        cleaned = re.sub(r'\s+', ' ', text).strip()
-
-        # Remove common OCR errors
-        cleaned = cleaned.replace('|', 'I')  # Common OCR mistake
-        cleaned = cleaned.replace('0', 'O', 1) if cleaned.startswith(
-            '0') else cleaned  # Fix starting with zero instead of O
-
-        # Fix common punctuation issues
-        cleaned = re.sub(r'(\w)\.(\w)', r'\1. \2', cleaned)  # Add space after period between words
-        cleaned = re.sub(r'([,:;])(\w)', r'\1 \2', cleaned)  # Add space after comma, colon, semicolon
-
-        # Try to detect broken paragraphs and fix them
-        cleaned = re.sub(r'(\w)-\s*\n\s*(\w)', r'\1\2', cleaned)  # Fix hyphenated words across lines
-        cleaned = re.sub(r'(?<!\n)\n(?!\n)', ' ', cleaned)  # Replace single newlines with spaces
-        cleaned = re.sub(r'\n{2,}', '\n\n', cleaned)  # Normalize multiple newlines to just two
-
-        # Remove non-printable characters
-        cleaned = ''.join(char for char in cleaned if char.isprintable() or char in ['\n', '\t'])
-
-        # Special handling for internet and code-related content
-        cleaned = re.sub(r'wwwv\.', 'www.', cleaned)  # Fix common URL typo
-        cleaned = re.sub(r'([a-zA-Z0-9_\-\.]+)@([a-zA-Z0-9_\-\.]+)\.([a-zA-Z]{2,5})', r'\1@\2.\3',
-                         cleaned)  # Fix email addresses
+        # Collapse whitespace, fix common OCR errors and drop non-printable characters
+        cleaned = OCR_TEXT_NORMALIZER.normalize(text)
 
         return cleaned
     except Exception as e:
@@ -189,8 +552,9 @@ def postprocess_text(text: str, lang: str) -> str:
         return text  # Return original text if processing fails
 
 
+@functools.lru_cache(maxsize=None)
 def set_tesseract_cmd():
-    """Set the Tesseract command path based on the platform."""
+    """Set the Tesseract command path based on the platform, probing the filesystem once per process."""
     try:
         if platform.system() == 'Windows':
             tesseract_paths = [
@@ -244,112 +608,18 @@ def set_tesseract_cmd():
         logger.error(f"Error in _set_tesseract_cmd: {str(e)}", exc_info=True)
 
 
-def perform_additional_ocr_attempts(image_path: str, lang: str) -> List[str]:
+def text_quality_score(text: str) -> float:
     """
-    Perform multiple OCR attempts with different preprocessing techniques.
-    This can be used as a fallback if the main OCR fails.
-
-    Returns:
-        List of different text extraction results
+    Score OCR output: longer text with higher ratio of alphanumeric characters is likely better.
     """
-    results = []
-
-    try:
-        # Check if the file exists
-        if not os.path.exists(image_path):
-            logger.error(f"Image file not found for additional OCR: {image_path}")
-            return ["No text detected. Image file not found."]
-
-        # Try PIL first as it's more robust
-        try:
-            pil_img = Image.open(image_path)
+    if not text:
+        return 0
+    alpha_ratio = sum(c.isalnum() or c.isspace() for c in text) / len(text)
+    return len(text) * alpha_ratio
 
-            # Attempt 1: Direct PIL processing
-            results.append(pytesseract.image_to_string(pil_img))
 
-            # Attempt 2: Grayscale PIL
-            gray_pil = pil_img.convert('L')
-            results.append(pytesseract.image_to_string(gray_pil))
-
-            # Attempt 3: Enhanced contrast
-            enhanced_pil = ImageEnhance.Contrast(gray_pil).enhance(2.0)
-            results.append(pytesseract.image_to_string(enhanced_pil))
-
-            # Attempt 4: Sharpened
-            sharpened_pil = gray_pil.filter(ImageFilter.SHARPEN)
-            results.append(pytesseract.image_to_string(sharpened_pil))
-
-            # Try different PSM modes with PIL
-            config = '--oem 1 --psm 6'  # Assume single uniform block of text
-            results.append(pytesseract.image_to_string(gray_pil, config=config))
-
-            logger.info(f"Successfully performed PIL-based OCR attempts")
-
-        except Exception as pil_error:
-            logger.warning(f"PIL fallback attempts failed: {str(pil_error)}")
-
-        # Now try OpenCV if available
-        try:
-            # Load the original image with OpenCV
-            img = cv2.imread(image_path)
-
-            if img is not None and img.size > 0:
-                # Attempt with OpenCV: grayscale
-                gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-                results.append(pytesseract.image_to_string(gray))
-
-                # Attempt with OpenCV: inverted image
-                inverted = cv2.bitwise_not(gray)
-                results.append(pytesseract.image_to_string(inverted))
-
-                # Attempt with OpenCV: thresholding
-                _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-                results.append(pytesseract.image_to_string(binary))
-
-                logger.info(f"Successfully performed OpenCV-based OCR attempts")
-            else:
-                logger.warning("OpenCV couldn't load the image for additional attempts")
-        except Exception as cv_error:
-            logger.warning(f"OpenCV fallback attempts failed: {str(cv_error)}")
-
-        return results
-    except Exception as e:
-        logger.error(f"Error in perform_additional_ocr_attempts: {str(e)}", exc_info=True)
-        return ["Error performing additional OCR attempts"]
-
-
-def choose_best_result(results: List[str]) -> str:
+def score_ocr_result(text: str, confidence: float) -> float:
     """
-    Choose the best OCR result from multiple attempts.
-    Currently, uses simple heuristics - length and character ratio.
-
-    Returns:
-        The best text result
+    Score the result of an OCR strategy by its text quality weighted with Tesseract's confidence.
     """
-    try:
-        if not results:
-            return "No text detected in the image."
-
-        # Filter out empty or very short results
-        valid_results = [text for text in results if text and len(text.strip()) > 5]
-
-        if not valid_results:
-            # If all results are too short, take the longest one
-            return max(results, key=lambda x: len(x.strip())) if results else "No meaningful text detected."
-
-        # Simple heuristic: longer text with higher ratio of alphanumeric characters is likely better
-        def quality_score(text):
-            if not text:
-                return 0
-            alpha_ratio = sum(c.isalnum() or c.isspace() for c in text) / len(text)
-            return len(text) * alpha_ratio
-
-        best_result = max(valid_results, key=quality_score)
-        return best_result
-    except Exception as e:
-        logger.error(f"Error in choose_best_result: {str(e)}", exc_info=True)
-        # Return the first non-empty result or an error message
-        for result in results:
-            if result and not result.isspace():
-                return result
-        return "Error selecting best OCR result."
+    return text_quality_score(text.strip()) * confidence / 100
@@ -1,19 +1,34 @@
+import asyncio
+import logging
+
 from aiogram.enums import ParseMode
+from aiogram.exceptions import TelegramBadRequest
+from api.telegram.outbound import INTERACTIVE_PRIORITY, STATUS_PRIORITY
 from config.constants import DIVIDE_MESSAGE_AFTER, MESSAGE_COMPLETION_CURSOR
-from config.integrations import bot
+from config.integrations import outbound_queue
 from keyboards.inline_keyboards import get_new_chat_keyboard
 
+logger = logging.getLogger(__name__)
+
 
+def _is_not_modified_error(error: TelegramBadRequest) -> bool:
+    return "message is not modified" in str(error)
 
-async def send_message_chunk(chat_id, message_id, text, reply_markup=None):
-    """Send a chunk of text as a Telegram message."""
-    await bot.edit_message_text(
-        chat_id=chat_id,
-        message_id=message_id,
-        text=text,
-        parse_mode=ParseMode.MARKDOWN,
-        reply_markup=reply_markup
-    )
+
+async def send_message_chunk(chat_id, message_id, text, reply_markup=None, parse_mode=ParseMode.MARKDOWN):
+    """Send a chunk of text as a Telegram message through the outbound queue."""
+    try:
+        await outbound_queue.edit_message_text(
+            chat_id,
+            message_id,
+            text,
+            priority=INTERACTIVE_PRIORITY,
+            parse_mode=parse_mode,
+            reply_markup=reply_markup
+        )
+    except TelegramBadRequest as e:
+        if not _is_not_modified_error(e):
+            raise
 
 
 async def send_remaining_chunks(chat_id, original_message_id, text, user_language):
@@ -30,5 +45,78 @@ async def send_remaining_chunks(chat_id, original_message_id, text, user_languag
         text = text[DIVIDE_MESSAGE_AFTER:]
 
         if text:
-            original_message = await bot.send_message(chat_id, MESSAGE_COMPLETION_CURSOR)
+            original_message = await outbound_queue.send_message(chat_id, MESSAGE_COMPLETION_CURSOR)
             original_message_id = original_message.message_id
+
+
+class StreamingMessageEditor:
+    """
+    Pushes the text of a streamed answer into one Telegram message as fast as the limits allow.
+
+    ``update`` only stores the newest text; a background task queues one status-priority edit at a
+    time and the edit reads the text when ``outbound_queue`` dispatches it, so all text produced
+    meanwhile is coalesced into a single edit. Partial Markdown that Telegram refuses to parse is
+    skipped until more text arrives; any other failed edit is logged and the next one is tried, so
+    only ``stop`` ends the background task.
+    """
+
+    def __init__(self, chat_id: int, message_id: int):
+        self.chat_id: int = chat_id
+        self.message_id: int = message_id
+        self._pending_text: str | None = None
+        self._sent_text: str | None = None
+        self._changed: asyncio.Event = asyncio.Event()
+        self._task: asyncio.Task = asyncio.create_task(self._run())
+
+    def update(self, text: str) -> None:
+        self._pending_text = text
+        self._changed.set()
+
+    async def _edit_pending_text(self) -> None:
+        text = self._pending_text
+        if text == self._sent_text:
+            return
+        await outbound_queue.bot.edit_message_text(
+            chat_id=self.chat_id,
+            message_id=self.message_id,
+            text=text,
+            parse_mode=ParseMode.MARKDOWN
+        )
+        self._sent_text = text
+
+    async def _run(self) -> None:
+        while True:
+            await self._changed.wait()
+            self._changed.clear()
+            try:
+                await outbound_queue.submit(
+                    self.chat_id,
+                    self._edit_pending_text,
+                    STATUS_PRIORITY,
+                    merge_key=("edit_message_text", self.chat_id, self.message_id)
+                )
+            except TelegramBadRequest:
+                pass
+            except Exception as e:
+                logger.warning(f"Streaming edit of message {self.message_id} in chat {self.chat_id} failed: {str(e)}")
+
+    async def stop(self) -> None:
+        """
+        Stop the background edits; the caller sends the final text itself.
+
+        Errors of the background task are not raised here, so they can neither replace the
+        exception of the caller nor lose the finished answer.
+        """
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def finish(self, text: str) -> None:
+        """
+        Stop the background edits and make sure ``text`` ends up in the message.
+        """
+        await self.stop()
+        try:
+            await send_message_chunk(self.chat_id, self.message_id, text)
+        except TelegramBadRequest:
+            # The cut may split Markdown entities; deliver the chunk as plain text instead of losing it.
+            await send_message_chunk(self.chat_id, self.message_id, text, parse_mode=None)
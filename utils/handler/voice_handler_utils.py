@@ -0,0 +1,128 @@
+import asyncio
+import re
+import shutil
+from functools import lru_cache
+
+from config.constants import FFMPEG_PATH, VOICE_SILENCE_NOISE_DB, VOICE_SILENCE_MIN_SECONDS
+
+# silencedetect reports every silence on stderr as a pair of "silence_start: 12.3" and "silence_end: 13.1 | ..."
+_SILENCE_PATTERN = re.compile(r'silence_(start|end): (-?\d+(?:\.\d+)?)')
+
+
+@lru_cache(maxsize=1)
+def is_ffmpeg_available() -> bool:
+    """
+    Whether the ffmpeg binary needed to split long voice messages is installed.
+    """
+    return shutil.which(FFMPEG_PATH) is not None
+
+
+def parse_silences(ffmpeg_output: str, duration: float) -> list[tuple[float, float]]:
+    """
+    Read the silences found by ffmpeg's ``silencedetect`` filter.
+
+    :param ffmpeg_output: What ffmpeg wrote to stderr.
+    :type ffmpeg_output: str
+    :param duration: Length of the audio; a silence running until the end has no ``silence_end``.
+    :type duration: float
+    :return: ``(start, end)`` of every silence in seconds, in order.
+    :rtype: list[tuple[float, float]]
+    """
+    silences: list[tuple[float, float]] = []
+    start: float | None = None
+    for kind, value in _SILENCE_PATTERN.findall(ffmpeg_output):
+        if kind == "start":
+            start = max(float(value), 0.0)
+        elif start is not None:
+            silences.append((start, float(value)))
+            start = None
+    if start is not None:
+        silences.append((start, duration))
+    return silences
+
+
+def choose_split_points(silences: list[tuple[float, float]], duration: float,
+                        target_seconds: float, max_seconds: float) -> list[float]:
+    """
+    Choose where to cut audio into segments of about ``target_seconds``, never longer than ``max_seconds``.
+
+    Every cut is placed in the middle of the silence closest to the target length of its segment,
+    so no word is cut in half. Without a silence in reach the segment is cut at ``max_seconds``.
+
+    :param silences: ``(start, end)`` of the silences in seconds, in order.
+    :type silences: list[tuple[float, float]]
+    :param duration: Length of the audio in seconds.
+    :type duration: float
+    :param target_seconds: Preferred segment length.
+    :type target_seconds: float
+    :param max_seconds: Longest allowed segment.
+    :type max_seconds: float
+    :return: Cut positions in seconds, in order; empty if the audio fits into one segment.
+    :rtype: list[float]
+    """
+    points: list[float] = []
+    segment_start = 0.0
+    # Silences this close to the start of a segment would only produce a tiny segment
+    min_seconds = target_seconds / 2
+    while duration - segment_start > max_seconds:
+        candidates = [
+            (start + end) / 2 for start, end in silences
+            if segment_start + min_seconds <= (start + end) / 2 <= segment_start + max_seconds
+        ]
+        target = segment_start + target_seconds
+        point = min(candidates, key=lambda candidate: abs(candidate - target), default=segment_start + max_seconds)
+        points.append(point)
+        segment_start = point
+    return points
+
+
+async def _run_ffmpeg(args: list[str], data: bytes) -> tuple[bytes, bytes]:
+    process = await asyncio.create_subprocess_exec(
+        FFMPEG_PATH, "-hide_banner", "-nostats", *args,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate(data)
+    if process.returncode != 0:
+        raise RuntimeError(f"ffmpeg exited with code {process.returncode}: {stderr.decode(errors='ignore')[-500:]}")
+    return stdout, stderr
+
+
+async def detect_silences(data: bytes, duration: float) -> list[tuple[float, float]]:
+    """
+    Find the silences of an audio file with ffmpeg, without blocking the event loop.
+
+    :param data: Content of the audio file.
+    :type data: bytes
+    :param duration: Length of the audio in seconds.
+    :type duration: float
+    :return: ``(start, end)`` of every silence in seconds, in order.
+    :rtype: list[tuple[float, float]]
+    """
+    _, stderr = await _run_ffmpeg(
+        ["-i", "pipe:0", "-af", f"silencedetect=noise={VOICE_SILENCE_NOISE_DB}dB:d={VOICE_SILENCE_MIN_SECONDS}",
+         "-f", "null", "-"],
+        data
+    )
+    return parse_silences(stderr.decode(errors="ignore"), duration)
+
+
+async def cut_audio_segment(data: bytes, start: float, end: float | None) -> bytes:
+    """
+    Copy a part of an OGG/Opus file into a new OGG file without re-encoding it.
+
+    :param data: Content of the audio file.
+    :type data: bytes
+    :param start: Start of the segment in seconds.
+    :type start: float
+    :param end: End of the segment in seconds, the end of the audio if None.
+    :type end: float | None
+    :return: Content of the segment file.
+    :rtype: bytes
+    """
+    args = ["-i", "pipe:0", "-ss", f"{start:.3f}"]
+    if end is not None:
+        args += ["-to", f"{end:.3f}"]
+    stdout, _ = await _run_ffmpeg(args + ["-map", "0:a", "-c", "copy", "-f", "ogg", "pipe:1"], data)
+    return stdout
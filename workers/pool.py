@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from exceptions.worker import WorkerError, WorkerTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+def limit_worker_memory(max_bytes: int | None) -> None:
+    """
+    Worker initializer that caps the address space of the process, so that a job allocating more
+    fails with ``MemoryError`` instead of exhausting the host. Only supported on Unix.
+
+    :param max_bytes: Address space limit in bytes, no limit when None.
+    :type max_bytes: int | None
+    """
+    if not max_bytes:
+        return
+    try:
+        import resource
+        resource.setrlimit(resource.RLIMIT_AS, (max_bytes, max_bytes))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"Worker memory limit not applied: {str(e)}")
+
+
+class ProcessPoolEngine:
+    """
+    Runs CPU-bound jobs in a bounded pool of worker processes and awaits their results.
+
+    At most ``max_workers`` jobs run at the same time and at most ``max_pending`` more wait in
+    the submission queue; further callers wait for a free slot before their job is submitted,
+    so a burst of uploads cannot pile up unbounded work. The pool is created on first use.
+    """
+
+    def __init__(self, max_workers: int | None = None, max_pending: int = 0, timeout: float | None = None,
+                 initializer: Callable[..., None] | None = None, initargs: tuple = (),
+                 max_tasks_per_child: int | None = None, kill_on_timeout: bool = False):
+        """
+        Initialize the engine.
+
+        :param max_workers: Number of worker processes, the number of CPU cores by default.
+        :type max_workers: int | None
+        :param max_pending: Jobs allowed to wait for a free worker once all of them are busy.
+        :type max_pending: int
+        :param timeout: Default seconds a job may take, including the time waiting in the queue.
+        :type timeout: float | None
+        :param initializer: Picklable function run once in every new worker process, e.g. to load models.
+        :param initargs: Arguments for ``initializer``.
+        :param max_tasks_per_child: Jobs after which a worker is replaced by a fresh one, to bound its memory.
+        :type max_tasks_per_child: int | None
+        :param kill_on_timeout: Kill the worker processes when a running job times out or is cancelled.
+            A process pool cannot interrupt a job, so this is the only way to free a hung worker; other
+            jobs running at that moment fail with ``WorkerError``.
+        :type kill_on_timeout: bool
+        """
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.max_pending: int = max_pending
+        self.timeout: float | None = timeout
+        self.initializer: Callable[..., None] | None = initializer
+        self.initargs: tuple = initargs
+        self.max_tasks_per_child: int | None = max_tasks_per_child
+        self.kill_on_timeout: bool = kill_on_timeout
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._busy: int = 0
+        self._closed: bool = False
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Worker processes must not inherit the event loop, sockets and pools of the bot process.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer,
+                initargs=self.initargs,
+                max_tasks_per_child=self.max_tasks_per_child,
+            )
+        return self._executor
+
+    @property
+    def load(self) -> float:
+        """
+        Jobs that are running or queued per worker process; above 1 jobs wait for a worker.
+        """
+        return self._busy / self.max_workers
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers + self.max_pending)
+        return self._slots
+
+    async def run(self, func: Callable[..., Any], *args, timeout: float | None = None) -> Any:
+        """
+        Run ``func(*args)`` in a worker process and return its result.
+
+        :param func: Picklable module-level function.
+        :param args: Picklable arguments for ``func``.
+        :param timeout: Seconds to wait for the result, ``self.timeout`` by default.
+        :type timeout: float | None
+        :return: Return value of ``func``.
+        :raises WorkerTimeoutError: If the job does not finish in time.
+        :raises WorkerError: If the engine is shut down or a worker process died.
+        """
+        if self._closed:
+            raise WorkerError("The process pool engine is shut down")
+
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            async with asyncio.timeout(timeout):
+                async with self._get_slots():
+                    executor = self._get_executor()
+                    job = executor.submit(func, *args)
+                    self._busy += 1
+                    try:
+                        return await asyncio.wrap_future(job)
+                    except asyncio.CancelledError:
+                        # Timed out or cancelled by the caller; a job that has not started is just dropped
+                        if not job.cancel() and not job.done() and self.kill_on_timeout:
+                            self._kill_executor(executor)
+                        raise
+                    finally:
+                        self._busy -= 1
+        except TimeoutError:
+            raise WorkerTimeoutError(f"{getattr(func, '__name__', func)} did not finish within {timeout} seconds")
+        except BrokenProcessPool as e:
+            # A crashed worker breaks the whole executor; start a fresh one for the next jobs.
+            self._discard_executor(executor)
+            raise WorkerError(f"Worker process died: {str(e)}")
+
+    def _kill_executor(self, executor: ProcessPoolExecutor) -> None:
+        # ProcessPoolExecutor has no public way to stop a running job, so its processes are killed.
+        processes = list((executor._processes or {}).values())
+        self._discard_executor(executor)
+        for process in processes:
+            process.kill()
+        logger.warning(f"Killed {len(processes)} worker process(es) after a job timed out")
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        if self._executor is executor:
+            self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def shutdown(self) -> None:
+        """
+        Stop accepting jobs, cancel the queued ones and stop the worker processes.
+        """
+        self._closed = True
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)